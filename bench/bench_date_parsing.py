@@ -0,0 +1,85 @@
+# Compares the conversion of Social Club dates to Unix timestamps before and after the date parser was rewritten, on
+# 10,000 generated timestamps which are all different, as the unlock times of a user's achievements are. The "old"
+# column awaits the old coroutine, which treated every date as local time, for every date. The "new" column calls
+# consts.get_unix_epoch_time_from_date, and the "dateutil" column parses each date with dateutil.parser.isoparse.
+#
+# The rows differ in how the dates end: with "Z" (as the unlock times do), with a UTC offset, or without a time zone.
+#
+# The dateutil column needs the python-dateutil package (pip install python-dateutil), which the plugin does not depend
+# on. Without it, that column is left empty.
+#
+# Usage: python bench/bench_date_parsing.py [--count 10000]
+import argparse
+import asyncio
+import datetime
+import random
+
+from bench_utils import best_of, format_time, print_table, use_default_config
+
+use_default_config()
+
+from consts import get_unix_epoch_time_from_date  # noqa: E402
+
+try:
+    from dateutil.parser import isoparse
+except ImportError:
+    isoparse = None
+
+
+async def get_unix_epoch_time_from_date_old(date):
+    # This is the old consts.get_unix_epoch_time_from_date, which treated every date as local time.
+    year = int(date[0:4])
+    month = int(date[5:7])
+    day = int(date[8:10])
+    hour = int(date[11:13])
+    minute = int(date[14:16])
+    second = int(date[17:19])
+    return int(datetime.datetime(year, month, day, hour, minute, second).timestamp())
+
+
+def generate_dates(count, zone, seed=0):
+    # The dates have the form that the Social Club uses for unlock times, with milliseconds.
+    rng = random.Random(seed)
+    start = datetime.datetime(2013, 9, 17, tzinfo=datetime.timezone.utc)
+    return [(start + datetime.timedelta(seconds=rng.randrange(10 ** 9))).strftime("%Y-%m-%dT%H:%M:%S.")
+            + f"{rng.randrange(1000):03d}{zone}" for _ in range(count)]
+
+
+def convert_old(dates):
+    async def convert():
+        return [await get_unix_epoch_time_from_date_old(date) for date in dates]
+
+    return asyncio.run(convert())
+
+
+def convert_new(dates):
+    return [get_unix_epoch_time_from_date(date) for date in dates]
+
+
+def convert_dateutil(dates):
+    return [int(isoparse(date).timestamp()) for date in dates]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Social Club date conversion.")
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+    if isoparse is None:
+        print("python-dateutil is not installed, so dateutil will not be measured.")
+    rows = []
+    for name, zone in (("Z", "Z"), ("+02:00", "+02:00"), ("no time zone", "")):
+        dates = generate_dates(args.count, zone)
+        if isoparse is not None:
+            # Both parsers must agree on every date, including the ones in local time.
+            assert convert_new(dates) == convert_dateutil(dates)
+        old_time = best_of(lambda: convert_old(dates))
+        new_time = best_of(lambda: convert_new(dates))
+        dateutil_column = format_time(best_of(lambda: convert_dateutil(dates))) if isoparse is not None else "-"
+        rows.append([name, format_time(old_time), format_time(new_time), dateutil_column,
+                     f"{old_time / new_time:.1f}x"])
+    print(f"Time to convert {args.count} dates:")
+    print_table(["dates end with", "old", "new", "dateutil", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
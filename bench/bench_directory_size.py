@@ -0,0 +1,83 @@
+# Compares the parallel os.scandir() walk that calculates the size of an install folder against a plain os.walk() walk,
+# on a generated directory tree with hundreds of thousands of files. The files are created as sparse files, so the tree
+# takes up almost no disk space, even though its reported size is over 100 GB like a real game install.
+#
+# The "cold" rows walk the whole tree, as happens for a folder that has never been walked before. The "warm" row walks
+# it again with the size index from the previous walk, which only lists the directories which have changed.
+#
+# Usage: python bench/bench_directory_size.py [--files 200000] [--dir DIRECTORY]
+import argparse
+import os
+import random
+import tempfile
+
+from bench_utils import best_of, format_time, print_table
+
+from directory_size import DirectorySizeIndex
+
+FILES_PER_DIRECTORY = 100
+SUBDIRECTORIES_PER_DIRECTORY = 20
+
+
+def generate_tree(root, file_count, seed=0):
+    # Builds a two-level tree of directories with FILES_PER_DIRECTORY files each, along with a link back to the root,
+    # which every walk must skip. Returns the total size of the files.
+    rng = random.Random(seed)
+    total_size = 0
+    directory_count = max(1, file_count // FILES_PER_DIRECTORY)
+    for i in range(directory_count):
+        directory = os.path.join(root, f"pack{i // SUBDIRECTORIES_PER_DIRECTORY}",
+                                 f"dlc{i % SUBDIRECTORIES_PER_DIRECTORY}")
+        os.makedirs(directory, exist_ok=True)
+        for j in range(FILES_PER_DIRECTORY):
+            size = rng.randrange(1 << 21)
+            with open(os.path.join(directory, f"asset{j}.rpf"), "wb") as f:
+                f.truncate(size)
+            total_size += size
+    try:
+        os.symlink(root, os.path.join(root, "pack0", "loop"), target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pass
+    return total_size
+
+
+def walk_size(path):
+    # The simplest in-process replacement for "dir /s": os.walk() plus a stat() call for every file.
+    total_size = 0
+    for directory, _, file_names in os.walk(path):
+        for file_name in file_names:
+            file_path = os.path.join(directory, file_name)
+            if not os.path.islink(file_path):
+                total_size += os.lstat(file_path).st_size
+    return total_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the install folder size calculation.")
+    parser.add_argument("--files", type=int, default=200000)
+    parser.add_argument("--dir", default=None, help="where to create the directory tree")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory(dir=args.dir) as root:
+        print(f"Generating {args.files} files...")
+        expected_size = generate_tree(root, args.files)
+        cases = [("os.walk", lambda: walk_size(root))]
+        for workers in (1, 4, 8, 16):
+            # An index which has expired immediately walks the whole tree every time.
+            cases.append((f"scandir, {workers} worker(s), cold",
+                          lambda workers=workers: DirectorySizeIndex(max_age=0).get_size(root, workers)))
+        warm_index = DirectorySizeIndex(max_age=3600)
+        warm_index.get_size(root, 8)
+        cases.append(("scandir, 8 workers, warm", lambda: warm_index.get_size(root, 8)))
+        rows = []
+        baseline_time = None
+        for name, func in cases:
+            assert func() == expected_size
+            elapsed = best_of(func, repeat=3)
+            baseline_time = baseline_time or elapsed
+            rows.append([name, format_time(elapsed), f"{baseline_time / elapsed:.1f}x"])
+    print(f"{args.files} files, {expected_size / 1024 ** 3:.0f} GB:")
+    print_table(["walk", "time", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Compares the registry work of finding every game's install location before and after the install locations were
+# cached. The old lookup opened the game's subkey of the Uninstall key every time a game's path was needed, which is
+# once per game in every status pass. InstallLocationCache reads all of the install locations in one pass over the
+# Uninstall key and only reads them again after the registry has changed.
+#
+# The passes run against a DictUninstallRegistry holding SUBKEY_COUNT made-up programs along with the games, and the
+# registry changes (as if a program had been installed) every CHANGE_EVERY passes. The table counts the subkeys opened
+# by each approach, which is what costs time in the real registry. A dictionary lookup costs next to nothing, so the
+# passes are not timed against it. On Windows, one pass of each approach is also timed against the real Uninstall key.
+#
+# Usage: python bench/bench_install_registry.py
+import sys
+
+from bench_utils import best_of, format_time, print_table, use_default_config
+
+use_default_config()
+
+from consts import INSTALL_LOCATION_CACHE_TTL, WINDOWS_UNINSTALL_KEY  # noqa: E402
+from game_cache import games_cache  # noqa: E402
+from install_registry import DictUninstallRegistry, InstallLocationCache  # noqa: E402
+
+SUBKEY_COUNT = 300
+PASSES = [1, 10, 100, 1000]
+CHANGE_EVERY = 50
+
+SUBKEY_NAMES_BY_TITLE_ID = {title_id: game["guid"] for title_id, game in games_cache.items()}
+
+
+class CountingUninstallRegistry(DictUninstallRegistry):
+    def __init__(self, subkeys):
+        super().__init__(subkeys)
+        self.keys_opened = 0
+
+    def open_subkey(self, subkey_name):
+        # This stands in for the old winreg.OpenKey() call on a single game's subkey.
+        self.keys_opened += 1
+        return self.subkeys.get(subkey_name, {}).get("InstallLocation")
+
+    def get_install_locations(self, subkey_names):
+        install_locations = super().get_install_locations(subkey_names)
+        # The Uninstall key is opened and enumerated once, and only the subkeys of the games are opened. The enumeration
+        # still calls EnumKey once for each subkey, which is not counted here.
+        self.keys_opened += 1 + len(install_locations)
+        return install_locations
+
+
+def create_registry():
+    subkeys = {f"{{PROGRAM-{i:04d}}}": {"InstallLocation": f"C:\\Program Files\\Program {i}"}
+               for i in range(SUBKEY_COUNT)}
+    for title_id, subkey_name in SUBKEY_NAMES_BY_TITLE_ID.items():
+        subkeys[subkey_name] = {"InstallLocation": f"C:\\Games\\{title_id}"}
+    return CountingUninstallRegistry(subkeys)
+
+
+def run_passes_old(registry, passes):
+    for i in range(passes):
+        for subkey_name in SUBKEY_NAMES_BY_TITLE_ID.values():
+            registry.open_subkey(subkey_name)
+        if i % CHANGE_EVERY == CHANGE_EVERY - 1:
+            registry.changed = True
+
+
+def run_passes_cached(registry, passes):
+    cache = InstallLocationCache(registry, SUBKEY_NAMES_BY_TITLE_ID, INSTALL_LOCATION_CACHE_TTL)
+    for i in range(passes):
+        for title_id in SUBKEY_NAMES_BY_TITLE_ID:
+            cache.get(title_id)
+        if i % CHANGE_EVERY == CHANGE_EVERY - 1:
+            registry.changed = True
+
+
+def count_keys_opened(run_passes, passes):
+    registry = create_registry()
+    run_passes(registry, passes)
+    return registry.keys_opened
+
+
+def time_windows_registry():
+    import winreg
+    from install_registry import WindowsUninstallRegistry
+
+    root = winreg.ConnectRegistry(None, winreg.HKEY_LOCAL_MACHINE)
+
+    def old_pass():
+        for subkey_name in SUBKEY_NAMES_BY_TITLE_ID.values():
+            try:
+                with winreg.OpenKey(root, WINDOWS_UNINSTALL_KEY + subkey_name) as key:
+                    winreg.QueryValueEx(key, "InstallLocation")
+            except OSError:
+                pass
+
+    def first_read():
+        first_read_cache = InstallLocationCache(WindowsUninstallRegistry(root, WINDOWS_UNINSTALL_KEY),
+                                                SUBKEY_NAMES_BY_TITLE_ID, INSTALL_LOCATION_CACHE_TTL)
+        first_read_cache.get("gta5")
+        first_read_cache.close()
+
+    cache = InstallLocationCache(WindowsUninstallRegistry(root, WINDOWS_UNINSTALL_KEY), SUBKEY_NAMES_BY_TITLE_ID,
+                                 INSTALL_LOCATION_CACHE_TTL)
+
+    def cached_pass():
+        for title_id in SUBKEY_NAMES_BY_TITLE_ID:
+            cache.get(title_id)
+
+    old_time = best_of(old_pass, number=10)
+    first_read_time = best_of(first_read)
+    cached_time = best_of(cached_pass, number=10)
+    cache.close()
+    winreg.CloseKey(root)
+    print("Time per status pass against the real Uninstall key:")
+    print_table(["old", "cached, first read", "cached", "speedup"],
+                [[format_time(old_time), format_time(first_read_time), format_time(cached_time),
+                  f"{old_time / cached_time:.1f}x"]])
+
+
+def main():
+    rows = []
+    for passes in PASSES:
+        old_keys = count_keys_opened(run_passes_old, passes)
+        cached_keys = count_keys_opened(run_passes_cached, passes)
+        rows.append([passes, old_keys, cached_keys, f"{old_keys / cached_keys:.1f}x"])
+    print(f"Subkeys opened ({len(SUBKEY_NAMES_BY_TITLE_ID)} games, {SUBKEY_COUNT} other programs, a change every "
+          f"{CHANGE_EVERY} passes):")
+    print_table(["status passes", "old", "cached", "reduction"], rows)
+    if sys.platform == "win32":
+        print()
+        time_windows_registry()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Compares the byte-level launcher log parser against the old parser, which read the log backwards line by line with
+# FileReadBackwards and decoded every line, on synthetic logs from 1 MB to 500 MB (see generate_launcher_log.py).
+#
+# "start" logs have their only branch reports at the beginning of the log, which forces both parsers to read the whole
+# file. "end" logs have them at the end, which is the best case for the old parser, since it stopped reading once every
+# title had been reported. The "cold" column parses a log that has never been seen before, while the "append" column
+# parses it again after one more line has been written to it, which only reads the new line.
+#
+# The old parser needs the file_read_backwards package (pip install file_read_backwards==2.0.0), which the plugin no
+# longer depends on. Without it, only the new parser is measured.
+#
+# Usage: python bench/bench_launcher_log.py [--sizes 1 10 100 500] [--dir DIRECTORY]
+import argparse
+import os
+import tempfile
+
+from bench_utils import best_of, format_time, print_table, use_default_config
+
+use_default_config()
+
+from game_cache import games_cache, ignore_game_title_ids_list  # noqa: E402
+from generate_launcher_log import generate  # noqa: E402
+from launcher_log import LauncherLogTailer  # noqa: E402
+
+try:
+    from file_read_backwards import FileReadBackwards
+except ImportError:
+    FileReadBackwards = None
+
+TOTAL_GAMES_COUNT = len(games_cache) + len(ignore_game_title_ids_list) - 1
+
+
+def parse_log_file_old(log_file):
+    # This is the loop from the old RockstarPlugin.parse_log_file, returning the newest report for each title instead of
+    # applying it to the list of owned games.
+    reports = {}
+    checked_games_count = 0
+    with FileReadBackwards(log_file, encoding="utf-8") as frb:
+        while checked_games_count < TOTAL_GAMES_COUNT:
+            line = frb.readline()
+            if not line:
+                break
+            if ("launcher" not in line) and ("on branch " in line):
+                end_index = line[65:].index(':') + 65
+                reports.setdefault(line[65:end_index].strip(), True)
+                checked_games_count += 1
+            elif "no branches!" in line:
+                end_index = line[65:].index(':') + 65
+                reports.setdefault(line[65:end_index].strip(), False)
+                checked_games_count += 1
+    return reports
+
+
+def parse_log_file_new(log_file):
+    _, reports = LauncherLogTailer().get_reports(log_file)
+    return {title_id: is_owned for title_id, (is_owned, _) in reports.items()}
+
+
+def parse_appended_line(log_file):
+    # The tailer has already parsed the log, so only the appended line is read.
+    tailer = LauncherLogTailer()
+    tailer.get_reports(log_file)
+    with open(log_file, "ab") as f:
+        f.write(b"[00:00:00.000] [DISPLAY] [    1] [Launcher]".ljust(65) + b"Remote branch list refreshed.\n")
+    return best_of(lambda: tailer.get_reports(log_file), repeat=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the launcher log parsers.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 10, 100, 500], help="log sizes in MB")
+    parser.add_argument("--dir", default=None, help="where to write the generated logs")
+    args = parser.parse_args()
+    if FileReadBackwards is None:
+        print("file_read_backwards is not installed, so the old parser will not be measured.")
+    rows = []
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for size_mb in args.sizes:
+            for placement in ("start", "end"):
+                path = os.path.join(directory, f"launcher_{size_mb:g}mb_{placement}.log")
+                size, _ = generate(path, int(size_mb * 1024 * 1024), placement)
+                repeat = 3 if size_mb <= 10 else 1
+                new_reports = parse_log_file_new(path)
+                new_time = best_of(lambda: parse_log_file_new(path), repeat=repeat)
+                if FileReadBackwards is not None:
+                    old_reports = parse_log_file_old(path)
+                    # Both parsers must make the same ownership decisions for every title that the old parser saw.
+                    assert all(new_reports[title_id] == is_owned for title_id, is_owned in old_reports.items())
+                    old_time = best_of(lambda: parse_log_file_old(path), repeat=repeat)
+                    old_column, speedup = format_time(old_time), f"{old_time / new_time:.1f}x"
+                else:
+                    old_column, speedup = "-", "-"
+                append_time = parse_appended_line(path)
+                rows.append([f"{size_mb:g} MB", placement, old_column, format_time(new_time),
+                             f"{size / new_time / 1024 / 1024:.0f} MB/s", speedup, format_time(append_time)])
+                os.remove(path)
+    print_table(["log size", "reports", "old", "cold", "cold throughput", "speedup", "append"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Compares the cost of one game status pass when the process table is read once per tracked game (as the plugin used
+# to do) against reading it once per pass and sharing the snapshot between all of the games (as it does now).
+#
+# The "fake table" columns read a fake process table of PROCESS_COUNT processes through a ProcessQueryBackend, so that
+# only the number of enumerations differs between them. The "subprocess" column starts the platform's process listing
+# command once per tracked game, which is what the old tasklist lookup cost on Windows, and the "real snapshot" column
+# reads the real process table once through the plugin's backend for this platform.
+#
+# Usage: python bench/bench_process_snapshot.py
+import random
+import subprocess
+import sys
+
+from bench_utils import best_of, format_time, print_table
+
+from process_query import ProcessQueryBackend, ProcessSnapshot, take_process_snapshot
+
+PROCESS_COUNT = 400
+TRACKED_GAME_COUNTS = [1, 5, 10, 25, 50]
+
+
+class FakeProcessQueryBackend(ProcessQueryBackend):
+    # Lists a fixed, made-up process table. Each listing builds a new dictionary, just as a real backend has to read
+    # every process again.
+    def __init__(self, process_count):
+        rng = random.Random(process_count)
+        self._table = [(pid, f"Process{rng.randrange(1000)}.EXE")
+                       for pid in rng.sample(range(4, 100000), process_count)]
+
+    def list_processes(self):
+        return {pid: image_name.lower() for pid, image_name in self._table}
+
+    def sample_pids(self, count):
+        return [pid for pid, _ in random.Random(count).sample(self._table, count)]
+
+
+def list_processes_with_subprocess():
+    if sys.platform == "win32":
+        command = 'chcp 65001 & tasklist /FI "IMAGENAME eq PlayGTAV.exe " /FI "STATUS eq running" /FO LIST'
+    else:
+        command = "ps -A -o pid=,comm="
+    subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+
+
+def pass_per_game(backend, pids):
+    # The old pass: every tracked game read the process table again.
+    return [pid in ProcessSnapshot(backend.list_processes()) for pid in pids]
+
+
+def pass_shared_snapshot(backend, pids):
+    snapshot = take_process_snapshot(backend)
+    return [pid in snapshot for pid in pids]
+
+
+def main():
+    backend = FakeProcessQueryBackend(PROCESS_COUNT)
+    subprocess_time = best_of(list_processes_with_subprocess, repeat=3)
+    real_snapshot_time = best_of(take_process_snapshot, repeat=3)
+    real_process_count = len(take_process_snapshot())
+    rows = []
+    for game_count in TRACKED_GAME_COUNTS:
+        pids = backend.sample_pids(game_count)
+        assert pass_per_game(backend, pids) == pass_shared_snapshot(backend, pids)
+        per_game_time = best_of(lambda: pass_per_game(backend, pids), number=10)
+        shared_time = best_of(lambda: pass_shared_snapshot(backend, pids), number=10)
+        rows.append([game_count, format_time(per_game_time), format_time(shared_time),
+                     f"{per_game_time / shared_time:.1f}x", format_time(subprocess_time * game_count),
+                     format_time(real_snapshot_time)])
+    print(f"Time per status pass ({PROCESS_COUNT} fake processes, {real_process_count} real processes):")
+    print_table(["tracked games", "fake table per game", "fake table per pass", "speedup", "subprocess per game",
+                 "real snapshot per pass"], rows)
+
+
+if __name__ == "__main__":
+    main()
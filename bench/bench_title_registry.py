@@ -0,0 +1,96 @@
+# Compares the cost of the game_cache lookup helpers before and after the title registry was added, as the number of
+# titles in the catalog grows. The "linear" column uses the old implementation, which walked the whole games cache on
+# every call, and the "registry" column uses TitleRegistry.
+#
+# Usage: python bench/bench_title_registry.py
+import random
+
+from bench_utils import best_of, format_time, print_table
+
+from game_cache import TitleRegistry, games_cache
+
+CATALOG_SIZES = [len(games_cache), 100, 1000, 10000]
+LOOKUPS = 1000
+
+
+def make_catalog(size):
+    # The real titles come first, followed by made-up titles with identifiers that do not collide with them.
+    catalog = dict(games_cache)
+    for i in range(size - len(catalog)):
+        catalog[f"title{i}"] = {
+            "rosTitleId": 1000 + i,
+            "onlineTitleId": 100000 + i,
+            "googleTagId": f"TITLE{i}_PC",
+            "achievementId": f"title{i}"
+        }
+    return catalog
+
+
+def linear_by_ros_title_id(catalog, ros_title_id):
+    for game, d in catalog.items():
+        if d["rosTitleId"] == int(ros_title_id):
+            return game
+    return None
+
+
+def linear_by_online_title_id(catalog, online_title_id):
+    # The old implementation used d["onlineTitleId"], which raised a KeyError for the titles without an online title ID.
+    for game, d in catalog.items():
+        if d.get("onlineTitleId") == int(online_title_id):
+            return game
+    return None
+
+
+def linear_by_google_tag_id(catalog, google_tag_id):
+    for game, d in catalog.items():
+        if 'googleTagId' in d and d['googleTagId'] == google_tag_id:
+            return game
+    return None
+
+
+def linear_by_ugc_title_id(catalog, ugc_id):
+    for game, d in catalog.items():
+        if 'googleTagId' in d and d['googleTagId'].lower() == ugc_id.lower():
+            return game
+    return None
+
+
+def linear_achievement_id_by_ros_title_id(catalog, ros_title_id):
+    for game, d in catalog.items():
+        if d["rosTitleId"] == int(ros_title_id):
+            return catalog[game]["achievementId"]
+    return None
+
+
+def main():
+    rows = []
+    for size in CATALOG_SIZES:
+        catalog = make_catalog(size)
+        registry = TitleRegistry(catalog)
+        # The lookups are spread over the whole catalog, as they are when every owned game or friend is looked up.
+        entries = random.Random(size).choices(list(catalog.values()), k=LOOKUPS)
+        ros_ids = [str(d["rosTitleId"]) for d in entries]
+        online_ids = [d["onlineTitleId"] for d in entries if d.get("onlineTitleId") is not None]
+        tag_ids = [d["googleTagId"] for d in entries if d.get("googleTagId")]
+        ugc_ids = [tag_id.upper() for tag_id in tag_ids]
+        cases = [
+            ("ros", ros_ids, linear_by_ros_title_id, registry.by_ros_title_id),
+            ("online", online_ids, linear_by_online_title_id, registry.by_online_title_id),
+            ("google tag", tag_ids, linear_by_google_tag_id, registry.by_google_tag_id),
+            ("ugc", ugc_ids, linear_by_ugc_title_id, registry.by_ugc_title_id),
+            ("achievement", ros_ids, linear_achievement_id_by_ros_title_id, registry.achievement_id_by_ros_title_id)
+        ]
+        build_time = best_of(lambda: TitleRegistry(catalog))
+        for name, keys, linear, indexed in cases:
+            for key in keys:
+                assert linear(catalog, key) == indexed(key)
+            linear_time = best_of(lambda: [linear(catalog, key) for key in keys]) / len(keys)
+            indexed_time = best_of(lambda: [indexed(key) for key in keys]) / len(keys)
+            rows.append([size, name, format_time(linear_time), format_time(indexed_time),
+                         f"{linear_time / indexed_time:.1f}x", format_time(build_time)])
+    print(f"Time per lookup ({LOOKUPS} lookups per case):")
+    print_table(["titles", "lookup", "linear", "registry", "speedup", "registry build"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Shared setup for the benchmark scripts in this folder. Each script is run on its own from the root of the repository
+# (for example, "python bench/bench_title_registry.py"), and imports the plugin's modules from the src folder.
+import os
+import sys
+import timeit
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_PATH)
+
+
+def use_default_config():
+    # consts.py reads config.cfg as soon as it is imported. galaxyutils looks for that file in the folder that it is
+    # installed in, which is only the plugin's folder in a built plugin, so the default config is read instead.
+    from galaxyutils import config_parser
+    config_parser.CONFIG_PATH = os.path.join(SRC_PATH, "default_config.cfg")
+
+
+def best_of(func, number=1, repeat=5):
+    # Returns the fastest time (in seconds) that a single call to func took, which is the least affected by noise from
+    # the rest of the system.
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    for row in [headers, ["-" * width for width in widths]] + rows:
+        print("  ".join(str(value).rjust(width) for value, width in zip(row, widths)))
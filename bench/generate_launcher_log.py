@@ -0,0 +1,105 @@
+# Generates a synthetic Rockstar Games Launcher log for the launcher log benchmark. The log is mostly made up of noise
+# lines (some of which mention branches), with a branch report for every title in the games cache written each time the
+# launcher "starts". The reports can be placed at the start of the log (the worst case for a parser that reads the log
+# backwards), at its end, or spread throughout it. Lines with invalid UTF-8 can be added as well, although the old
+# parser cannot get past them.
+#
+# Usage: python bench/generate_launcher_log.py OUTPUT_PATH SIZE_IN_MB [--placement start|end|spread] [--invalid-utf8]
+#        [--seed N]
+import argparse
+import random
+
+from bench_utils import SRC_PATH  # noqa: F401 (This puts the src folder on the import path.)
+
+from game_cache import games_cache, ignore_game_title_ids_list
+
+# Each branch report starts its title ID at character 65 of the line, like the launcher's own reports do.
+PREFIX_WIDTH = 65
+
+NOISE_MESSAGES = [
+    b"Checking for updates to the branch manifest...",
+    b"Downloading https://gamedownloads-rockstargames-com.akamaized.net/public/title_metadata.json",
+    b"Signed in as user ***.",
+    b"Sending telemetry batch (14 events).",
+    b"Remote branch list refreshed.",
+    b"Cloud save sync finished with 0 conflicts.",
+    b"Title list changed; 2 titles have pending branch updates.",
+]
+
+INVALID_UTF8_MESSAGE = b"Unhandled message in state 3: \xff\xfe\xfd"
+
+
+def line_prefix(rng, timestamp):
+    hours, minutes, seconds = timestamp // 3600 % 24, timestamp // 60 % 60, timestamp % 60
+    prefix = (f"[{hours:02d}:{minutes:02d}:{seconds:02d}.{rng.randrange(1000):03d}] [DISPLAY] "
+              f"[{rng.randrange(1 << 16):5d}] [Launcher] ").encode("ascii")
+    return prefix.ljust(PREFIX_WIDTH, b" ")
+
+
+def branch_report_block(rng, timestamp):
+    # One report per title, in the same form as the launcher's reports. The launcher reports on itself as well, which
+    # must not be counted as an owned game.
+    title_ids = [title_id for title_id in games_cache if title_id != "launcher"] + ignore_game_title_ids_list
+    lines = [line_prefix(rng, timestamp) + b"launcher: on branch prod\n"]
+    for title_id in title_ids:
+        if rng.random() < 0.5:
+            status = b"on branch " + rng.choice([b"prod", b"beta", b"prod_steam"])
+        else:
+            status = b"no branches!"
+        lines.append(line_prefix(rng, timestamp) + title_id.encode("ascii") + b": " + status + b"\n")
+    return b"".join(lines)
+
+
+def generate(path, size, placement="start", invalid_utf8=False, seed=0):
+    rng = random.Random(seed)
+    messages = NOISE_MESSAGES + [INVALID_UTF8_MESSAGE] if invalid_utf8 else NOISE_MESSAGES
+    timestamp = 0
+    written = 0
+    blocks = 0
+    with open(path, "wb") as f:
+        if placement == "start":
+            block = branch_report_block(rng, timestamp)
+            f.write(block)
+            written += len(block)
+            blocks += 1
+        next_block = size // 8 if placement == "spread" else None
+        end_reserve = len(branch_report_block(random.Random(seed), 0)) if placement == "end" else 0
+        chunk = []
+        while written < size - end_reserve:
+            timestamp += rng.randrange(3)
+            line = line_prefix(rng, timestamp) + rng.choice(messages) + b"\n"
+            chunk.append(line)
+            written += len(line)
+            if next_block is not None and written >= next_block:
+                block = branch_report_block(rng, timestamp)
+                chunk.append(block)
+                written += len(block)
+                blocks += 1
+                next_block += size // 8
+            if len(chunk) >= 10000:
+                f.write(b"".join(chunk))
+                chunk.clear()
+        f.write(b"".join(chunk))
+        if placement == "end":
+            block = branch_report_block(rng, timestamp)
+            f.write(block)
+            written += len(block)
+            blocks += 1
+    return written, blocks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Rockstar Games Launcher log.")
+    parser.add_argument("path")
+    parser.add_argument("size_mb", type=float)
+    parser.add_argument("--placement", choices=["start", "end", "spread"], default="start")
+    parser.add_argument("--invalid-utf8", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    written, blocks = generate(args.path, int(args.size_mb * 1024 * 1024), args.placement, args.invalid_utf8,
+                               args.seed)
+    print(f"Wrote {written} bytes with {blocks} block(s) of branch reports to {args.path}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from galaxy.api.types import Achievement
+
+from compact_state import dumps_state, loads_state
+
+import logging as log
+
+from time import time
+from typing import Dict, List, Optional, Tuple
+
+ACHIEVEMENTS_CACHE_VERSION = 2
+
+
+class AchievementsCache:
+    # Holds the unlocked achievements of each of the user's games between sessions. Each entry maps the IDs of the
+    # unlocked achievements to their unlock times, along with the time at which the entry was last fetched from the
+    # Social Club. Entries are keyed by both the user's Rockstar ID and the title ID, so that the achievements of one
+    # account are never shown for another. Entries which were fetched less than max_age seconds ago are used without
+    # contacting the Social Club, and older entries are still used if the Social Club cannot be reached.
+    def __init__(self, max_age: float):
+        self._max_age = max_age
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict[str, int]]] = {}
+        self.changed = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _to_achievements(unlocks: Dict[str, int]) -> List[Achievement]:
+        return [Achievement(unlock_time, achievement_id=achievement_id) for achievement_id, unlock_time in
+                unlocks.items()]
+
+    def get_fresh(self, rockstar_id: str, title_id: str) -> Optional[List[Achievement]]:
+        entry = self._entries.get((rockstar_id, title_id))
+        if entry is None or entry[0] + self._max_age <= time():
+            return None
+        return self._to_achievements(entry[1])
+
+    def get(self, rockstar_id: str, title_id: str) -> Optional[List[Achievement]]:
+        entry = self._entries.get((rockstar_id, title_id))
+        return self._to_achievements(entry[1]) if entry is not None else None
+
+    def merge(self, rockstar_id: str, title_id: str, unlocks: Dict[str, int]) -> List[Achievement]:
+        # Achievements cannot be locked again once they have been unlocked, so only the newly unlocked achievements
+        # need to be added to the entry.
+        key = (rockstar_id, title_id)
+        _, cached_unlocks = self._entries.get(key, (0, {}))
+        new_unlocks = {achievement_id: unlock_time for achievement_id, unlock_time in unlocks.items()
+                       if achievement_id not in cached_unlocks}
+        if new_unlocks or key not in self._entries:
+            log.debug(f"ROCKSTAR_ACHIEVEMENTS_CACHE: Adding {len(new_unlocks)} newly unlocked achievement(s) for "
+                      f"{title_id}.")
+            cached_unlocks = {**cached_unlocks, **new_unlocks}
+        # The fetch time is saved even if nothing was unlocked, so that the next session can skip the request.
+        self._entries[key] = (time(), cached_unlocks)
+        self.changed = True
+        return self._to_achievements(cached_unlocks)
+
+    def get_state(self) -> str:
+        # Each entry is saved as [Rockstar ID, title ID, fetch time, {achievement ID: unlock time}], in the compact form
+        # from compact_state.py.
+        self.changed = False
+        return dumps_state([ACHIEVEMENTS_CACHE_VERSION, [[rockstar_id, title_id, fetched_at, unlocks]
+                                                         for (rockstar_id, title_id), (fetched_at, unlocks)
+                                                         in self._entries.items()]])
+
+    def set_state(self, saved_state: str):
+        try:
+            version, entries = loads_state(saved_state)
+        except (ValueError, TypeError):
+            # Older versions of the plugin saved the cache as a hex-encoded pickle.
+            version, entries = None, []
+        if version != ACHIEVEMENTS_CACHE_VERSION:
+            log.debug("ROCKSTAR_ACHIEVEMENTS_CACHE_OUTDATED: The saved achievements cache is from an older version of "
+                      "the plugin. The achievements will be imported from the Social Club again.")
+            return
+        self._entries = {(rockstar_id, title_id): (fetched_at, unlocks)
+                         for rockstar_id, title_id, fetched_at, unlocks in entries}
@@ -0,0 +1,20 @@
+import base64
+import json
+import zlib
+
+from typing import Any
+
+
+# The whole persistent cache is sent to Galaxy whenever it is pushed, so the larger states are stored as compressed JSON
+# instead of as hex-encoded pickles, which take up more than twice as much space as the data that they hold.
+def dumps_state(state: Any) -> str:
+    return base64.b64encode(zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))).decode("ascii")
+
+
+def loads_state(saved_state: str) -> Any:
+    # Raises a ValueError if the state was not saved by dumps_state() (for example, if it was saved as a hex-encoded
+    # pickle by an older version of the plugin) or has been corrupted.
+    try:
+        return json.loads(zlib.decompress(base64.b64decode(saved_state)))
+    except (TypeError, zlib.error) as e:
+        raise ValueError(f"Unreadable saved state: {repr(e)}") from e
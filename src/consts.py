@@ -10,14 +10,13 @@ class NoLogFoundException(Exception):
     pass
 
 
-class NoGamesInLogException(Exception):
-    pass
-
-
 ARE_ACHIEVEMENTS_IMPLEMENTED = True
 
 CONFIG_OPTIONS = get_config_options([
     Option(option_name='user_presence_mode', default_value=0, allowed_values=[i for i in range(0, 4)]),
+    Option(option_name='friends_request_concurrency', default_value=4, allowed_values=[i for i in range(1, 11)]),
+    Option(option_name='presence_request_concurrency', default_value=4, allowed_values=[i for i in range(1, 11)]),
+    Option(option_name='achievements_request_concurrency', default_value=4, allowed_values=[i for i in range(1, 11)]),
     Option(option_name='log_sensitive_data'),
     Option(option_name='debug_always_refresh'),
     Option(option_name='rockstar_launcher_path_override', str_option=True, default_value=None)
@@ -25,6 +24,22 @@ CONFIG_OPTIONS = get_config_options([
 
 LOG_SENSITIVE_DATA = CONFIG_OPTIONS['log_sensitive_data']
 
+# These are the number of seconds for which a friend's presence is considered to be up to date, for each value of the
+# user_presence_mode setting. A friend's last played game rarely changes, but their online character stats can change
+# within a single play session.
+PRESENCE_CACHE_TTL = {
+    0: 0,
+    1: 3600 * 3,
+    2: 60 * 5,
+    3: 60 * 5
+}
+
+PRESENCE_CACHE_MAX_SIZE = 2000
+
+# The achievements of a game are read from the achievements cache (which is kept between sessions) instead of the Social
+# Club for this many seconds after they were last fetched.
+ACHIEVEMENTS_CACHE_MAX_AGE = 60 * 30
+
 MANIFEST_URL = r"https://gamedownloads-rockstargames-com.akamaized.net/public/title_metadata.json"
 
 IS_WINDOWS = (sys.platform == 'win32')
@@ -35,6 +50,78 @@ ROCKSTAR_LAUNCHER_EXE = "Launcher.exe"  # It's a terribly generic name for a lau
 USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/84.0.4147.105 "
               "Safari/537.36")
 
+# A __RequestVerificationToken scraped from the Social Club is reused for this many seconds. A new token is fetched in
+# the background once the current token is within REQUEST_VERIFICATION_TOKEN_REFRESH_MARGIN seconds of expiring.
+REQUEST_VERIFICATION_TOKEN_TTL = 60 * 20
+REQUEST_VERIFICATION_TOKEN_REFRESH_MARGIN = 60 * 2
+
+# Every request made to Rockstar's websites is sent through a token bucket for its host. The values for each host are
+# (refill rate in requests per second, bucket capacity, minimum refill rate, default Retry-After in seconds). The
+# refill rate is lowered automatically whenever a host responds with 429 Too Many Requests.
+RATE_LIMITS = {
+    "scapi.rockstargames.com": (5, 10, 0.5, 5),
+    "socialclub.rockstargames.com": (2, 5, 0.2, 5),
+    "signin.rockstargames.com": (1, 3, 0.1, 5),
+    "graph.rockstargames.com": (2, 5, 0.2, 5)
+}
+DEFAULT_RATE_LIMIT = (2, 5, 0.2, 5)
+RATE_LIMIT_MAX_RETRIES = 5
+
+# Failed requests to the Social Club are attempted at most RETRY_MAX_ATTEMPTS times, waiting up to RETRY_BASE_DELAY *
+# 2^(attempt - 1) seconds (but no more than RETRY_MAX_DELAY seconds) between attempts. Once
+# CIRCUIT_BREAKER_FAILURE_THRESHOLD requests to a host have failed in a row, requests to that host fail immediately for
+# CIRCUIT_BREAKER_RESET_TIMEOUT seconds.
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 30
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+
+# The maximum total size, in bytes, of the Social Club API responses which are kept for conditional requests.
+RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# The plugin's background jobs are run by a scheduler (see scheduler.py). Each job runs every *_INTERVAL seconds, plus
+# up to *_JITTER seconds. While a job finds nothing to do, or after it fails, its interval is raised up to
+# *_MAX_INTERVAL seconds. While a game is running or being launched, jobs with an *_ACTIVE_INTERVAL run at that interval
+# instead. At most SCHEDULER_MAX_CONCURRENT_JOBS jobs which use the network run at once; the local jobs are not limited.
+SCHEDULER_MAX_CONCURRENT_JOBS = 2
+ONLINE_GAMES_CHECK_INTERVAL = 60 * 5
+ONLINE_GAMES_CHECK_MAX_INTERVAL = 60 * 15
+ONLINE_GAMES_CHECK_JITTER = 30
+GAME_STATUS_CHECK_INTERVAL = 5
+GAME_STATUS_CHECK_MAX_INTERVAL = 15
+GAME_STATUS_CHECK_ACTIVE_INTERVAL = 2
+GAME_STATUS_CHECK_JITTER = 0.5
+
+# The launcher log directory is checked for changes every LOG_WATCH_INTERVAL seconds (up to LOG_WATCH_MAX_INTERVAL
+# seconds while nothing changes). Once a change is seen, the logs are read after LOG_WATCH_DEBOUNCE seconds pass without
+# another change, or after LOG_WATCH_MAX_DELAY seconds if the launcher keeps writing to its log.
+LOG_WATCH_INTERVAL = 5
+LOG_WATCH_MAX_INTERVAL = 20
+LOG_WATCH_JITTER = 1
+LOG_WATCH_DEBOUNCE = 3
+LOG_WATCH_MAX_DELAY = 60
+
+# While a game is running, the time played in it is written to the game time journal every GAME_TIME_CHECKPOINT_INTERVAL
+# seconds. Once the journal holds GAME_TIME_JOURNAL_MAX_RECORDS sessions, it is compacted into the game time snapshot.
+GAME_TIME_CHECKPOINT_INTERVAL = 60 * 5
+GAME_TIME_JOURNAL_MAX_RECORDS = 200
+
+# Running games are watched so that the plugin is notified as soon as they exit. As a fallback, the process table is
+# still checked for these games every PROCESS_RECONCILIATION_INTERVAL seconds.
+PROCESS_RECONCILIATION_INTERVAL = 60
+
+# The install locations of the games are read from the registry again after this many seconds, even if Windows has not
+# reported a change to the Uninstall key.
+INSTALL_LOCATION_CACHE_TTL = 30
+
+# The number of threads which list directories at the same time when the size of a game's install folder is calculated.
+DIRECTORY_SIZE_WORKERS = 8
+
+# Only the directories of an install folder which have changed are listed again when the size of a game is calculated.
+# Since a file can be modified without changing its directory, the whole folder is listed again after this many seconds.
+DIRECTORY_SIZE_INDEX_MAX_AGE = 60 * 60 * 24 * 7
+
 WINDOWS_UNINSTALL_KEY = "SOFTWARE\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\"
 
 AUTH_PARAMS = {
@@ -46,14 +133,30 @@ AUTH_PARAMS = {
 }
 
 
-async def get_unix_epoch_time_from_date(date):
-    year = int(date[0:4])
-    month = int(date[5:7])
-    day = int(date[8:10])
-    hour = int(date[11:13])
-    minute = int(date[14:16])
-    second = int(date[17:19])
-    return int(datetime.datetime(year, month, day, hour, minute, second).timestamp())
+# The Social Club sends dates in the ISO 8601 format (i.e., 2020-01-31T12:34:56.789). Fractions of a second are ignored,
+# and the seconds may be left out. A date may end with "Z" or a UTC offset (i.e., +02:00, +0200 or +02). Dates without a
+# time zone are treated as local time.
+UNIX_EPOCH = datetime.datetime(1970, 1, 1)
+ONE_SECOND = datetime.timedelta(seconds=1)
+
+
+def get_unix_epoch_time_from_date(date: str) -> int:
+    date = date.strip()
+    # The date and time are at fixed positions, and datetime.fromisoformat() reads them without any further parsing.
+    time_end = 19 if date[16:17] == ":" else 16
+    local_date = datetime.datetime.fromisoformat(date[:time_end])
+    zone = date[time_end:].lstrip(".0123456789")
+    if not zone:
+        return int(local_date.timestamp())
+    if zone in ("Z", "z"):
+        offset_seconds = 0
+    elif zone[0] in ("+", "-") and len(zone) in (3, 5, 6):
+        offset_seconds = int(zone[1:3]) * 3600 + (int(zone[-2:]) * 60 if len(zone) > 3 else 0)
+        if zone[0] == "-":
+            offset_seconds = -offset_seconds
+    else:
+        raise ValueError(f"Unrecognized date: {date}")
+    return (local_date - UNIX_EPOCH) // ONE_SECOND - offset_seconds
 
 
 async def get_time_passed(old_time: int) -> str:
@@ -0,0 +1,183 @@
+from compact_state import dumps_state, loads_state
+
+import dataclasses
+import logging as log
+import os
+import stat
+import threading
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from time import time
+from typing import Dict, List, Optional, Tuple
+
+# On Windows, junctions and other reparse points are not reported as symbolic links by os.scandir(), so they need to be
+# checked for separately. This attribute only exists on Windows.
+FILE_ATTRIBUTE_REPARSE_POINT = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
+
+
+def _is_link(entry: os.DirEntry) -> bool:
+    if entry.is_symlink():
+        return True
+    attributes = getattr(entry.stat(follow_symlinks=False), "st_file_attributes", 0)
+    return bool(attributes & FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def scan_directory(path: str) -> Tuple[int, List[str]]:
+    # Returns the total size of the files directly inside of the directory and the names of its subdirectories. Links
+    # are skipped, so that no file is counted twice and a link cannot lead the walk into a cycle. Entries which cannot
+    # be read (for example, because they were deleted during the walk) are skipped as well.
+    size = 0
+    subdirectories = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if _is_link(entry):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.name)
+                    else:
+                        # On Windows, this does not need another system call, since the size is part of the directory
+                        # listing.
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except (FileNotFoundError, PermissionError, NotADirectoryError):
+        pass
+    return size, subdirectories
+
+
+DIRECTORY_SIZE_INDEX_VERSION = 2
+
+
+@dataclasses.dataclass
+class DirectoryRecord:
+    mtime: int
+    size: int
+    subdirectories: Tuple[str, ...]
+
+
+def _scan_directory_record(path: str, previous: Optional[DirectoryRecord]) -> Optional[DirectoryRecord]:
+    # A directory's modification time changes whenever an entry is added to, removed from, or renamed inside of it, so
+    # an unchanged directory does not need to be listed again. Its subdirectories still need to be checked, however,
+    # since changes further down the tree do not affect the modification time of the directory.
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    if previous is not None and previous.mtime == mtime:
+        return previous
+    size, subdirectories = scan_directory(path)
+    return DirectoryRecord(mtime, size, tuple(subdirectories))
+
+
+def _encode_records(records: Dict[str, DirectoryRecord]) -> list:
+    # Flattens a tree's records into a list in which every directory is stored as its name, modification time, size,
+    # and number of subdirectories, followed by the same for each of its subdirectories. This way, neither the paths of
+    # the directories nor the names of their subdirectories need to be stored more than once. A subdirectory which
+    # could not be read is stored with a modification time of None, so that it is tried again on the next walk.
+    flat = []
+    stack = [("", "")]
+    while stack:
+        relative_path, name = stack.pop()
+        record = records.get(relative_path)
+        if record is None:
+            flat.extend((name, None, 0, 0))
+            continue
+        flat.extend((name, record.mtime, record.size, len(record.subdirectories)))
+        for child in reversed(record.subdirectories):
+            stack.append((os.path.join(relative_path, child), child))
+    return flat
+
+
+def _decode_records(flat: list) -> Dict[str, DirectoryRecord]:
+    records = {}
+    # Each parent on the stack is [relative path, names of its subdirectories so far, subdirectories left to read].
+    parents = []
+    for i in range(0, len(flat), 4):
+        name, mtime, size, subdirectory_count = flat[i:i + 4]
+        if parents:
+            parent = parents[-1]
+            relative_path = os.path.join(parent[0], name)
+            parent[1].append(name)
+            parent[2] -= 1
+        else:
+            relative_path = ""
+        subdirectories = []
+        if mtime is not None:
+            records[relative_path] = DirectoryRecord(mtime, size, subdirectories)
+        if subdirectory_count:
+            parents.append([relative_path, subdirectories, subdirectory_count])
+        else:
+            while parents and parents[-1][2] == 0:
+                parents.pop()
+    for record in records.values():
+        record.subdirectories = tuple(record.subdirectories)
+    return records
+
+
+class DirectorySizeIndex:
+    # Remembers the size of the files directly inside of each directory of an install folder, so that the size of the
+    # folder can be calculated again by only listing the directories which have changed since the last walk. Since
+    # modifying a file in place does not change the modification time of its directory, every folder is walked in full
+    # again once its index is older than max_age seconds.
+    def __init__(self, max_age: float):
+        self._max_age = max_age
+        # Each root path maps to (time of the last full walk, {relative directory path: DirectoryRecord}).
+        self._trees: Dict[str, Tuple[float, Dict[str, DirectoryRecord]]] = {}
+        self._lock = threading.Lock()
+        self.changed = False
+
+    def get_size(self, path: str, max_workers: int) -> int:
+        # This blocks until the walk is complete, so it should be called through run_in_executor().
+        if not os.path.isdir(path):
+            raise FileNotFoundError(path)
+        root = os.path.normcase(os.path.abspath(path))
+        with self._lock:
+            walked_at, previous_records = self._trees.get(root, (0, {}))
+        if time() >= walked_at + self._max_age:
+            walked_at, previous_records = time(), {}
+        records = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending = {pool.submit(_scan_directory_record, path, previous_records.get("")): ""}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    relative_path = pending.pop(future)
+                    record = future.result()
+                    if record is None:
+                        continue
+                    records[relative_path] = record
+                    for name in record.subdirectories:
+                        child = os.path.join(relative_path, name)
+                        pending[pool.submit(_scan_directory_record, os.path.join(path, child),
+                                            previous_records.get(child))] = child
+        relisted = sum(1 for relative_path, record in records.items()
+                       if previous_records.get(relative_path) is not record)
+        log.debug(f"ROCKSTAR_SIZE_INDEX: Listed {relisted} of {len(records)} directories.")
+        with self._lock:
+            self._trees[root] = (walked_at, records)
+            if relisted or len(records) != len(previous_records):
+                self.changed = True
+        return sum(record.size for record in records.values())
+
+    def get_state(self) -> str:
+        # The index can hold thousands of directories, so it is saved in the compact form from compact_state.py.
+        with self._lock:
+            self.changed = False
+            state = [DIRECTORY_SIZE_INDEX_VERSION, {root: [walked_at, _encode_records(records)]
+                                                    for root, (walked_at, records) in self._trees.items()}]
+        return dumps_state(state)
+
+    def set_state(self, saved_state: str):
+        try:
+            version, trees = loads_state(saved_state)
+        except (ValueError, TypeError):
+            # Older versions of the plugin saved the index as a hex-encoded pickle.
+            version, trees = None, {}
+        if version != DIRECTORY_SIZE_INDEX_VERSION:
+            log.debug("ROCKSTAR_SIZE_INDEX_OUTDATED: The saved directory size index is from an older version of the "
+                      "plugin. The install folders will be walked in full.")
+            return
+        with self._lock:
+            self._trees = {root: (walked_at, _decode_records(flat)) for root, (walked_at, flat) in trees.items()}
@@ -0,0 +1,86 @@
+from galaxy.api.types import UserInfo
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class FriendsCache:
+    # The friends cache is keyed by Rockstar ID, with a second index on the (case-insensitive) display name, so that
+    # merging a freshly imported friends list and looking up a friend's name are both constant-time operations.
+    def __init__(self):
+        self._friends: Dict[str, UserInfo] = {}
+        self._user_ids_by_name: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._friends)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._friends
+
+    def __iter__(self) -> Iterator[UserInfo]:
+        return iter(self._friends.values())
+
+    def values(self) -> List[UserInfo]:
+        return list(self._friends.values())
+
+    def get(self, user_id: str) -> Optional[UserInfo]:
+        return self._friends.get(user_id)
+
+    def get_user_name(self, user_id: str) -> Optional[str]:
+        friend = self._friends.get(user_id)
+        return friend.user_name if friend else None
+
+    def get_by_user_name(self, user_name: str) -> Optional[UserInfo]:
+        user_id = self._user_ids_by_name.get(user_name.lower())
+        return self._friends.get(user_id) if user_id else None
+
+    def update(self, friend: UserInfo) -> bool:
+        # Inserts the friend, or replaces the cached entry if any of its information has changed. The return value
+        # indicates whether or not the cache was modified.
+        old_friend = self._friends.get(friend.user_id)
+        if old_friend == friend:
+            return False
+        if old_friend:
+            self._user_ids_by_name.pop(old_friend.user_name.lower(), None)
+        self._friends[friend.user_id] = friend
+        self._user_ids_by_name[friend.user_name.lower()] = friend.user_id
+        return True
+
+    def remove(self, user_id: str) -> Optional[UserInfo]:
+        friend = self._friends.pop(user_id, None)
+        if friend:
+            self._user_ids_by_name.pop(friend.user_name.lower(), None)
+        return friend
+
+    def diff(self, friends: List[UserInfo]) -> Tuple[List[UserInfo], List[UserInfo], List[str]]:
+        # Compares a complete friends list from the Social Club against the cache. The first list contains the friends
+        # who are new, the second contains the friends whose information has changed, and the third contains the IDs of
+        # the friends who are no longer on the user's friends list.
+        new_ids = set()
+        added = []
+        changed = []
+        for friend in friends:
+            new_ids.add(friend.user_id)
+            old_friend = self._friends.get(friend.user_id)
+            if old_friend is None:
+                added.append(friend)
+            elif old_friend != friend:
+                changed.append(friend)
+        removed = [user_id for user_id in self._friends if user_id not in new_ids]
+        return added, changed, removed
+
+    def merge(self, friends: List[UserInfo]) -> Tuple[List[UserInfo], List[UserInfo]]:
+        # Adds the friends to the cache without removing anyone, since the list may be incomplete. The new and changed
+        # friends are returned in the same way as in diff().
+        added, changed, _ = self.diff(friends)
+        for friend in added + changed:
+            self.update(friend)
+        return added, changed
+
+    def replace(self, friends: List[UserInfo]) -> Tuple[List[UserInfo], List[UserInfo], List[str]]:
+        # Makes the cache match a complete friends list, returning the same difference as diff().
+        added, changed, removed = self.diff(friends)
+        for user_id in removed:
+            self.remove(user_id)
+        for friend in added + changed:
+            self.update(friend)
+        return added, changed, removed
@@ -1,6 +1,8 @@
 from galaxy.api.types import LicenseInfo
 from galaxy.api.consts import LicenseType
 
+from types import MappingProxyType
+
 # The onlineTitleId values are taken from https://www.rockstargames.com/games/get-games.json?sort=&direction=&family=&
 # platform=pc.
 #
@@ -182,47 +184,78 @@ ignore_game_title_ids_list = [
 ]
 
 
+class TitleRegistry:
+    # The lookup helpers below are called once per game and once per friend, so the games cache is indexed a single
+    # time here instead of being walked on every call. The indexes are read-only views, since the games cache itself
+    # never changes while the plugin is running.
+    def __init__(self, cache):
+        ros_index = {}
+        online_index = {}
+        google_tag_index = {}
+        ugc_index = {}
+        achievement_index = {}
+        # When two titles share an identifier, the first one in the games cache wins, which matches the order in which
+        # the old linear scans returned their results.
+        for game, d in cache.items():
+            ros_index.setdefault(int(d["rosTitleId"]), game)
+            if d.get("onlineTitleId") is not None:
+                online_index.setdefault(int(d["onlineTitleId"]), game)
+            if d.get("googleTagId"):
+                google_tag_index.setdefault(d["googleTagId"], game)
+                ugc_index.setdefault(d["googleTagId"].lower(), game)
+            achievement_index.setdefault(int(d["rosTitleId"]), d["achievementId"])
+        self._ros_index = MappingProxyType(ros_index)
+        self._online_index = MappingProxyType(online_index)
+        self._google_tag_index = MappingProxyType(google_tag_index)
+        self._ugc_index = MappingProxyType(ugc_index)
+        self._achievement_index = MappingProxyType(achievement_index)
+
+    def by_ros_title_id(self, ros_title_id):
+        return self._ros_index.get(int(ros_title_id))
+
+    def by_online_title_id(self, online_title_id):
+        return self._online_index.get(int(online_title_id))
+
+    def by_google_tag_id(self, google_tag_id):
+        return self._google_tag_index.get(google_tag_id)
+
+    def by_ugc_title_id(self, ugc_id):
+        return self._ugc_index.get(ugc_id.lower())
+
+    def achievement_id_by_ros_title_id(self, ros_title_id):
+        return self._achievement_index.get(int(ros_title_id))
+
+
+title_registry = TitleRegistry(games_cache)
+
+
 def get_game_title_id_from_ros_title_id(ros_title_id):
     # The rosTitleId value is used by the Rockstar Games Launcher to uniquely identify the games that it supports.
     # For some reason, Rockstar made these values different from the internal numerical IDs for the same games on their
     # website (which are listed here as the onlineTitleId value).
-    for game, d in games_cache.items():
-        if d["rosTitleId"] == int(ros_title_id):
-            return game
-    return None
+    return title_registry.by_ros_title_id(ros_title_id)
 
 
 def get_game_title_id_from_online_title_id(online_title_id):
     # The onlineTitleId value is used to uniquely identify each game across Rockstar's various websites, including
     # https://www.rockstargames.com/auth/get-user.json. These values seem to have no use within the Rockstar Games
     # Launcher.
-    for game, d in games_cache.items():
-        if d["onlineTitleId"] == int(online_title_id):
-            return game
-    return None
+    return title_registry.by_online_title_id(online_title_id)
 
 
 def get_game_title_id_from_google_tag_id(google_tag_id):
     # The Google Tag Manager setup data contains a list of the Social Club user's played games as a string. The values
     # present in the string differ from other forms of identifiers on Rockstar's websites in that it describes the
     # game's title, and is not just a numeric ID.
-    for game, d in games_cache.items():
-        if 'googleTagId' in d and d['googleTagId'] == google_tag_id:
-            return game
-    return None
+    return title_registry.by_google_tag_id(google_tag_id)
 
 
 def get_game_title_id_from_ugc_title_id(ugc_id):
     # The ugc ID for a game seems to be related to the Google Tag ID of the game, although this could be wrong.
-    for game, d in games_cache.items():
-        if 'googleTagId' in d and d['googleTagId'].lower() == ugc_id.lower():
-            return game
-    return None
+    return title_registry.by_ugc_title_id(ugc_id)
 
 
 def get_achievement_id_from_ros_title_id(ros_title_id):
     # The achievementId value is used by the Social Club API to uniquely identify games. Here, it is used to get the
     # list of a game's achievements, as well as a user's unlocked achievements.
-    for game, d in games_cache.items():
-        if d["rosTitleId"] == int(ros_title_id):
-            return games_cache[game]["achievementId"]
+    return title_registry.achievement_id_by_ros_title_id(ros_title_id)
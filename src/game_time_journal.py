@@ -0,0 +1,145 @@
+import logging as log
+import os
+import pickle
+
+from typing import Dict, Optional, Tuple
+
+GAME_TIME_SNAPSHOT_VERSION = 1
+
+SNAPSHOT_HEADER = ("# This file contains a cached copy of the user's play time for the Rockstar plugin for GOG "
+                   "Galaxy 2.0.\n"
+                   "# DO NOT EDIT THIS FILE IN ANY WAY, LEST THE CACHE GETS CORRUPTED AND YOUR PLAY TIME IS LOST!\n")
+
+
+def dumps_snapshot(sequence: int, game_time_cache: Dict[str, dict]) -> str:
+    return pickle.dumps((GAME_TIME_SNAPSHOT_VERSION, sequence, game_time_cache)).hex()
+
+
+def loads_snapshot(value: str) -> Tuple[int, Dict[str, dict]]:
+    # Older versions of the plugin saved the game time cache on its own, without a journal sequence number.
+    snapshot = pickle.loads(bytes.fromhex(value))
+    if isinstance(snapshot, dict):
+        return 0, snapshot
+    version, sequence, game_time_cache = snapshot
+    if version != GAME_TIME_SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported game time snapshot version: {version}")
+    return sequence, game_time_cache
+
+
+def apply_session(game_time_cache: Dict[str, dict], title_id: str, start_time: float, stop_time: float):
+    minutes_passed = (stop_time - start_time) / 60
+    entry = game_time_cache.get(title_id)
+    if entry and entry['time_played']:
+        entry['time_played'] += minutes_passed
+        entry['last_played'] = stop_time
+    else:
+        game_time_cache[title_id] = {
+            'time_played': minutes_passed,
+            'last_played': stop_time
+        }
+
+
+class GameTimeJournal:
+    # Keeps the user's game time safe from crashes. Every stretch of time that a game is played for is appended to the
+    # journal as a small session record (sequence number, title ID, start time, and stop time) as soon as it is
+    # recorded. Once the journal holds max_records records, the whole game time cache is written to the snapshot file,
+    # and the journal is emptied, so neither file grows with the length of the user's play history. Each snapshot
+    # remembers the sequence number of the last record that it includes, so a record is never counted twice, even if
+    # the plugin stops between writing a snapshot and emptying the journal.
+    def __init__(self, snapshot_path: str, journal_path: str, max_records: int):
+        self._snapshot_path = snapshot_path
+        self._journal_path = journal_path
+        self._max_records = max_records
+        self._record_count = 0
+        self.sequence = 0
+
+    def _read_snapshot_file(self) -> Optional[Tuple[int, Dict[str, dict]]]:
+        try:
+            with open(self._snapshot_path, "r") as f:
+                for line in f:
+                    if line[:1] != "#" and line.strip():
+                        return loads_snapshot(line.strip())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.error(f"ROCKSTAR_GAME_TIME_SNAPSHOT_ERROR: Reading the game time snapshot resulted in the exception "
+                      f"{repr(e)} being thrown.")
+        return None
+
+    def load(self, cached_snapshot: Optional[Tuple[int, Dict[str, dict]]]) -> Dict[str, dict]:
+        # Starts from whichever snapshot (the one from the persistent cache or the one on the disk) is newer, and then
+        # replays the journal records which came after it.
+        snapshots = [snapshot for snapshot in (cached_snapshot, self._read_snapshot_file()) if snapshot is not None]
+        self.sequence, game_time_cache = max(snapshots, key=lambda snapshot: snapshot[0], default=(0, {}))
+        replayed = 0
+        self._record_count = 0
+        try:
+            with open(self._journal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        except OSError as e:
+            # The game time from the snapshot is still better than none at all, so the plugin starts without the
+            # journal's records instead of failing to start.
+            log.error(f"ROCKSTAR_GAME_TIME_JOURNAL_ERROR: Reading the game time journal resulted in the exception "
+                      f"{repr(e)} being thrown. Starting without its records...")
+            data = b""
+        *lines, partial_line = data.split(b"\n")
+        if partial_line:
+            # The last record was only partially written because the plugin stopped suddenly. It is cut off, so that the
+            # next record does not get appended to the end of it.
+            log.warning("ROCKSTAR_GAME_TIME_JOURNAL_TRUNCATED: Discarding a partially written game time record...")
+            try:
+                with open(self._journal_path, "r+b") as f:
+                    f.truncate(len(data) - len(partial_line))
+            except OSError as e:
+                log.error(f"ROCKSTAR_GAME_TIME_JOURNAL_ERROR: Truncating the game time journal resulted in the "
+                          f"exception {repr(e)} being thrown.")
+        for line in lines:
+            self._record_count += 1
+            try:
+                sequence, title_id, start_time, stop_time = line.decode("utf-8").split("\t")
+                sequence, start_time, stop_time = int(sequence), float(start_time), float(stop_time)
+            except ValueError:
+                continue
+            if sequence <= self.sequence:
+                continue
+            apply_session(game_time_cache, title_id, start_time, stop_time)
+            self.sequence = sequence
+            replayed += 1
+        log.debug(f"ROCKSTAR_GAME_TIME_JOURNAL: Replayed {replayed} session record(s) from the game time journal.")
+        return game_time_cache
+
+    def record_session(self, game_time_cache: Dict[str, dict], title_id: str, start_time: float, stop_time: float):
+        apply_session(game_time_cache, title_id, start_time, stop_time)
+        self.sequence += 1
+        try:
+            with open(self._journal_path, "a") as f:
+                f.write(f"{self.sequence}\t{title_id}\t{start_time:.3f}\t{stop_time:.3f}\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._record_count += 1
+        except OSError as e:
+            log.error(f"ROCKSTAR_GAME_TIME_JOURNAL_ERROR: Writing to the game time journal resulted in the exception "
+                      f"{repr(e)} being thrown.")
+            return
+        if self._record_count >= self._max_records:
+            self.compact(game_time_cache)
+
+    def compact(self, game_time_cache: Dict[str, dict]):
+        # The snapshot is written to a temporary file first and then moved over the old snapshot, so that a crash can
+        # never leave a partially written snapshot behind.
+        temporary_path = self._snapshot_path + ".tmp"
+        try:
+            with open(temporary_path, "w") as f:
+                f.write(SNAPSHOT_HEADER)
+                f.write(dumps_snapshot(self.sequence, game_time_cache))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary_path, self._snapshot_path)
+            with open(self._journal_path, "w"):
+                pass
+            self._record_count = 0
+        except OSError as e:
+            log.error(f"ROCKSTAR_GAME_TIME_SNAPSHOT_ERROR: Writing the game time snapshot resulted in the exception "
+                      f"{repr(e)} being thrown.")
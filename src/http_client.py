@@ -4,8 +4,14 @@ from galaxy.api.types import UserPresence
 from galaxy.api.consts import PresenceState
 from http.cookies import SimpleCookie
 
-from consts import USER_AGENT, LOG_SENSITIVE_DATA, CONFIG_OPTIONS, get_time_passed, get_unix_epoch_time_from_date
+from consts import USER_AGENT, LOG_SENSITIVE_DATA, CONFIG_OPTIONS, REQUEST_VERIFICATION_TOKEN_TTL, \
+    REQUEST_VERIFICATION_TOKEN_REFRESH_MARGIN, RATE_LIMITS, DEFAULT_RATE_LIMIT, RATE_LIMIT_MAX_RETRIES, \
+    RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, CIRCUIT_BREAKER_FAILURE_THRESHOLD, \
+    CIRCUIT_BREAKER_RESET_TIMEOUT, RESPONSE_CACHE_MAX_BYTES, get_time_passed, get_unix_epoch_time_from_date
 from game_cache import get_game_title_id_from_google_tag_id, get_game_title_id_from_ugc_title_id, games_cache
+from rate_limiter import RateLimiterRegistry, parse_retry_after
+from response_cache import ResponseCache
+from retry_policy import CircuitBreakerRegistry, RetryPolicy
 
 import aiohttp
 import asyncio
@@ -84,6 +90,72 @@ class CookieJar(aiohttp.CookieJar):
         return ''
 
 
+class RequestVerificationTokenProvider:
+    # Scraping a __RequestVerificationToken requires downloading and parsing an entire Social Club page, so each token
+    # is cached for its origin and shared between requests. Shortly before a token expires, a new one is fetched in the
+    # background, and only one fetch per origin is ever in progress at once.
+    def __init__(self, fetch_token, ttl, refresh_margin):
+        self._fetch_token = fetch_token
+        self._ttl = ttl
+        self._refresh_margin = refresh_margin
+        self._tokens = {}
+        self._pending = {}
+
+    @staticmethod
+    def get_origin(url):
+        parsed_url = URL(url)
+        return f"{parsed_url.scheme}://{parsed_url.host}"
+
+    async def get_token(self, url, referer):
+        origin = self.get_origin(url)
+        token = self._tokens.get(origin)
+        if token is not None and not token.expired:
+            if token.get_expiration() - self._refresh_margin <= time() and origin not in self._pending:
+                self._start_fetch(origin, url, referer)
+            return token.get_token()
+        if origin not in self._pending:
+            self._start_fetch(origin, url, referer)
+        # The fetch is shielded so that a cancelled caller does not cancel it for every other caller that is waiting.
+        return await asyncio.shield(self._pending[origin])
+
+    def invalidate(self, url):
+        origin = self.get_origin(url)
+        if origin in self._tokens:
+            log.debug(f"ROCKSTAR_RV_TOKEN_INVALIDATED: The cached request verification token for {origin} has been "
+                      f"invalidated.")
+            del self._tokens[origin]
+
+    def invalidate_all(self):
+        self._tokens.clear()
+
+    def close(self):
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+    def _start_fetch(self, origin, url, referer):
+        task = asyncio.create_task(self._fetch(origin, url, referer))
+        task.add_done_callback(lambda t: self._on_fetch_done(origin, t))
+        self._pending[origin] = task
+
+    async def _fetch(self, origin, url, referer):
+        rv_token = await self._fetch_token(url, referer)
+        if rv_token:
+            token = Token()
+            token.set_token(rv_token, time() + self._ttl)
+            self._tokens[origin] = token
+        return rv_token
+
+    def _on_fetch_done(self, origin, task):
+        if self._pending.get(origin) is task:
+            del self._pending[origin]
+        # Retrieving the exception here prevents a failed background refresh from being reported as an unhandled
+        # exception. Callers who awaited the fetch still receive the exception themselves.
+        if not task.cancelled() and task.exception() is not None:
+            log.warning(f"ROCKSTAR_RV_TOKEN_FETCH_FAILED: Getting a request verification token from {origin} failed "
+                        f"with the exception {repr(task.exception())}.")
+
+
 class BackendClient:
     def __init__(self, store_credentials):
         self._debug_always_refresh = CONFIG_OPTIONS['debug_always_refresh']
@@ -101,10 +173,22 @@ class BackendClient:
         self._current_auth_token = None
         self._current_sc_token = None
         self._first_auth = True
-        self._refreshing = False
+        # These hold the credential refreshes which are currently in progress, if any. Every caller that needs a refresh
+        # while one is already running awaits the same task, so only one refresh of each kind is ever sent at once.
+        self._strict_refresh_task = None
+        self._light_refresh_task = None
+        self._rv_token_provider = RequestVerificationTokenProvider(self._fetch_request_verification_token,
+                                                                   REQUEST_VERIFICATION_TOKEN_TTL,
+                                                                   REQUEST_VERIFICATION_TOKEN_REFRESH_MARGIN)
+        self._rate_limiters = RateLimiterRegistry(RATE_LIMITS, DEFAULT_RATE_LIMIT)
+        self._response_cache = ResponseCache(RESPONSE_CACHE_MAX_BYTES)
+        self._retry_policy = RetryPolicy(RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+        self._circuit_breakers = CircuitBreakerRegistry(CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                                                        CIRCUIT_BREAKER_RESET_TIMEOUT)
         # super().__init__(cookie_jar=self._cookie_jar)
 
     async def close(self):
+        self._rv_token_provider.close()
         await self._current_session.close()
 
     def get_credentials(self):
@@ -194,20 +278,112 @@ class BackendClient:
                 cookie_object[morsel.key]['path'] = morsel['path']
                 self._current_session.cookie_jar.update_cookies(cookie_object)
 
+    async def _send_request(self, method, url, session=None, **kwargs):
+        # All requests to Rockstar's websites go through here, so that they can be limited to a rate that each host
+        # will accept. If a host responds with 429 Too Many Requests anyway, then the request is sent again once the
+        # host's Retry-After time has passed. Every session is created with raise_for_status=True, so a 429 response
+        # always arrives as a ClientResponseError.
+        session = session if session is not None else self._current_session
+        limiter = self._rate_limiters.get_limiter(url)
+        retries = RATE_LIMIT_MAX_RETRIES
+        while True:
+            await limiter.acquire()
+            try:
+                resp = await session.request(method, url, **kwargs)
+            except aiohttp.ClientResponseError as e:
+                if e.status != 429 or retries == 0:
+                    raise
+                retry_after = e.headers.get("Retry-After") if e.headers else None
+                limiter.on_rate_limited(parse_retry_after(retry_after))
+                retries -= 1
+                continue
+            limiter.on_success()
+            return resp
+
+    async def _get(self, url, **kwargs):
+        return await self._send_request("GET", url, **kwargs)
+
+    async def _post(self, url, **kwargs):
+        return await self._send_request("POST", url, **kwargs)
+
+    def get_rate_limiter_stats(self):
+        return self._rate_limiters.get_stats()
+
+    def get_response_cache_stats(self):
+        return self._response_cache.get_stats()
+
+    async def _request_with_retry(self, url, send_request):
+        # Makes a request to the Social Club with send_request(), which performs a single attempt and returns its
+        # result. Failed attempts are retried according to the retry policy, and the host's circuit breaker makes
+        # requests fail immediately while the host appears to be down.
+        breaker = self._circuit_breakers.get_breaker(url)
+        attempt = 1
+        while True:
+            is_probe = breaker.before_request()
+            sc_token = self._current_sc_token
+            try:
+                result = await send_request()
+            except Exception as e:
+                action = self._retry_policy.classify(e)
+                if action == RetryPolicy.BACKOFF:
+                    breaker.record_failure()
+                else:
+                    # The host responded, even if it was not with what we wanted.
+                    breaker.record_success()
+                if action is None or attempt >= self._retry_policy.max_attempts:
+                    log.error(f"ROCKSTAR_REQUEST_FAILED: The request failed with the exception {repr(e)} after "
+                              f"{attempt} attempt(s).")
+                    raise
+                if action == RetryPolicy.REFRESH:
+                    log.warning(f"ROCKSTAR_REQUEST_RETRY: The request failed with the exception {repr(e)}. Attempting "
+                                f"to refresh credentials...")
+                    await self._refresh_credentials_social_club_light(sc_token)
+                else:
+                    delay = self._retry_policy.get_delay(attempt)
+                    log.warning(f"ROCKSTAR_REQUEST_RETRY: The request failed with the exception {repr(e)}. Trying "
+                                f"again in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                # The request was cancelled, so it neither succeeded nor failed.
+                if is_probe:
+                    breaker.release_probe()
+                raise
+            breaker.record_success()
+            return result
+
     async def get_json_from_request_strict(self, url, include_default_headers=True, additional_headers=None):
-        headers = additional_headers if additional_headers is not None else {}
-        if include_default_headers:
-            headers["Authorization"] = f"Bearer {self._current_sc_token}"
-            headers["X-Requested-With"] = "XMLHttpRequest"
-            headers["User-Agent"] = USER_AGENT
-        try:
-            resp = await self._current_session.get(url, headers=headers)
+        # Responses are cached separately for each user, since the same URL can return different data depending on
+        # who is asking for it.
+        cache_key = (self.user["rockstar_id"] if self.user else None, url)
+
+        async def send_request():
+            # The headers are created for every attempt, since the bearer token may have been refreshed in between.
+            headers = dict(additional_headers) if additional_headers is not None else {}
+            if include_default_headers:
+                headers["Authorization"] = f"Bearer {self._current_sc_token}"
+                headers["X-Requested-With"] = "XMLHttpRequest"
+                headers["User-Agent"] = USER_AGENT
+            conditional_headers = self._response_cache.get_conditional_headers(cache_key)
+            resp = await self._get(url, headers={**headers, **conditional_headers})
             await self._update_cookies_from_response(resp)
-            return await resp.json()
-        except Exception as e:
-            log.exception(f"WARNING: The request failed with exception {repr(e)}. Attempting to refresh credentials...")
-            await self._refresh_credentials_social_club_light()
-            return await self.get_json_from_request_strict(url, include_default_headers, additional_headers)
+            if resp.status == 304:
+                cached_body = self._response_cache.get(cache_key)
+                if cached_body is not None:
+                    return json.loads(cached_body)
+                # The cached response was evicted while the request was in progress. The host is working fine, so the
+                # request is simply sent again right away without the conditional headers.
+                resp.release()
+                resp = await self._get(url, headers=headers)
+                await self._update_cookies_from_response(resp)
+            resp_json = await resp.json()
+            if resp.status == 200:
+                self._response_cache.store(cache_key, resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+                                           await resp.read())
+            return resp_json
+
+        return await self._request_with_retry(url, send_request)
 
     async def get_bearer_from_cookie_jar(self):
         morsel_list = self._current_session.cookie_jar.__iter__()
@@ -247,11 +423,11 @@ class BackendClient:
                 "referer": "https://www.rockstargames.com",
                 "user-agent": USER_AGENT
             }
-            resp = await self._current_session.get("https://graph.rockstargames.com/?operationName=UserData&variables="
-                                                   "%7B%7D&extensions=%7B%22persistedQuery%22%3A%7B%22version%22%3A1%2C"
-                                                   "%22sha256Hash%22%3A%224015efac722ba3668f30067cc729d9ecf9d7761f22ba5"
-                                                   "a58c8e1530a309ab029%22%7D%7D", headers=headers,
-                                                   allow_redirects=False)
+            resp = await self._get("https://graph.rockstargames.com/?operationName=UserData&variables="
+                                   "%7B%7D&extensions=%7B%22persistedQuery%22%3A%7B%22version%22%3A1%2C"
+                                   "%22sha256Hash%22%3A%224015efac722ba3668f30067cc729d9ecf9d7761f22ba5"
+                                   "a58c8e1530a309ab029%22%7D%7D", headers=headers,
+                                   allow_redirects=False)
             await self._update_cookies_from_response(resp)
             # aiohttp allows you to get a specified cookie from the previous response.
             filtered_cookies = resp.cookies
@@ -323,6 +499,9 @@ class BackendClient:
             raise
 
     async def _get_request_verification_token(self, url, referer):
+        return await self._rv_token_provider.get_token(url, referer)
+
+    async def _fetch_request_verification_token(self, url, referer):
         class RockstarHTMLParser(HTMLParser):
             rv_token = None
 
@@ -336,8 +515,7 @@ class BackendClient:
             def get_token(self):
                 return self.rv_token
 
-        while self._refreshing:
-            await asyncio.sleep(1)
+        await self._wait_for_refresh()
         headers = {
             "Accept": ("text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,"
                        "application/signed-exchange;v=b3"),
@@ -345,7 +523,7 @@ class BackendClient:
             "Referer": referer,
             "User-Agent": USER_AGENT
         }
-        resp = await self._current_session.get(url, headers=headers)
+        resp = await self._get(url, headers=headers)
         await self._update_cookies_from_response(resp)
         resp_text = await resp.text()
         parser = RockstarHTMLParser()
@@ -370,59 +548,51 @@ class BackendClient:
             "X-Requested-With": "XMLHttpRequest"
         }
         url = f"https://socialclub.rockstargames.com/ajax/getGoogleTagManagerSetupData?_={int(time() * 1000)}"
-        resp = await self._current_session.get(url, headers=headers)
+        resp = await self._get(url, headers=headers)
         await self._update_cookies_from_response(resp)
         return await resp.json()
 
-    async def get_played_games(self, callback=False):
+    async def get_played_games(self):
+        async def send_request():
+            try:
+                resp_json = await self._get_google_tag_data()
+                if LOG_SENSITIVE_DATA:
+                    log.debug(f"ROCKSTAR_SC_TAG_DATA: {resp_json}")
+                else:
+                    log.debug(f"ROCKSTAR_SC_TAG_DATA: ***")
+                if resp_json['loginState'] == "false":
+                    raise AuthenticationRequired
+                return resp_json
+            except Exception:
+                # The request verification token may be the reason that the request failed, so it should not be
+                # reused.
+                self._rv_token_provider.invalidate("https://socialclub.rockstargames.com/")
+                raise
+
         try:
-            resp_json = await self._get_google_tag_data()
-            if LOG_SENSITIVE_DATA:
-                log.debug(f"ROCKSTAR_SC_TAG_DATA: {resp_json}")
-            else:
-                log.debug(f"ROCKSTAR_SC_TAG_DATA: ***")
-            if resp_json['loginState'] == "false":
-                raise AuthenticationRequired
-            games_owned_string = resp_json['gamesOwned']
-            owned_games = []
-            for game in games_owned_string.split('|'):
-                if game != "Launcher_PC":
-                    title_id = get_game_title_id_from_google_tag_id(game)
-                    if title_id:
-                        owned_games.append(title_id)
-            return owned_games
-        except Exception:
-            if not callback:
-                try:
-                    await self._refresh_credentials_social_club_light()
-                    return await self.get_played_games(callback=True)
-                except Exception as e:
-                    log.exception("ROCKSTAR_PLAYED_GAMES_ERROR: The request to scrape the user's played games resulted "
-                                  "in this exception: " + repr(e))
-                    raise
+            resp_json = await self._request_with_retry("https://socialclub.rockstargames.com/", send_request)
+        except Exception as e:
+            log.exception("ROCKSTAR_PLAYED_GAMES_ERROR: The request to scrape the user's played games resulted in this "
+                          "exception: " + repr(e))
             raise
+        games_owned_string = resp_json['gamesOwned']
+        owned_games = []
+        for game in games_owned_string.split('|'):
+            if game != "Launcher_PC":
+                title_id = get_game_title_id_from_google_tag_id(game)
+                if title_id:
+                    owned_games.append(title_id)
+        return owned_games
 
     async def get_last_played_game(self, friend_name):
-        headers = {
-            "Authorization": f"Bearer {self._current_sc_token}",
-            "User-Agent": USER_AGENT,
-            "X-Requested-With": "XMLHttpRequest"
-        }
-        try:
-            resp = await self._current_session.get("https://scapi.rockstargames.com/profile/getprofile?nickname="
-                                                   f"{friend_name}&maxFriends=3", headers=headers)
-            await self._update_cookies_from_response(resp)
-            resp_json = await resp.json()
-        except AssertionError:
-            await self._refresh_credentials_social_club_light()
-            return await self.get_last_played_game(friend_name)
+        resp_json = await self.get_json_from_request_strict("https://scapi.rockstargames.com/profile/getprofile?"
+                                                            f"nickname={friend_name}&maxFriends=3")
         try:
             # The last played game is always listed first in the ownedGames list.
             last_played_ugc = resp_json['accounts'][0]['rockstarAccount']['gamesOwned'][0]['name']
             title_id = get_game_title_id_from_ugc_title_id(last_played_ugc + "_PC")
-            last_played_time = await get_unix_epoch_time_from_date(resp_json['accounts'][0]
-                                                                                  ['rockstarAccount']['gamesOwned'][0]
-                                                                                  ['lastSeen'])
+            last_played_time = get_unix_epoch_time_from_date(resp_json['accounts'][0]['rockstarAccount']
+                                                             ['gamesOwned'][0]['lastSeen'])
             if LOG_SENSITIVE_DATA:
                 log.debug(f"{friend_name}'s Last Played Game: "
                           f"{games_cache[title_id]['friendlyName'] if title_id else last_played_ugc}")
@@ -468,27 +638,29 @@ class BackendClient:
         url = ("https://socialclub.rockstargames.com/games/gtav/career/overviewAjax?character=Freemode&"
                f"rockstarIds={user_id}&slot=Freemode&nickname={friend_name}&gamerHandle=&gamerTag=&category=Overview"
                f"&_={int(time() * 1000)}")
-        headers = {
-            'Accept': 'text/html, */*',
-            'Cookie': await self.get_cookies_for_headers(),
-            "RequestVerificationToken": await self._get_request_verification_token(
-                "https://socialclub.rockstargames.com/games/gtav/pc/career/overview/gtaonline",
-                "https://socialclub.rockstargames.com/games"),
-            'User-Agent': USER_AGENT
-        }
-        while True:
+
+        async def send_request():
+            headers = {
+                'Accept': 'text/html, */*',
+                'Cookie': await self.get_cookies_for_headers(),
+                "RequestVerificationToken": await self._get_request_verification_token(
+                    "https://socialclub.rockstargames.com/games/gtav/pc/career/overview/gtaonline",
+                    "https://socialclub.rockstargames.com/games"),
+                'User-Agent': USER_AGENT
+            }
             try:
-                resp = await self._current_session.get(url, headers=headers)
-                await self._update_cookies_from_response(resp)
-                break
+                resp = await self._get(url, headers=headers)
             except aiohttp.ClientResponseError as e:
-                if e.status == 429:
-                    await asyncio.sleep(5)
-                else:
-                    raise e
-            except Exception:
+                # The request verification token may be the reason that the request was rejected, so it should not be
+                # reused. The token is not at fault if the server is throttling requests or is unavailable, so it is
+                # kept, and retrying the request does not cost another fetch of the career page.
+                if e.status in (400, 401, 403):
+                    self._rv_token_provider.invalidate(url)
                 raise
-        resp_text = await resp.text()
+            await self._update_cookies_from_response(resp)
+            return await resp.text()
+
+        resp_text = await self._request_with_retry(url, send_request)
         parser = GTAOnlineStatParser()
         parser.feed(resp_text)
         rank, title = parser.get_stats()
@@ -505,19 +677,8 @@ class BackendClient:
             return await self.get_last_played_game(friend_name)
 
     async def get_rdo_stats(self, user_id, friend_name):
-        headers = {
-            'Authorization': f'Bearer {self._current_sc_token}',
-            'User-Agent': USER_AGENT,
-            'X-Requested-With': 'XMLHttpRequest'
-        }
-        try:
-            resp = await self._current_session.get("https://scapi.rockstargames.com/games/rdo/navigationData?platform=pc&"
-                                                   f"rockstarId={user_id}", headers=headers)
-            await self._update_cookies_from_response(resp)
-            resp_json = await resp.json()
-        except AssertionError:
-            await self._refresh_credentials_social_club_light()
-            return await self.get_rdo_stats(user_id, friend_name)
+        resp_json = await self.get_json_from_request_strict("https://scapi.rockstargames.com/games/rdo/navigationData?"
+                                                            f"platform=pc&rockstarId={user_id}")
         try:
             char_name = resp_json['result']['onlineCharacterName']
             char_rank = resp_json['result']['onlineCharacterRank']
@@ -532,10 +693,8 @@ class BackendClient:
 
         # As an added bonus, we will find the user's preferred role (bounty hunter, collector, or trader). This is
         # determined by the acquired rank in each role.
-        resp = await self._current_session.get("https://scapi.rockstargames.com/games/rdo/awards/progress?platform=pc&"
-                                               f"rockstarId={user_id}", headers=headers)
-        await self._update_cookies_from_response(resp)
-        resp_json = await resp.json()
+        resp_json = await self.get_json_from_request_strict("https://scapi.rockstargames.com/games/rdo/awards/progress?"
+                                                            f"platform=pc&rockstarId={user_id}")
         ranks = {
             "Bounty Hunter": None,
             "Collector": None,
@@ -582,13 +741,27 @@ class BackendClient:
                 return rsso_name, rsso_value
 
     async def refresh_credentials(self):
-        while self._refreshing:
-            # If we are already refreshing the credentials, then no other refresh requests should be accepted.
-            await asyncio.sleep(3)
-        self._refreshing = True
+        # If we are already refreshing the credentials, then no other refresh should be started. Instead, the caller
+        # waits for the current refresh to finish. The task is shielded so that a cancelled caller does not cancel the
+        # refresh for everyone else.
+        if self._strict_refresh_task is None or self._strict_refresh_task.done():
+            self._strict_refresh_task = asyncio.create_task(self._refresh_credentials_strict())
+        return await asyncio.shield(self._strict_refresh_task)
+
+    async def _refresh_credentials_strict(self):
         await self._refresh_credentials_base()
         await self._refresh_credentials_social_club()
-        self._refreshing = False
+        return self._current_sc_token
+
+    async def _wait_for_refresh(self):
+        # Waits for any credential refresh that is currently in progress. Failures are left to the caller that started
+        # the refresh, since the waiting caller will find out for itself if the credentials are still invalid.
+        for task in (self._strict_refresh_task, self._light_refresh_task):
+            if task is not None and not task.done():
+                try:
+                    await asyncio.shield(task)
+                except Exception:
+                    pass
 
     async def _refresh_credentials_base(self):
         # This request returns a new cookie beginning with "TSc", which is used as authentication for the base website
@@ -636,7 +809,7 @@ class BackendClient:
                 "X-Requested-With": "XMLHttpRequest"
             }
             data = {"fingerprint": self._fingerprint}
-            refresh_resp = await self._current_session.post(url, data=data, headers=headers)
+            refresh_resp = await self._post(url, data=data, headers=headers)
             await self._update_cookies_from_response(refresh_resp)
             refresh_code = await refresh_resp.text()
             if LOG_SENSITIVE_DATA:
@@ -663,7 +836,7 @@ class BackendClient:
                 "Referer": "https://www.rockstargames.com/",
                 "User-Agent": USER_AGENT
             }
-            final_request = await self._current_session.get(url, headers=headers)
+            final_request = await self._get(url, headers=headers)
             await self._update_cookies_from_response(final_request)
             final_json = await final_request.json()
             if LOG_SENSITIVE_DATA:
@@ -680,14 +853,23 @@ class BackendClient:
         except Exception as e:
             log.exception("ROCKSTAR_REFRESH_FAILURE: The attempt to re-authenticate the user has failed with the "
                           "exception " + repr(e) + ". Logging the user out...")
-            self._refreshing = False
             raise InvalidCredentials
 
-    async def _refresh_credentials_social_club_light(self):
+    async def _refresh_credentials_social_club_light(self, failed_token=None):
+        # When many requests fail at the same time, they should all share a single refresh. If the bearer token that a
+        # request failed with has already been replaced, then there is no need to refresh it again.
+        if failed_token is not None and failed_token != self._current_sc_token:
+            return self._current_sc_token
+        if self._strict_refresh_task is not None and not self._strict_refresh_task.done():
+            return await asyncio.shield(self._strict_refresh_task)
+        if self._light_refresh_task is None or self._light_refresh_task.done():
+            self._light_refresh_task = asyncio.create_task(self._refresh_credentials_social_club_light_once())
+        return await asyncio.shield(self._light_refresh_task)
+
+    async def _refresh_credentials_social_club_light_once(self):
         # If the user attempts to use the Social Club bearer token within ten hours of having received its latest
         # version, then they may simply make a POST request to
         # https://socialclub.rockstargames.com/connect/refreshaccess in order to get a new bearer token.
-        self._refreshing = True
         old_auth = self._current_sc_token
         headers = {
             "Content-type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -696,8 +878,8 @@ class BackendClient:
         }
         data = f"accessToken={old_auth}"
         try:
-            resp = await self._current_session.post("https://socialclub.rockstargames.com/connect/refreshaccess",
-                                                    data=data, headers=headers, allow_redirects=True)
+            resp = await self._post("https://socialclub.rockstargames.com/connect/refreshaccess",
+                                    data=data, headers=headers, allow_redirects=True)
             await self._update_cookies_from_response(resp)
             filtered_cookies = resp.cookies
             if "BearerToken" in filtered_cookies:
@@ -709,20 +891,20 @@ class BackendClient:
                 if old_auth != self._current_sc_token:
                     log.debug("ROCKSTAR_SC_LIGHT_REFRESH_SUCCESS: The Social Club user was successfully "
                               "re-authenticated!")
-                self._refreshing = False
+                    # The request verification tokens are tied to the old session cookies.
+                    self._rv_token_provider.invalidate_all()
             else:
                 # If a request was made to get a new bearer token but a new token was not granted, then it is assumed
                 # that the alternate longer method for refreshing the user's credentials is required.
                 log.warning("ROCKSTAR_SC_LIGHT_REFRESH_FAILED: The light method for refreshing the Social Club "
                             "user's authentication has failed. Falling back to the strict refresh method...")
-                self._refreshing = False
                 await self.refresh_credentials()
         except aiohttp.ClientResponseError as e:
             if e.status == 401:
                 log.warning("ROCKSTAR_SC_LIGHT_REFRESH_FAILED: The light method for refreshing the Social Club user's "
                             "authentication has failed. Falling back to the strict refresh method...")
-                self._refreshing = False
                 await self.refresh_credentials()
+        return self._current_sc_token
 
     async def _refresh_credentials_social_club(self):
         # There are instances where the bearer token provided by the get-user.json endpoint is insufficient (i.e.,
@@ -754,7 +936,7 @@ class BackendClient:
                 "Cookie": await self.get_cookies_for_headers(),
                 "User-Agent": USER_AGENT
             }
-            resp = await self._current_session.get(url, headers=headers)
+            resp = await self._get(url, headers=headers)
             await self._update_cookies_from_response(resp)
 
             url = "https://signin.rockstargames.com/api/connect/check/socialclub"
@@ -775,7 +957,7 @@ class BackendClient:
             }
             # Using a context manager here will prevent the extra cookies from being sent.
             async with create_client_session() as s:
-                resp = await s.post(url, json=data, headers=headers)
+                resp = await self._post(url, session=s, json=data, headers=headers)
             await self._update_cookies_from_response(resp)
             filtered_cookies = resp.cookies
             if "TS01a305c4" in filtered_cookies:
@@ -803,7 +985,7 @@ class BackendClient:
                 "User-Agent": USER_AGENT,
                 "X-Requested-With": "XMLHttpRequest"
             }
-            resp = await self._current_session.get(url, headers=headers, allow_redirects=False)
+            resp = await self._get(url, headers=headers, allow_redirects=False)
             await self._update_cookies_from_response(resp)
             filtered_cookies = resp.cookies
             for key, morsel in filtered_cookies.items():
@@ -816,15 +998,15 @@ class BackendClient:
                     if old_auth != self._current_sc_token:
                         log.debug("ROCKSTAR_SC_REFRESH_SUCCESS: The Social Club user has been successfully "
                                   "re-authenticated!")
+                        # The request verification tokens are tied to the old session cookies.
+                        self._rv_token_provider.invalidate_all()
                     break
         except aiohttp.ClientConnectorError:
             log.error(f"ROCKSTAR_PLUGIN_OFFLINE: The user is not online.")
-            self._refreshing = False
             raise NetworkError
         except Exception as e:
             log.exception(f"ROCKSTAR_SC_REFRESH_FAILURE: The attempt to re-authenticate the user on the Social Club has"
                           f" failed with the exception {repr(e)}. Logging the user out...")
-            self._refreshing = False
             raise InvalidCredentials
 
     async def authenticate(self):
@@ -861,7 +1043,7 @@ class BackendClient:
             "User-Agent": USER_AGENT
         }
         try:
-            resp_user = await self._current_session.get(url, headers=headers)
+            resp_user = await self._get(url, headers=headers)
             await self._update_cookies_from_response(resp_user)
             resp_user_text = await resp_user.json()
         except Exception as e:
@@ -0,0 +1,171 @@
+import logging as log
+import sys
+
+from time import monotonic
+from typing import Dict, Iterable, Optional
+
+
+class UninstallRegistry:
+    # Reads the InstallLocation values of the subkeys of the Windows Uninstall key. The Windows registry is only one
+    # implementation of this interface, so that the install detection can also be driven by a dictionary elsewhere.
+    def get_install_locations(self, subkey_names: Iterable[str]) -> Dict[str, str]:
+        # Returns a dictionary mapping each of the given subkey names which exists and has an InstallLocation value to
+        # that value. Subkey names are compared case-insensitively, as they are in the registry.
+        raise NotImplementedError()
+
+    def has_changed(self) -> bool:
+        # Returns True if the Uninstall key is known to have changed since the last call to get_install_locations().
+        # Registries which cannot detect changes rely on the TTL of the InstallLocationCache instead.
+        return False
+
+    def close(self):
+        pass
+
+
+class DictUninstallRegistry(UninstallRegistry):
+    # An Uninstall key held in a dictionary of subkey names to their values, for the tests and benchmarks. Changing
+    # the subkeys should be followed by setting changed to True, just as Windows would signal a change.
+    def __init__(self, subkeys: Dict[str, Dict[str, str]]):
+        self.subkeys = subkeys
+        self.changed = True
+
+    def get_install_locations(self, subkey_names: Iterable[str]) -> Dict[str, str]:
+        self.changed = False
+        subkeys = {name.lower(): values for name, values in self.subkeys.items()}
+        install_locations = {}
+        for subkey_name in subkey_names:
+            values = subkeys.get(subkey_name.lower())
+            if values is not None and "InstallLocation" in values:
+                install_locations[subkey_name] = values["InstallLocation"]
+        return install_locations
+
+    def has_changed(self) -> bool:
+        return self.changed
+
+
+if sys.platform == "win32":
+    import ctypes.wintypes
+    import winreg
+
+    REG_NOTIFY_CHANGE_NAME = 0x00000001
+    REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+    WAIT_OBJECT_0 = 0
+
+    class WindowsUninstallRegistry(UninstallRegistry):
+        # Enumerates the subkeys of the Uninstall key in a single pass and only opens the subkeys which are asked for.
+        # Every key is closed once it has been read. Windows is asked to signal an event whenever anything below the
+        # Uninstall key changes, so that the registry only needs to be read again after a change.
+        def __init__(self, root, key_path):
+            self._root = root
+            self._key_path = key_path
+            self._notify_key = None
+            self._notify_armed = False
+            self._advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+            self._advapi32.RegNotifyChangeKeyValue.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.BOOL,
+                                                               ctypes.wintypes.DWORD, ctypes.wintypes.HANDLE,
+                                                               ctypes.wintypes.BOOL]
+            self._advapi32.RegNotifyChangeKeyValue.restype = ctypes.wintypes.LONG
+            self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            self._kernel32.CreateEventW.argtypes = [ctypes.c_void_p, ctypes.wintypes.BOOL, ctypes.wintypes.BOOL,
+                                                    ctypes.wintypes.LPCWSTR]
+            self._kernel32.CreateEventW.restype = ctypes.wintypes.HANDLE
+            self._kernel32.WaitForSingleObject.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+            self._kernel32.WaitForSingleObject.restype = ctypes.wintypes.DWORD
+            self._kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+            self._kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+            self._event = self._kernel32.CreateEventW(None, False, False, None)
+
+        def get_install_locations(self, subkey_names: Iterable[str]) -> Dict[str, str]:
+            self._watch_for_changes()
+            wanted = {subkey_name.lower(): subkey_name for subkey_name in subkey_names}
+            install_locations = {}
+            with winreg.OpenKey(self._root, self._key_path) as uninstall_key:
+                subkey_count, _, _ = winreg.QueryInfoKey(uninstall_key)
+                for i in range(subkey_count):
+                    try:
+                        found_name = winreg.EnumKey(uninstall_key, i)
+                    except OSError:
+                        # A subkey was removed during the enumeration.
+                        break
+                    subkey_name = wanted.get(found_name.lower())
+                    if subkey_name is None:
+                        continue
+                    try:
+                        with winreg.OpenKey(uninstall_key, found_name) as subkey:
+                            install_locations[subkey_name], _ = winreg.QueryValueEx(subkey, "InstallLocation")
+                    except OSError:
+                        continue
+            return install_locations
+
+        def _watch_for_changes(self):
+            # The notification is registered before the registry is read, so that no change can be missed. It must be
+            # registered again after each change.
+            if not self._event or self._notify_armed:
+                return
+            if self._notify_key is None:
+                try:
+                    self._notify_key = winreg.OpenKey(self._root, self._key_path, 0, winreg.KEY_NOTIFY)
+                except OSError:
+                    return
+            result = self._advapi32.RegNotifyChangeKeyValue(self._notify_key.handle, True, REG_NOTIFY_CHANGE_NAME |
+                                                            REG_NOTIFY_CHANGE_LAST_SET, self._event, True)
+            if result == 0:
+                self._notify_armed = True
+            else:
+                log.debug(f"ROCKSTAR_REGISTRY_NOTIFY_ERROR: Registry change notifications are unavailable (Error "
+                          f"Code: {result}).")
+                self._notify_key.Close()
+                self._notify_key = None
+
+        def has_changed(self) -> bool:
+            if self._notify_key is None:
+                return False
+            if not self._notify_armed:
+                return True
+            if self._kernel32.WaitForSingleObject(self._event, 0) == WAIT_OBJECT_0:
+                self._notify_armed = False
+                return True
+            return False
+
+        def close(self):
+            # Closing the key also cancels the pending change notification, so the event can be closed afterwards.
+            if self._notify_key is not None:
+                self._notify_key.Close()
+                self._notify_key = None
+            self._notify_armed = False
+            if self._event:
+                self._kernel32.CloseHandle(self._event)
+                self._event = None
+
+
+class InstallLocationCache:
+    # Resolves the install location of every title at once and keeps the results until the registry reports a change,
+    # or until the TTL expires (in case a change notification is missed).
+    def __init__(self, registry: UninstallRegistry, subkey_names_by_title_id: Dict[str, str], ttl: float):
+        self._registry = registry
+        self._subkey_names_by_title_id = subkey_names_by_title_id
+        self._ttl = ttl
+        self._install_locations: Dict[str, str] = {}
+        self._loaded_at = None
+
+    def close(self):
+        self._registry.close()
+
+    def _refresh_if_needed(self):
+        if (self._loaded_at is not None and monotonic() < self._loaded_at + self._ttl and
+                not self._registry.has_changed()):
+            return
+        try:
+            locations = self._registry.get_install_locations(self._subkey_names_by_title_id.values())
+        except OSError as e:
+            log.warning(f"ROCKSTAR_REGISTRY_ERROR: Reading the Uninstall key resulted in the exception {repr(e)} being "
+                        f"thrown.")
+            locations = {}
+        self._install_locations = {title_id: locations[subkey_name]
+                                   for title_id, subkey_name in self._subkey_names_by_title_id.items()
+                                   if subkey_name in locations}
+        self._loaded_at = monotonic()
+
+    def get(self, title_id: str) -> Optional[str]:
+        self._refresh_if_needed()
+        return self._install_locations.get(title_id)
@@ -0,0 +1,236 @@
+from consts import NoLogFoundException
+
+import dataclasses
+import hashlib
+import logging as log
+import mmap
+import os
+import re
+import threading
+
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+# The identity of a log file includes a hash of (up to) this many bytes from the beginning of the file. The Rockstar
+# Games Launcher only ever appends to its log, so if the beginning of the file changes, then the log has been rotated.
+LOG_HEAD_SIZE = 4096
+
+LOG_STATE_VERSION = 1
+
+# Each log line for a title branch report describes the title id of the game starting at character 65. From there, the
+# title id continues until the first colon, and the rest of the line states whether the title is on a branch (meaning
+# that it is owned) or has no branches (meaning that it is not owned).
+BRANCH_REPORT_PATTERN = re.compile(rb"[^\n]{65}(?P<title>[^:\n]*):[^\n]*?(?:(?P<branch>on branch )|no branches!)")
+
+
+@dataclasses.dataclass
+class LogFileState:
+    size: int = 0
+    mtime: int = 0
+    inode: int = 0
+    head_length: int = 0
+    head_hash: str = ""
+    offset: int = 0
+    # Each title ID maps to (is_owned, byte_offset) for the last branch report of that title in the file.
+    reports: Dict[str, Tuple[bool, int]] = dataclasses.field(default_factory=dict)
+
+
+def parse_log_buffer(buffer, start: int, end: int, reports: Dict[str, Tuple[bool, int]]) -> bool:
+    # Updates reports with the branch reports found in buffer[start:end], which must consist of complete lines. The
+    # buffer is searched as raw bytes, so the lines do not need to be decoded, and an invalid UTF-8 sequence in the log
+    # cannot interrupt the search. Since the buffer is read from the start of the file towards its end, a later report
+    # for a title replaces an earlier one. Returns True if a title was found for the first time or changed ownership.
+    ownership_changed = False
+    position = start
+    while True:
+        # Both kinds of branch reports contain " branch", so bytes.find() (which is much faster than a regular
+        # expression search) is used to skip straight to the lines that might be branch reports.
+        hit = buffer.find(b" branch", position, end)
+        if hit == -1:
+            break
+        line_start = buffer.rfind(b"\n", start, hit) + 1 or start
+        line_end = buffer.find(b"\n", hit, end)
+        if line_end == -1:
+            line_end = end
+        position = line_end + 1
+        match = BRANCH_REPORT_PATTERN.match(buffer, line_start, line_end)
+        if not match:
+            continue
+        is_owned = match.group("branch") is not None
+        if is_owned and buffer.find(b"launcher", line_start, line_end) != -1:
+            continue
+        title_id = match.group("title").strip().decode("utf-8", errors="replace")
+        old_report = reports.get(title_id)
+        if old_report is None or old_report[0] != is_owned:
+            ownership_changed = True
+        reports[title_id] = (is_owned, line_start)
+    return ownership_changed
+
+
+def _read_log_buffer(f, size: int):
+    # Memory-mapping the log lets the search run over the file without copying it. If the file cannot be mapped (for
+    # example, if it is empty), then it is simply read into memory instead.
+    try:
+        return mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        f.seek(0)
+        return f.read(size)
+
+
+class LauncherLogTailer:
+    # Keeps track of how much of each launcher log has already been parsed, along with the branch reports found so
+    # far. On each check, only the bytes which have been appended to a log since the last check are parsed. If a log
+    # file has been replaced (for example, when the launcher rotates launcher.log to launcher.01.log), then its state is
+    # looked up by the file's identity instead of its path, and the file is only parsed from the beginning if it is
+    # truly new.
+    def __init__(self):
+        self._states: Dict[str, LogFileState] = {}
+        self._detached_states: List[LogFileState] = []
+        # Several log files may be checked at once from different threads. The lock guards the states of the log files,
+        # but it is not held while a file is being parsed, since each state can only be claimed by one file at a time.
+        self._lock = threading.Lock()
+        self.changed = False
+
+    def get_reports(self, path: str) -> Tuple[int, Dict[str, Tuple[bool, int]]]:
+        # Returns the modification time of the log file (in nanoseconds), along with its branch reports.
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise NoLogFoundException()
+        # A copy of the reports is returned, since the state's own dictionary is updated again by later checks, which
+        # may run on another thread while the caller is still reading the reports.
+        with self._lock:
+            state = self._states.get(path)
+            if state is not None and (state.size, state.mtime, state.inode) == (stat.st_size, stat.st_mtime_ns,
+                                                                                stat.st_ino):
+                # Nothing has changed since the last check, so the file does not even need to be opened.
+                return state.mtime, dict(state.reports)
+        reports_changed = False
+        with open(path, "rb") as f:
+            with self._lock:
+                state = self._claim_state(path, f, stat)
+            if stat.st_size > state.offset:
+                buffer = _read_log_buffer(f, stat.st_size)
+                try:
+                    # A line which is still being written is left for the next check.
+                    end = buffer.rfind(b"\n", state.offset, stat.st_size) + 1
+                    if end > state.offset:
+                        reports_changed = parse_log_buffer(buffer, state.offset, end, state.reports)
+                        state.offset = end
+                finally:
+                    if isinstance(buffer, mmap.mmap):
+                        buffer.close()
+            if state.head_length < min(LOG_HEAD_SIZE, stat.st_size):
+                state.head_length = min(LOG_HEAD_SIZE, stat.st_size)
+                state.head_hash = self._hash_head(f, state.head_length)
+        state.size, state.mtime, state.inode = stat.st_size, stat.st_mtime_ns, stat.st_ino
+        with self._lock:
+            self._states[path] = state
+            # The saved state only needs to be replaced when the ownership of a title has changed. Otherwise, the saved
+            # state is merely behind the log, and the few bytes which were appended since then are parsed again after
+            # the plugin restarts.
+            if reports_changed:
+                self.changed = True
+            return state.mtime, dict(state.reports)
+
+    def _claim_state(self, path: str, f, stat) -> LogFileState:
+        # Finds the state belonging to the opened file and takes it out of the lookup tables until the file has been
+        # parsed. This must be called while holding the lock.
+        state = self._states.pop(path, None)
+        if state is not None and self._is_same_file(state, f, stat):
+            return state
+        if state is not None:
+            self._detached_states.append(state)
+        state = self._find_moved_state(f, stat)
+        if state is None:
+            log.debug("ROCKSTAR_LOG_RESCAN: A new or rotated log file was found. Parsing it from the beginning...")
+            state = LogFileState()
+        return state
+
+    def finish_pass(self):
+        # States which were not claimed by another path during this pass belong to log files which no longer exist.
+        with self._lock:
+            self._detached_states.clear()
+
+    @staticmethod
+    def _hash_head(f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+    def _is_same_file(self, state: LogFileState, f, stat) -> bool:
+        if stat.st_size < state.offset or stat.st_ino != state.inode:
+            return False
+        return self._hash_head(f, state.head_length) == state.head_hash
+
+    def _find_moved_state(self, f, stat) -> Optional[LogFileState]:
+        for i, state in enumerate(self._detached_states):
+            if state.inode == stat.st_ino and self._is_same_file(state, f, stat):
+                return self._detached_states.pop(i)
+        for path, state in self._states.items():
+            if state.inode == stat.st_ino and self._is_same_file(state, f, stat):
+                return self._states.pop(path)
+        return None
+
+    def get_state(self):
+        with self._lock:
+            self.changed = False
+            return LOG_STATE_VERSION, {path: dataclasses.astuple(state) for path, state in self._states.items()}
+
+    def set_state(self, saved_state):
+        version, states = saved_state
+        if version != LOG_STATE_VERSION:
+            log.debug("ROCKSTAR_LOG_STATE_OUTDATED: The saved launcher log state is from an older version of the "
+                      "plugin. The launcher logs will be parsed from the beginning.")
+            return
+        self._states = {path: LogFileState(*values) for path, values in states.items()}
+
+
+class LauncherLogWatcher:
+    # Decides when the launcher logs need to be read again by comparing cheap stat() signatures of the newest log and
+    # the directory that holds it. The directory's signature changes when the logs are rotated, and the log's signature
+    # changes when the launcher writes to it. A burst of writes is only reported once it has settled for the debounce
+    # time, but a log which is written to constantly is still reported after the maximum delay.
+    def __init__(self, debounce: float, max_delay: float):
+        self._debounce = debounce
+        self._max_delay = max_delay
+        self._signature = None
+        self._checked_signature = None
+        self._last_change = None
+        self._pending_since = None
+
+    @staticmethod
+    def _get_signature(path: str):
+        signature = []
+        for stat_path in (os.path.dirname(path), path):
+            try:
+                stat = os.stat(stat_path)
+                signature.append((stat.st_size, stat.st_mtime_ns, stat.st_ino))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def poll(self, path: str) -> bool:
+        # Returns True if the logs have changed since they were last checked. The change is considered to be handled
+        # once it has been reported.
+        now = monotonic()
+        signature = self._get_signature(path)
+        if signature == self._checked_signature:
+            self._signature = signature
+            self._pending_since = None
+            return False
+        if signature != self._signature:
+            self._signature = signature
+            self._last_change = now
+            if self._pending_since is None:
+                self._pending_since = now
+        if (self._checked_signature is not None and now - self._last_change < self._debounce and
+                now - self._pending_since < self._max_delay):
+            return False
+        self.mark_checked(path, signature)
+        return True
+
+    def mark_checked(self, path: str, signature=None):
+        # This should be called before the logs are read for some other reason, so that the watcher does not report the
+        # same change again.
+        self._signature = self._checked_signature = signature or self._get_signature(path)
+        self._pending_since = None
@@ -4,26 +4,36 @@ import logging as log
 import subprocess
 import asyncio
 
-from galaxy.proc_tools import pids
-
-from consts import WINDOWS_UNINSTALL_KEY, LOG_SENSITIVE_DATA, CONFIG_OPTIONS
+from consts import WINDOWS_UNINSTALL_KEY, LOG_SENSITIVE_DATA, CONFIG_OPTIONS, INSTALL_LOCATION_CACHE_TTL, \
+    DIRECTORY_SIZE_WORKERS, DIRECTORY_SIZE_INDEX_MAX_AGE
+from directory_size import DirectorySizeIndex
 from game_cache import games_cache
+from install_registry import InstallLocationCache, WindowsUninstallRegistry
+from process_query import ProcessSnapshot, take_process_snapshot
 
 
-def check_if_process_exists(pid):
+def check_if_process_exists(pid, snapshot: Optional[ProcessSnapshot] = None):
     if not pid:
         return False
-    if int(pid) in pids():
-        return True
-    return False
+    if snapshot is None:
+        snapshot = take_process_snapshot()
+    return pid in snapshot
 
 
 class LocalClient:
     def __init__(self):
         self.root_reg = ConnectRegistry(None, HKEY_LOCAL_MACHINE)
+        self._install_locations = InstallLocationCache(
+            WindowsUninstallRegistry(self.root_reg, WINDOWS_UNINSTALL_KEY),
+            {title_id: game['guid'] for title_id, game in games_cache.items()}, INSTALL_LOCATION_CACHE_TTL)
+        self.size_index = DirectorySizeIndex(DIRECTORY_SIZE_INDEX_MAX_AGE)
         self.installer_location = None
         self.get_local_launcher_path()
 
+    def close(self):
+        self._install_locations.close()
+        CloseKey(self.root_reg)
+
     def get_local_launcher_path(self):
         try:
             if CONFIG_OPTIONS['rockstar_launcher_path_override']:
@@ -50,54 +60,37 @@ class LocalClient:
         subprocess.Popen("taskkill /im SocialClubHelper.exe")
 
     def get_path_to_game(self, title_id):
-        try:
-            key = OpenKey(self.root_reg, WINDOWS_UNINSTALL_KEY + games_cache[title_id]['guid'])
-            dir, type = QueryValueEx(key, "InstallLocation")
-            return dir
-        except WindowsError:
-            # log.debug("ROCKSTAR_GAME_NOT_INSTALLED: The game with ID " + title_id + " is not installed.") - Reduce
-            # Console Spam (Enable this if you need to.)
-            return None
+        # The install locations of all of the games are read from the registry at once, and they are only read again
+        # once the registry has changed.
+        return self._install_locations.get(title_id)
 
     async def get_game_size_in_bytes(self, title_id) -> Optional[int]:
         path = self.get_path_to_game(title_id)
-        # We will add quotes if they are not present already.
-        if path[:1] != '"':
-            path = f'"{path}"'
-        find_game_size = subprocess.Popen(
-            f'chcp 65001 & dir {path} /a /s /-c', stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        output, err = find_game_size.communicate()
-
-        # The file size will be listed in the second-to-last line of the output.
-        line_list = output.decode().splitlines()
-        game_size_line = line_list[len(line_list) - 2]
         size = None
-        if "bytes" in game_size_line:
-            size = int([str(s) for s in game_size_line.split() if s.isdigit()][1])
+        if path:
+            # The directory tree is walked on a thread pool (see directory_size.py), so the event loop is not blocked.
+            # Only the directories which have changed since the last walk are listed again.
+            path = path.replace('"', '')
+            try:
+                size = await asyncio.get_running_loop().run_in_executor(None, self.size_index.get_size, path,
+                                                                        DIRECTORY_SIZE_WORKERS)
+            except OSError as e:
+                log.debug(f"ROCKSTAR_GAME_SIZE_ERROR: Walking the install folder of {title_id} resulted in the "
+                          f"exception {repr(e)} being thrown.")
         if size:
             log.debug(f"ROCKSTAR_GAME_SIZE: The size of {title_id} is {size} bytes.")
         else:
             log.warning(f"ROCKSTAR_GAME_SIZE_FAILURE: The size of {title_id} could not be determined!")
         return size
 
-    async def game_pid_from_tasklist(self, title_id) -> str:
-        pid = None
+    @staticmethod
+    def get_game_pid(title_id, snapshot: Optional[ProcessSnapshot] = None) -> Optional[int]:
+        # The process table is read inside of the plugin (see process_query.py), so there is no need to run tasklist and
+        # parse its output.
         tracked_key = "trackEXE" if "trackEXE" in games_cache[title_id] else "launchEXE"
-        # When reading output from the Windows Command Prompt, it is a good idea to first set the code page to one that
-        # is used by the application. In this case, "chcp 65001" is sent to change the code page to Unicode, which is
-        # what Python uses. Changes to the code page in this manner are temporary, so it should be sent along with the
-        # desired command in one call to subprocess.Popen() (such as by using "&"). The "shell" parameter must also be
-        # set to "True."
-        find_actual_pid = subprocess.Popen(
-            f'chcp 65001 & tasklist /FI "IMAGENAME eq {games_cache[title_id][tracked_key]} " /FI "STATUS eq running" '
-            f'/FO LIST', stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        output, err = find_actual_pid.communicate()
-
-        for line in output.decode().splitlines():
-            if "PID" in line:
-                pid = [str(s) for s in line.split() if s.isdigit()][0]
-                break
-        return pid
+        if snapshot is None:
+            snapshot = take_process_snapshot()
+        return snapshot.find_pid_by_image_name(games_cache[title_id][tracked_key])
 
     async def launch_game_from_title_id(self, title_id):
         path = self.get_path_to_game(title_id)
@@ -118,7 +111,7 @@ class LocalClient:
         retries = 120
         while not launcher_pid:
             await asyncio.sleep(1)
-            launcher_pid = await self.game_pid_from_tasklist("launcher")
+            launcher_pid = self.get_game_pid("launcher")
             retries -= 1
             if retries == 0:
                 log.debug("ROCKSTAR_LAUNCHER_PID_FAILURE: The Rockstar Games Launcher took too long to launch!")
@@ -129,7 +122,7 @@ class LocalClient:
         retries = 30
         while True:
             await asyncio.sleep(1)
-            pid = await self.game_pid_from_tasklist(title_id)
+            pid = self.get_game_pid(title_id)
             if pid:
                 return pid
             retries -= 1
@@ -137,7 +130,7 @@ class LocalClient:
                 # If it has been this long and the game still has not launched, then it might be downloading an update.
                 # We should refresh the retries counter if the Rockstar Games Launcher is still running; otherwise, we
                 # return None.
-                if await self.game_pid_from_tasklist("launcher"):
+                if self.get_game_pid("launcher"):
                     log.debug(f"ROCKSTAR_LAUNCH_WAITING: The game {title_id} has not launched yet, but the Rockstar "
                               f"Games Launcher is still running. Restarting the loop...")
                     retries += 30
@@ -1,12 +1,11 @@
 from galaxy.api.plugin import Plugin, create_and_run_plugin
 from galaxy.api.consts import Platform, PresenceState
-from galaxy.api.types import NextStep, Authentication, Game, LocalGame, LocalGameState, UserInfo, Achievement, \
-    GameTime, UserPresence
+from galaxy.api.types import NextStep, Authentication, Game, LocalGame, LocalGameState, UserInfo, GameTime, \
+    UserPresence
 from galaxy.api.errors import InvalidCredentials, AuthenticationRequired, NetworkError, UnknownError
 
-from file_read_backwards import FileReadBackwards
 from time import time
-from typing import List, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import asyncio
 import dataclasses
 import datetime
@@ -17,16 +16,29 @@ import re
 import sys
 import webbrowser
 
-from consts import AUTH_PARAMS, NoGamesInLogException, NoLogFoundException, IS_WINDOWS, LOG_SENSITIVE_DATA, \
-    ARE_ACHIEVEMENTS_IMPLEMENTED, CONFIG_OPTIONS, get_unix_epoch_time_from_date
+from consts import AUTH_PARAMS, NoLogFoundException, IS_WINDOWS, LOG_SENSITIVE_DATA, \
+    ARE_ACHIEVEMENTS_IMPLEMENTED, CONFIG_OPTIONS, PRESENCE_CACHE_TTL, PRESENCE_CACHE_MAX_SIZE, \
+    ACHIEVEMENTS_CACHE_MAX_AGE, LOG_WATCH_INTERVAL, LOG_WATCH_DEBOUNCE, LOG_WATCH_MAX_DELAY, \
+    PROCESS_RECONCILIATION_INTERVAL, GAME_TIME_JOURNAL_MAX_RECORDS, GAME_TIME_CHECKPOINT_INTERVAL, \
+    SCHEDULER_MAX_CONCURRENT_JOBS, ONLINE_GAMES_CHECK_INTERVAL, ONLINE_GAMES_CHECK_MAX_INTERVAL, \
+    ONLINE_GAMES_CHECK_JITTER, LOG_WATCH_MAX_INTERVAL, LOG_WATCH_JITTER, GAME_STATUS_CHECK_INTERVAL, \
+    GAME_STATUS_CHECK_MAX_INTERVAL, GAME_STATUS_CHECK_ACTIVE_INTERVAL, GAME_STATUS_CHECK_JITTER, \
+    get_unix_epoch_time_from_date
+from achievements_cache import AchievementsCache
+from friends_cache import FriendsCache
+from game_time_journal import GameTimeJournal, apply_session, dumps_snapshot, loads_snapshot
 from game_cache import games_cache, get_game_title_id_from_ros_title_id, get_achievement_id_from_ros_title_id, \
     ignore_game_title_ids_list
 from http_client import BackendClient
+from launcher_log import LauncherLogTailer, LauncherLogWatcher
+from presence_cache import PresenceCache
+from scheduler import JobScheduler, ScheduledJob
 from version import __version__
 
 if IS_WINDOWS:
     import ctypes.wintypes
     from local import LocalClient, check_if_process_exists
+    from process_query import ProcessSnapshot, take_process_snapshot, wait_for_process_exit
 
 
 @dataclasses.dataclass
@@ -51,6 +63,25 @@ class RunningGameInfo(object):
         self._start_time = datetime.datetime.now().timestamp()
 
 
+async def gather_limited(keys: List[Any], get_result: Callable[[Any], Awaitable[Any]],
+                         concurrency: int) -> Dict[Any, Any]:
+    # Runs get_result(key) for every key, with at most concurrency of them running at once, and returns a dictionary
+    # mapping each key to its result. A failure for one key should not prevent the results for the other keys from
+    # being used, so the exception is returned as that key's result instead. A cancelled request is not a failure of
+    # that key, though, so the cancellation is passed on.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get_result_limited(key):
+        async with semaphore:
+            return await get_result(key)
+
+    results = await asyncio.gather(*[get_result_limited(key) for key in keys], return_exceptions=True)
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+    return dict(zip(keys, results))
+
+
 class RockstarPlugin(Plugin):
     def __init__(self, reader, writer, token):
         super().__init__(Platform.Rockstar, __version__, reader, writer, token)
@@ -58,22 +89,50 @@ class RockstarPlugin(Plugin):
         self._http_client = BackendClient(self.store_credentials)
         self._local_client = None
         self.total_games_cache = self.create_total_games_cache()
-        self.friends_cache = []
-        self.presence_cache = {}
+        self.friends_cache = FriendsCache()
+        # The friends on each page after the first, as they were last received. If the first page fails, then the whole
+        # cached list is used instead, so it is not stored here.
+        self.friends_page_cache = {}
+        self._friends_imported = False
+        self.achievements_cache = AchievementsCache(ACHIEVEMENTS_CACHE_MAX_AGE)
+        self.presence_cache = PresenceCache(PRESENCE_CACHE_TTL[CONFIG_OPTIONS['user_presence_mode']],
+                                            PRESENCE_CACHE_MAX_SIZE)
         self.owned_games_cache = []
-        self.last_online_game_check = time() - 300
         self.local_games_cache = {}
         self.game_time_cache = {}
+        self._log_tailer = LauncherLogTailer()
+        self._log_watcher = LauncherLogWatcher(LOG_WATCH_DEBOUNCE, LOG_WATCH_MAX_DELAY)
+        self._owned_games_lock = asyncio.Lock()
         self.running_games_info_list = {}
+        self._exit_watchers = {}
+        self._last_process_reconciliation = 0
         self.game_is_loading = True
-        self.checking_for_new_games = False
-        self.updating_game_statuses = False
+        self._launching_games = 0
+        self._scheduler = JobScheduler(self.is_busy, SCHEDULER_MAX_CONCURRENT_JOBS)
+        self._scheduler.add_job(ScheduledJob("check_for_new_games_online", self.check_for_new_games_online,
+                                             ONLINE_GAMES_CHECK_INTERVAL, max_interval=ONLINE_GAMES_CHECK_MAX_INTERVAL,
+                                             jitter=ONLINE_GAMES_CHECK_JITTER, priority=1))
         self.buffer = None
+        self._game_time_journal = None
         if IS_WINDOWS:
             self._local_client = LocalClient()
             self.buffer = ctypes.create_unicode_buffer(ctypes.wintypes.MAX_PATH)
             ctypes.windll.shell32.SHGetFolderPathW(None, 5, None, 0, self.buffer)
             self.documents_location = self.buffer.value
+            # For the sake of convenience, the game time files are stored in the user's Documents folder.
+            self._game_time_journal = GameTimeJournal(
+                os.path.join(self.documents_location, "RockstarPlayTimeCache.txt"),
+                os.path.join(self.documents_location, "RockstarPlayTimeJournal.txt"), GAME_TIME_JOURNAL_MAX_RECORDS)
+            self._scheduler.add_job(ScheduledJob("checkpoint_game_times", self.checkpoint_game_times,
+                                                 GAME_TIME_CHECKPOINT_INTERVAL, local=True))
+            self._scheduler.add_job(ScheduledJob("check_launcher_logs", self.check_launcher_logs, LOG_WATCH_INTERVAL,
+                                                 max_interval=LOG_WATCH_MAX_INTERVAL, jitter=LOG_WATCH_JITTER,
+                                                 priority=2))
+            self._scheduler.add_job(ScheduledJob("check_game_statuses", self.check_game_statuses,
+                                                 GAME_STATUS_CHECK_INTERVAL,
+                                                 max_interval=GAME_STATUS_CHECK_MAX_INTERVAL,
+                                                 active_interval=GAME_STATUS_CHECK_ACTIVE_INTERVAL,
+                                                 jitter=GAME_STATUS_CHECK_JITTER, priority=3, local=True))
 
     def is_authenticated(self):
         return self._http_client.is_authenticated()
@@ -84,31 +143,45 @@ class RockstarPlugin(Plugin):
             return f.read()
 
     def handshake_complete(self):
-        game_time_cache_in_persistent_cache = False
+        cached_game_time_snapshot = None
         for key, value in self.persistent_cache.items():
-            # if "achievements_" in key:
-                # log.debug("ROCKSTAR_CACHE_IMPORT: Importing " + key + " from persistent cache...")
-                # self._all_achievements_cache[key] = pickle.loads(bytes.fromhex(value))
+            if key == "achievements_cache":
+                log.debug("ROCKSTAR_CACHE_IMPORT: Importing " + key + " from persistent cache...")
+                # A cache which cannot be read only means that the achievements are imported from the Social Club again.
+                try:
+                    self.achievements_cache.set_state(value)
+                except Exception as e:
+                    log.error(f"ROCKSTAR_ACHIEVEMENTS_CACHE_ERROR: Reading the saved achievements cache resulted in "
+                              f"the exception {repr(e)} being thrown. Ignoring it...")
             if key == "game_time_cache":
-                self.game_time_cache = pickle.loads(bytes.fromhex(value))
-                game_time_cache_in_persistent_cache = True
-        if IS_WINDOWS and not game_time_cache_in_persistent_cache:
-            # The game time cache was not found in the persistent cache, so the plugin will instead attempt to get the
-            # cache from the user's file stored on their disk.
-            file_location = os.path.join(self.documents_location, "RockstarPlayTimeCache.txt")
-            try:
-                file = open(file_location, "r")
-                for line in file.readlines():
-                    if line[:1] != "#":
-                        log.debug("ROCKSTAR_LOCAL_GAME_TIME_FROM_FILE: " + str(pickle.loads(bytes.fromhex(line))))
-                        self.game_time_cache = pickle.loads(bytes.fromhex(line))
-                        break
-                if not self.game_time_cache:
-                    log.warning("ROCKSTAR_NO_GAME_TIME: The user's played time could not be found in neither the "
-                                "persistent cache nor the designated local file. Let's hope that the user is new...")
-            except FileNotFoundError:
-                log.warning("ROCKSTAR_NO_GAME_TIME: The user's played time could not be found in neither the persistent"
-                            " cache nor the designated local file. Let's hope that the user is new...")
+                # A snapshot which cannot be read is ignored, so that the game time is rebuilt from the snapshot file
+                # and the journal (if there are any) instead of the plugin failing to start.
+                try:
+                    cached_game_time_snapshot = loads_snapshot(value)
+                except Exception as e:
+                    log.error(f"ROCKSTAR_GAME_TIME_SNAPSHOT_ERROR: Reading the cached game time snapshot resulted in "
+                              f"the exception {repr(e)} being thrown. Ignoring it...")
+                else:
+                    self.game_time_cache = cached_game_time_snapshot[1]
+            if key == "launcher_log_state":
+                # A state which cannot be read only means that the launcher logs are parsed from the beginning.
+                try:
+                    self._log_tailer.set_state(pickle.loads(bytes.fromhex(value)))
+                except Exception as e:
+                    log.error(f"ROCKSTAR_LOG_STATE_ERROR: Reading the saved launcher log state resulted in the "
+                              f"exception {repr(e)} being thrown. Ignoring it...")
+            if key == "directory_size_index" and IS_WINDOWS:
+                self._local_client.size_index.set_state(value)
+        if IS_WINDOWS:
+            # The game time cache is also saved in the user's Documents folder, along with a journal of the sessions
+            # which were played since it was saved. The newer of the two saved caches is used, and then the sessions
+            # from the journal are added to it.
+            self.game_time_cache = self._game_time_journal.load(cached_game_time_snapshot)
+            if LOG_SENSITIVE_DATA:
+                log.debug("ROCKSTAR_LOCAL_GAME_TIME: " + str(self.game_time_cache))
+        if not self.game_time_cache:
+            log.warning("ROCKSTAR_NO_GAME_TIME: The user's played time could not be found in neither the persistent "
+                        "cache nor the designated local file. Let's hope that the user is new...")
 
     async def authenticate(self, stored_credentials=None):
         try:
@@ -209,17 +282,20 @@ class RockstarPlugin(Plugin):
     async def shutdown(self):
         # At this point, we can write to a file to keep a cached copy of the user's played time.
         # This will prevent the play time from being erased if the user loses authentication.
-        if IS_WINDOWS and self.game_time_cache:
-            # For the sake of convenience, we will store this file in the user's Documents folder.
-            # Obviously, this feature is only compatible with (and relevant for) Windows machines.
-            file_location = os.path.join(self.documents_location, "RockstarPlayTimeCache.txt")
-            file = open(file_location, "w+")
-            file.write("# This file contains a cached copy of the user's play time for the Rockstar plugin for GOG "
-                       "Galaxy 2.0.\n")
-            file.write("# DO NOT EDIT THIS FILE IN ANY WAY, LEST THE CACHE GETS CORRUPTED AND YOUR PLAY TIME IS LOST!\n"
-                       )
-            file.write(pickle.dumps(self.game_time_cache).hex())
-            file.close()
+        if IS_WINDOWS:
+            # The time played in the games which are still running is recorded first, since it would otherwise be
+            # lost. Obviously, this feature is only compatible with (and relevant for) Windows machines.
+            for title_id, info in list(self.running_games_info_list.items()):
+                if info.get_pid():
+                    self.record_play_time(title_id)
+            if self.game_time_cache:
+                self._game_time_journal.compact(self.game_time_cache)
+        for watcher in list(self._exit_watchers.values()):
+            watcher.cancel()
+        self._scheduler.cancel()
+        if IS_WINDOWS:
+            self._local_client.close()
+        log.debug(f"ROCKSTAR_JOB_STATS: {self._scheduler.get_stats()}")
         await self._http_client.close()
         await super().shutdown()
 
@@ -229,33 +305,69 @@ class RockstarPlugin(Plugin):
             cache.append(self.create_game_from_title_id(title_id))
         return cache
 
+    if ARE_ACHIEVEMENTS_IMPLEMENTED:
+        async def prepare_achievements_context(self, game_ids: List[str]) -> Any:
+            # Rather than requesting each game's achievements as Galaxy asks for them, the achievements of every game
+            # are fetched here at once, with at most achievements_request_concurrency requests in flight. Each call to
+            # get_unlocked_achievements then reads its result (or raises its exception) from the returned dictionary.
+            return await gather_limited(game_ids, self._get_unlocked_achievements,
+                                        CONFIG_OPTIONS['achievements_request_concurrency'])
+
     if ARE_ACHIEVEMENTS_IMPLEMENTED:
         async def get_unlocked_achievements(self, game_id, context):
-            # The Social Club API has an authentication endpoint located at https://scapi.rockstargames.com/
-            # achievements/awardedAchievements?title=[game-id]&platform=pc&rockstarId=[rockstar-ID], which returns a
-            # list of the user's unlocked achievements for the specified game. It uses the Social Club standard for
-            # authentication (a request header named Authorization containing "Bearer [Bearer-Token]").
+            if context is not None and game_id in context:
+                achievements = context[game_id]
+                if isinstance(achievements, BaseException):
+                    raise achievements
+                return achievements
+            return await self._get_unlocked_achievements(game_id)
 
-            title_id = get_game_title_id_from_ros_title_id(game_id)
-            if games_cache[title_id]["achievementId"] is None or \
-                    (games_cache[title_id]["isPreOrder"]):
-                return []
-            log.debug("ROCKSTAR_ACHIEVEMENT_CHECK: Beginning achievements check for " +
-                      title_id + " (Achievement ID: " + get_achievement_id_from_ros_title_id(game_id) + ")...")
-            # Now, we can begin getting the user's achievements for the specified game.
-            achievement_id = get_achievement_id_from_ros_title_id(game_id)
-            url = (f"https://scapi.rockstargames.com/achievements/awardedAchievements?title={achievement_id}"
-                   f"&platform=pc&rockstarId={self._http_client.get_rockstar_id()}")
+    if ARE_ACHIEVEMENTS_IMPLEMENTED:
+        def achievements_import_complete(self):
+            if self.achievements_cache.changed:
+                self.persistent_cache['achievements_cache'] = self.achievements_cache.get_state()
+                self.push_cache()
+
+    async def _get_unlocked_achievements(self, game_id):
+        # The Social Club API has an authentication endpoint located at https://scapi.rockstargames.com/
+        # achievements/awardedAchievements?title=[game-id]&platform=pc&rockstarId=[rockstar-ID], which returns a
+        # list of the user's unlocked achievements for the specified game. It uses the Social Club standard for
+        # authentication (a request header named Authorization containing "Bearer [Bearer-Token]").
+
+        title_id = get_game_title_id_from_ros_title_id(game_id)
+        if games_cache[title_id]["achievementId"] is None or \
+                (games_cache[title_id]["isPreOrder"]):
+            return []
+        # Achievements which were fetched recently (possibly in the previous session) are read from the cache instead.
+        rockstar_id = self._http_client.get_rockstar_id()
+        cached_achievements = self.achievements_cache.get_fresh(rockstar_id, title_id)
+        if cached_achievements is not None:
+            log.debug("ROCKSTAR_ACHIEVEMENT_CACHE_HIT: Using the cached achievements for " + title_id + "...")
+            return cached_achievements
+        log.debug("ROCKSTAR_ACHIEVEMENT_CHECK: Beginning achievements check for " +
+                  title_id + " (Achievement ID: " + get_achievement_id_from_ros_title_id(game_id) + ")...")
+        # Now, we can begin getting the user's achievements for the specified game.
+        achievement_id = get_achievement_id_from_ros_title_id(game_id)
+        url = (f"https://scapi.rockstargames.com/achievements/awardedAchievements?title={achievement_id}"
+               f"&platform=pc&rockstarId={rockstar_id}")
+        try:
             unlocked_achievements = await self._http_client.get_json_from_request_strict(url)
-            achievements_dict = unlocked_achievements["awardedAchievements"]
-            achievements_list = []
-            for key, value in achievements_dict.items():
-                # What if an achievement is added to the Social Club after the cache was already made? In this event, we
-                # need to refresh the cache.
-                achievement_num = key
-                unlock_time = await get_unix_epoch_time_from_date(value["dateAchieved"])
-                achievements_list.append(Achievement(unlock_time, achievement_id=achievement_num))
-            return achievements_list
+        except (AuthenticationRequired, InvalidCredentials):
+            raise
+        except Exception as e:
+            # If the Social Club cannot be reached, then the cached achievements are better than none at all.
+            cached_achievements = self.achievements_cache.get(rockstar_id, title_id)
+            if cached_achievements is None:
+                raise
+            log.warning(f"ROCKSTAR_ACHIEVEMENTS_STALE: Getting the achievements for {title_id} resulted in the "
+                        f"exception {repr(e)} being thrown. Using the cached achievements instead...")
+            return cached_achievements
+        achievements_dict = unlocked_achievements["awardedAchievements"]
+        # What if an achievement is added to the Social Club after the cache was already made? In this event, only the
+        # new achievement is added to the cache.
+        unlocks = {achievement_id: get_unix_epoch_time_from_date(value["dateAchieved"])
+                   for achievement_id, value in achievements_dict.items()}
+        return self.achievements_cache.merge(rockstar_id, title_id, unlocks)
 
     async def get_friends(self) -> List[UserInfo]:
         # The Social Club website returns a list of the current user's friends through the url
@@ -274,32 +386,67 @@ class RockstarPlugin(Plugin):
         except TimeoutError:
             log.warning("ROCKSTAR_FRIENDS_TIMEOUT: The request to get the user's friends at page index 0 timed out. "
                         "Returning the cached list...")
-            return self.friends_cache
+            return self.friends_cache.values()
         if LOG_SENSITIVE_DATA:
             log.debug("ROCKSTAR_FRIENDS_REQUEST: " + str(current_page))
         else:
             log.debug("ROCKSTAR_FRIENDS_REQUEST: ***")
         num_friends = current_page['rockstarAccountList']['totalFriends']
-        num_pages_required = num_friends / 30 if num_friends % 30 != 0 else (num_friends / 30) - 1
+        num_pages = (num_friends + 29) // 30
 
         # Now, we need to get the information about the friends.
         friends_list = current_page['rockstarAccountList']['rockstarAccounts']
         return_list = await self._parse_friends(friends_list)
 
-        # The first page is finished, but now we need to work on any remaining pages.
-        if num_pages_required > 0:
-            for i in range(1, int(num_pages_required + 1)):
-                try:
-                    url = ("https://scapi.rockstargames.com/friends/getFriendsFiltered?onlineService=sc&nickname=&"
-                           "pageIndex=" + str(i) + "&pageSize=30")
-                    for friend in await self._get_friends(url):
-                        return_list.append(friend)
-                except TimeoutError:
-                    log.warning(f"ROCKSTAR_FRIENDS_TIMEOUT: The request to get the user's friends at page index {i} "
-                                f"timed out. Returning the cached list...")
-                    return self.friends_cache
+        # The first page is finished, but now we need to work on any remaining pages. These are requested concurrently,
+        # with at most friends_request_concurrency requests in flight, and then merged back together in order.
+        complete_list = True
+        pages = await gather_limited(list(range(1, num_pages)), self._get_friends_page,
+                                     CONFIG_OPTIONS['friends_request_concurrency'])
+        for page_index, page in pages.items():
+            if isinstance(page, (AuthenticationRequired, InvalidCredentials)):
+                raise page
+            if isinstance(page, BaseException):
+                # A single failed page should not cause the rest of the friends list to be thrown away, so we will use
+                # whatever was last returned for this page instead.
+                log.warning(f"ROCKSTAR_FRIENDS_PAGE_FAILURE: The request to get the user's friends at page index "
+                            f"{page_index} failed with the exception {repr(page)}. Using the cached page instead...")
+                complete_list = False
+                page = self.friends_page_cache.get(page_index, [])
+            return_list.extend(page)
+        self._update_friends_cache(return_list, complete_list)
         return return_list
 
+    async def _get_friends_page(self, page_index: int) -> List[UserInfo]:
+        url = ("https://scapi.rockstargames.com/friends/getFriendsFiltered?onlineService=sc&nickname=&"
+               f"pageIndex={page_index}&pageSize=30")
+        friends = await self._get_friends(url)
+        self.friends_page_cache[page_index] = friends
+        return friends
+
+    def _update_friends_cache(self, friends: List[UserInfo], complete_list: bool):
+        # Friends who were removed on the Social Club can only be detected if every page of the friends list was
+        # received; otherwise, the friends on a missing page would be mistaken for removed friends.
+        if complete_list:
+            added, changed, removed = self.friends_cache.replace(friends)
+        else:
+            (added, changed), removed = self.friends_cache.merge(friends), []
+        # Galaxy receives the first friends list as the return value of get_friends, so only the changes after it are
+        # sent as notifications. A user without any friends still completes the first import, so that their first new
+        # friend is sent.
+        if not self._friends_imported:
+            self._friends_imported = True
+            return
+        for user_id in removed:
+            log.debug(f"ROCKSTAR_FRIEND_REMOVED: Removing the friend with Rockstar ID "
+                      f"{user_id if LOG_SENSITIVE_DATA else '***'}...")
+            self.remove_friend(user_id)
+        for friend in added:
+            self.add_friend(friend)
+        # A friend who changed their display name keeps their Rockstar ID, so they are updated rather than added again.
+        for friend in changed:
+            self.update_friend_info(friend)
+
     async def _get_friends(self, url: str) -> List[UserInfo]:
         try:
             current_page = await self._http_client.get_json_from_request_strict(url)
@@ -318,11 +465,6 @@ class RockstarPlugin(Plugin):
                               avatar_url=avatar_uri,
                               profile_url=profile_uri)
             return_list.append(friend)
-            for cached_friend in self.friends_cache:
-                if cached_friend.user_id == friend.user_id:
-                    break
-            else:  # An else-statement occurs after a for-statement if the latter finishes WITHOUT breaking.
-                self.friends_cache.append(friend)
             if LOG_SENSITIVE_DATA:
                 log.debug("ROCKSTAR_FRIEND: Found " + friend.user_name + " (Rockstar ID: " +
                           str(friend.user_id) + ")")
@@ -334,7 +476,6 @@ class RockstarPlugin(Plugin):
         # Get the list of games_played from https://socialclub.rockstargames.com/ajax/getGoogleTagManagerSetupData.
         owned_title_ids = []
         online_check_success = True
-        self.last_online_game_check = time()
         try:
             played_games = await self._http_client.get_played_games()
             for game in played_games:
@@ -347,6 +488,13 @@ class RockstarPlugin(Plugin):
         return owned_title_ids, online_check_success
 
     async def get_owned_games(self, owned_title_ids=None, online_check_success=False):
+        # The owned games may be checked by Galaxy, by the online check, and by the launcher log check, all at the same
+        # time. The checks are run one at a time, since they share the launcher log tailer, and a log rotation that one
+        # check has seen would otherwise be forgotten when another check finishes its pass over the logs.
+        async with self._owned_games_lock:
+            return await self._get_owned_games(owned_title_ids, online_check_success)
+
+    async def _get_owned_games(self, owned_title_ids, online_check_success):
         # Here is the actual implementation of getting the user's owned games:
         # -Get the list of games_played from rockstargames.com/auth/get-user.json.
         #   -If possible, use the launcher log to confirm which games are actual launcher games and which are
@@ -357,43 +505,55 @@ class RockstarPlugin(Plugin):
         if not self.is_authenticated():
             raise AuthenticationRequired()
 
-        # The log is in the Documents folder.
-        current_log_count = 0
-        log_file = None
-        log_file_append = ""
-        # The Rockstar Games Launcher generates 10 log files before deleting them in a FIFO fashion. Old log files are
-        # given a number ranging from 1 to 9 in their name. In case the first log file does not have all of the games,
-        # we need to check the other log files, if possible.
-        while current_log_count < 10:
-            # We need to prevent the log file check for Mac users.
-            if not IS_WINDOWS:
-                break
-            try:
-                if current_log_count != 0:
-                    log_file_append = ".0" + str(current_log_count)
-                log_file = os.path.join(self.documents_location, "Rockstar Games\\Launcher\\launcher" + log_file_append
-                                        + ".log")
+        # The log is in the Documents folder. The Rockstar Games Launcher generates 10 log files before deleting them in
+        # a FIFO fashion. Old log files are given a number ranging from 1 to 9 in their name. In case the first log file
+        # does not have all of the games, we need to check the other log files, if possible. Reports from newer log
+        # files take precedence over reports from older ones.
+        # We need to subtract 1 to account for the Launcher.
+        total_games_count = len(games_cache) + len(ignore_game_title_ids_list) - 1
+        log_reports = {}
+        # We need to prevent the log file check for Mac users.
+        if IS_WINDOWS:
+            # The log files are read on a thread pool, so that the event loop is not blocked while they are read.
+            # Parsing a log holds the GIL, so the logs are mostly parsed one after another, but reading one log from the
+            # disk can overlap with parsing another.
+            log_files = [self.get_launcher_log_path(current_log_count) for current_log_count in range(0, 10)]
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(*[loop.run_in_executor(None, self._log_tailer.get_reports, log_file)
+                                             for log_file in log_files], return_exceptions=True)
+            file_reports_list = []
+            for log_file, result in zip(log_files, results):
                 if LOG_SENSITIVE_DATA:
                     log.debug("ROCKSTAR_LOG_LOCATION: Checking the file " + log_file + "...")
                 else:
                     log.debug("ROCKSTAR_LOG_LOCATION: Checking the file ***...")  # The path to the Launcher log file
                     # likely contains the user's PC profile name (C:\Users\[Name]\Documents...).
-                owned_title_ids = await self.parse_log_file(log_file, owned_title_ids, online_check_success)
-                break
-            except NoGamesInLogException:
-                log.warning("ROCKSTAR_LOG_WARNING: There are no owned games listed in " + str(log_file) + ". Moving to "
-                            "the next log file...")
-                current_log_count += 1
-            except NoLogFoundException:
-                log.warning("ROCKSTAR_LAST_LOG_REACHED: There are no more log files that can be found and/or read "
-                            "from. Assuming that the online list is correct...")
-                break
-            except Exception:
-                # This occurs after ROCKSTAR_LOG_ERROR.
-                break
-        if current_log_count == 10:
-            log.warning("ROCKSTAR_LAST_LOG_REACHED: There are no more log files that can be found and/or read "
-                        "from. Assuming that the online list is correct...")
+                if isinstance(result, NoLogFoundException):
+                    log.warning("ROCKSTAR_LAST_LOG_REACHED: There are no more log files that can be found and/or read "
+                                "from. Assuming that the online list is correct...")
+                    break
+                if isinstance(result, Exception):
+                    log.error("ROCKSTAR_LOG_ERROR: Reading the log file resulted in the exception " + repr(result) +
+                              " being thrown. Using the online list... (Please report this issue on the plugin's "
+                              "GitHub page!)")
+                    break
+                file_reports_list.append(result)
+            # The files are merged from the most recently modified to the least recently modified, so that the newest
+            # report for each title wins even if the launcher was in the middle of rotating its logs.
+            file_reports_list.sort(key=lambda file_reports: file_reports[0], reverse=True)
+            for _, file_reports in file_reports_list:
+                for title_id, report in file_reports.items():
+                    log_reports.setdefault(title_id, report)
+                if len(log_reports) >= total_games_count:
+                    break
+            else:
+                log.warning("ROCKSTAR_LOG_WARNING: Not all of the owned games are listed in the launcher log files. "
+                            "Assuming that the online list is correct...")
+            self._log_tailer.finish_pass()
+            owned_title_ids = self.apply_log_reports(log_reports, owned_title_ids, online_check_success)
+            if self._log_tailer.changed:
+                self.persistent_cache['launcher_log_state'] = pickle.dumps(self._log_tailer.get_state()).hex()
+                self.push_cache()
 
         for title_id in owned_title_ids:
             game = self.create_game_from_title_id(title_id)
@@ -408,77 +568,44 @@ class RockstarPlugin(Plugin):
             title_id = get_game_title_id_from_ros_title_id(game_id)
             return await self._local_client.get_game_size_in_bytes(title_id)
 
+    if IS_WINDOWS:
+        def local_size_import_complete(self):
+            if self._local_client.size_index.changed:
+                self.persistent_cache['directory_size_index'] = self._local_client.size_index.get_state()
+                self.push_cache()
+
+    def get_launcher_log_path(self, log_number):
+        log_file_append = ".0" + str(log_number) if log_number != 0 else ""
+        return os.path.join(self.documents_location, "Rockstar Games\\Launcher\\launcher" + log_file_append + ".log")
+
     @staticmethod
-    async def parse_log_file(log_file, owned_title_ids, online_check_success):
+    def apply_log_reports(log_reports, owned_title_ids, online_check_success):
         owned_title_ids_ = owned_title_ids
-        checked_games_count = 0
-        # We need to subtract 1 to account for the Launcher.
-        total_games_count = len(games_cache) + len(ignore_game_title_ids_list) - 1
-
-        if os.path.exists(log_file):
-            with FileReadBackwards(log_file, encoding="utf-8") as frb:
-                while checked_games_count < total_games_count:
-                    try:
-                        line = frb.readline()
-                    except UnicodeDecodeError:
-                        log.warning("ROCKSTAR_LOG_UNICODE_WARNING: An invalid Unicode character was found in the line "
-                                    + line + ". Continuing to next line...")
-                        continue
-                    except Exception as e:
-                        log.error("ROCKSTAR_LOG_ERROR: Reading " + line + " from the log file resulted in the "
-                                  "exception " + repr(e) + " being thrown. Using the online list... (Please report "
-                                  "this issue on the plugin's GitHub page!)")
-                        raise
-                    if not line:
-                        log.error("ROCKSTAR_LOG_FINISHED_ERROR: The entire log file was read, but all of the games "
-                                  "could not be accounted for. Proceeding to import the games that have been "
-                                  "confirmed...")
-                        raise NoGamesInLogException()
-                    # We need to do two main things with the log file:
-                    # 1. If a game is present in owned_title_ids but not owned according to the log file, then it is
-                    #    assumed to be a non-Launcher game, and is removed from the list.
-                    # 2. If a game is owned according to the log file but is not already present in owned_title_ids,
-                    #    then it is assumed that the user has purchased the game on the Launcher, but has not yet played
-                    #    it. In this case, the game will be added to owned_title_ids.
-                    if ("launcher" not in line) and ("on branch " in line):  # Found a game!
-                        # Each log line for a title branch report describes the title id of the game starting at
-                        # character 65. From there, we search for the first occurrence of a colon starting from where
-                        # the title_id begins (character 65).
-                        end_index = line[65:].index(':') + 65
-                        title_id = line[65:end_index].strip()
-
-                        # Ignore title IDs which are present in the ignore_game_title_ids_list.
-                        if title_id in ignore_game_title_ids_list:
-                            log.debug("ROCKSTAR_IGNORE_GAME: Ignoring owned game " + title_id + "...")
-                        else:
-                            log.debug("ROCKSTAR_LOG_GAME: The game with title ID " + title_id + " is owned!")
-                            if title_id not in owned_title_ids_:
-                                if online_check_success is True:
-                                    # Case 2: The game is owned, but has not been played.
-                                    log.warning("ROCKSTAR_UNPLAYED_GAME: The game with title ID " + title_id +
-                                                " is owned, but it has never been played!")
-                                owned_title_ids_.append(title_id)
-                        checked_games_count += 1
-
-                    elif "no branches!" in line:
-                        end_index = line[65:].index(':') + 65
-                        title_id = line[65:end_index].strip()
-
-                        # Ignore title IDs which are present in the ignore_game_title_ids_list.
-                        if title_id in ignore_game_title_ids_list:
-                            log.debug("ROCKSTAR_IGNORE_GAME: Ignoring owned game " + title_id + "...")
-                        else:
-                            if title_id in owned_title_ids_:
-                                # Case 1: The game is not actually owned on the launcher.
-                                log.warning("ROCKSTAR_FAKE_GAME: The game with title ID " + title_id + " is not owned on "
-                                            "the Rockstar Games Launcher!")
-                                owned_title_ids_.remove(title_id)
-                        checked_games_count += 1
-                    if checked_games_count == total_games_count:
-                        break
-            return owned_title_ids_
-        else:
-            raise NoLogFoundException()
+        for title_id, (is_owned, _) in log_reports.items():
+            # We need to do two main things with the log file:
+            # 1. If a game is present in owned_title_ids but not owned according to the log file, then it is assumed
+            #    to be a non-Launcher game, and is removed from the list.
+            # 2. If a game is owned according to the log file but is not already present in owned_title_ids, then it
+            #    is assumed that the user has purchased the game on the Launcher, but has not yet played it. In this
+            #    case, the game will be added to owned_title_ids.
+
+            # Ignore title IDs which are present in the ignore_game_title_ids_list.
+            if title_id in ignore_game_title_ids_list:
+                log.debug("ROCKSTAR_IGNORE_GAME: Ignoring owned game " + title_id + "...")
+            elif is_owned:
+                log.debug("ROCKSTAR_LOG_GAME: The game with title ID " + title_id + " is owned!")
+                if title_id not in owned_title_ids_:
+                    if online_check_success is True:
+                        # Case 2: The game is owned, but has not been played.
+                        log.warning("ROCKSTAR_UNPLAYED_GAME: The game with title ID " + title_id +
+                                    " is owned, but it has never been played!")
+                    owned_title_ids_.append(title_id)
+            elif title_id in owned_title_ids_:
+                # Case 1: The game is not actually owned on the launcher.
+                log.warning("ROCKSTAR_FAKE_GAME: The game with title ID " + title_id + " is not owned on the "
+                            "Rockstar Games Launcher!")
+                owned_title_ids_.remove(title_id)
+        return owned_title_ids_
 
     async def get_game_time(self, game_id, context):
         # Although the Rockstar Games Launcher does track the played time for each game, there is currently no known
@@ -488,84 +615,130 @@ class RockstarPlugin(Plugin):
         title_id = get_game_title_id_from_ros_title_id(game_id)
         if title_id in self.running_games_info_list:
             # The game is running (or has been running).
-            start_time = self.running_games_info_list[title_id].get_start_time()
-            self.running_games_info_list[title_id].update_start_time()
-            current_time = datetime.datetime.now().timestamp()
-            minutes_passed = (current_time - start_time) / 60
+            self.record_play_time(title_id)
             if not self.running_games_info_list[title_id].get_pid():
                 # The PID has been set to None, which means that the game has exited (see self.check_game_status). Now
                 # that the start time is recorded, the game can be safely removed from the list of running games.
                 del self.running_games_info_list[title_id]
-            if self.game_time_cache[title_id]['time_played']:
-                # The game has been played before, so the time will need to be added to the existing cached time.
-                total_time_played = self.game_time_cache[title_id]['time_played'] + minutes_passed
-                self.game_time_cache[title_id]['time_played'] = total_time_played
-                self.game_time_cache[title_id]['last_played'] = current_time
-                return GameTime(game_id=game_id, time_played=int(total_time_played), last_played_time=int(current_time))
-            else:
-                # The game has not been played before, so a new entry in the game_time_cache dictionary must be made.
-                self.game_time_cache[title_id] = {
-                    'time_played': minutes_passed,
-                    'last_played': current_time
-                }
-                return GameTime(game_id=game_id, time_played=int(minutes_passed), last_played_time=int(current_time))
-        else:
+        elif title_id not in self.game_time_cache:
             # The game is no longer running (and there is no relevant entry in self.running_games_info_list).
-            if title_id not in self.game_time_cache:
-                self.game_time_cache[title_id] = {
-                    'time_played': None,
-                    'last_played': None
-                }
-            return GameTime(game_id=game_id, time_played=self.game_time_cache[title_id]['time_played'],
-                            last_played_time=self.game_time_cache[title_id]['last_played'])
+            self.game_time_cache[title_id] = {
+                'time_played': None,
+                'last_played': None
+            }
+        time_played = self.game_time_cache[title_id]['time_played']
+        last_played = self.game_time_cache[title_id]['last_played']
+        return GameTime(game_id=game_id, time_played=int(time_played) if time_played is not None else None,
+                        last_played_time=int(last_played) if last_played is not None else None)
+
+    def record_play_time(self, title_id):
+        # Adds the time since the game's start time (or since its time was last recorded) to the game time cache. On
+        # Windows, the session is also written to the game time journal, so that it is not lost if the plugin crashes.
+        # The time of a game which has exited was already recorded when it exited (see self.stop_tracking_game).
+        info = self.running_games_info_list[title_id]
+        if not info.get_pid():
+            return
+        start_time = info.get_start_time()
+        info.update_start_time()
+        stop_time = info.get_start_time()
+        if self._game_time_journal:
+            self._game_time_journal.record_session(self.game_time_cache, title_id, start_time, stop_time)
+        else:
+            apply_session(self.game_time_cache, title_id, start_time, stop_time)
+
+    def stop_tracking_game(self, title_id):
+        # We will leave the info in the list, because get_game_time still needs to find it. However, we will set the PID
+        # to None to indicate that the game has been closed.
+        if self.running_games_info_list[title_id].get_pid():
+            self.record_play_time(title_id)
+            self.running_games_info_list[title_id].clear_pid()
+
+    async def checkpoint_game_times(self):
+        running_title_ids = [title_id for title_id, info in self.running_games_info_list.items() if info.get_pid()]
+        for title_id in running_title_ids:
+            self.record_play_time(title_id)
+        return bool(running_title_ids)
 
     def game_times_import_complete(self):
         log.debug("ROCKSTAR_GAME_TIME: Pushing the cache of played game times to the persistent cache...")
-        self.persistent_cache['game_time_cache'] = pickle.dumps(self.game_time_cache).hex()
+        sequence = self._game_time_journal.sequence if self._game_time_journal else 0
+        self.persistent_cache['game_time_cache'] = dumps_snapshot(sequence, self.game_time_cache)
         self.push_cache()
 
     def get_friend_user_name_from_user_id(self, user_id):
-        for friend in self.friends_cache:
-            if friend.user_id == user_id:
-                return friend.user_name
-        return None
+        return self.friends_cache.get_user_name(user_id)
 
     async def prepare_user_presence_context(self, user_id_list: List[str]) -> Any:
+        # The presences of all of the friends are fetched here at once, with at most presence_request_concurrency
+        # requests in flight, and get_user_presence reads each friend's result from the returned dictionary.
+        if CONFIG_OPTIONS['user_presence_mode'] == 0:
+            return None
+        friends_who_play = None
         if CONFIG_OPTIONS['user_presence_mode'] == 2 or CONFIG_OPTIONS['user_presence_mode'] == 3:
             game = "gtav" if CONFIG_OPTIONS['user_presence_mode'] == 2 else "rdr2"
-            return await self._http_client.get_json_from_request_strict("https://scapi.rockstargames.com/friends/"
-                                                                        f"getFriendsWhoPlay?title={game}&platform=pc")
-        return None
+            resp_json = await self._http_client.get_json_from_request_strict("https://scapi.rockstargames.com/friends/"
+                                                                             f"getFriendsWhoPlay?title={game}"
+                                                                             f"&platform=pc")
+            friends_who_play = {str(player['userId']) for player in resp_json['onlineFriends']}
+        return await gather_limited(user_id_list,
+                                    lambda user_id: self._get_user_presence(user_id, friends_who_play),
+                                    CONFIG_OPTIONS['presence_request_concurrency'])
 
     async def get_user_presence(self, user_id, context):
+        if context is not None and user_id in context:
+            presence = context[user_id]
+            if isinstance(presence, BaseException):
+                raise presence
+            return presence
+        # The user was not part of the prepared context, so we need to get their presence now. The character stats
+        # methods fall back to the last played game on their own if the user does not own the game.
+        return await self._get_user_presence(user_id, None)
+
+    async def _get_user_presence(self, user_id, friends_who_play):
+        if CONFIG_OPTIONS['user_presence_mode'] == 0:
+            # 0 - Disable User Presence
+            return UserPresence(presence_state=PresenceState.Unknown)
+        presence = self.presence_cache.get(user_id)
+        if presence is not None:
+            return presence
+        try:
+            presence = await self._fetch_user_presence(user_id, friends_who_play)
+        except (AuthenticationRequired, InvalidCredentials):
+            raise
+        except Exception as e:
+            # If the Social Club cannot be reached, then an outdated presence is better than no presence at all.
+            presence = self.presence_cache.get_stale(user_id)
+            if presence is None:
+                raise
+            log.warning(f"ROCKSTAR_PRESENCE_STALE: Getting the user presence failed with the exception {repr(e)}. "
+                        f"Returning the cached presence...")
+            return presence
+        self.presence_cache.set(user_id, presence)
+        return presence
+
+    async def _fetch_user_presence(self, user_id, friends_who_play):
         # For user presence settings 2 and 3, we need to verify that the specified user owns the game to get their
         # stats.
 
         friend_name = self.get_friend_user_name_from_user_id(user_id)
         if LOG_SENSITIVE_DATA:
             log.debug(f"ROCKSTAR_PRESENCE_START: Getting user presence for {friend_name} (Rockstar ID: {user_id})...")
-        if context:
-            for player in context['onlineFriends']:
-                if player['userId'] == user_id:
-                    # This user owns the specified game, so we can return this information.
-                    break
-            else:
-                # The user does not own the specified game, so we need to return their last played game.
-                return await self._http_client.get_last_played_game(friend_name)
-        if CONFIG_OPTIONS['user_presence_mode'] == 0:
-            self.presence_cache[user_id] = UserPresence(presence_state=PresenceState.Unknown)
-            # 0 - Disable User Presence
-        else:
-            switch = {
-                1: self._http_client.get_last_played_game(friend_name),
-                # 1 - Get Last Played Game
-                2: self._http_client.get_gta_online_stats(user_id, friend_name),
-                # 2 - Get GTA Online Character Stats
-                3: self._http_client.get_rdo_stats(user_id, friend_name)
-                # 3 - Get Red Dead Online Character Stats
-            }
-            self.presence_cache[user_id] = await asyncio.create_task(switch[CONFIG_OPTIONS['user_presence_mode']])
-        return self.presence_cache[user_id]
+        if friends_who_play is not None and user_id not in friends_who_play:
+            # The user does not own the specified game, so we need to return their last played game.
+            return await self._http_client.get_last_played_game(friend_name)
+        if CONFIG_OPTIONS['user_presence_mode'] == 1:
+            # 1 - Get Last Played Game
+            return await self._http_client.get_last_played_game(friend_name)
+        elif CONFIG_OPTIONS['user_presence_mode'] == 2:
+            # 2 - Get GTA Online Character Stats
+            return await self._http_client.get_gta_online_stats(user_id, friend_name)
+        # 3 - Get Red Dead Online Character Stats
+        return await self._http_client.get_rdo_stats(user_id, friend_name)
+
+    def user_presence_import_complete(self):
+        log.debug(f"ROCKSTAR_PRESENCE_CACHE_STATS: {self.presence_cache.get_stats()}")
+        log.debug(f"ROCKSTAR_RATE_LIMITER_STATS: {self._http_client.get_rate_limiter_stats()}")
+        log.debug(f"ROCKSTAR_RESPONSE_CACHE_STATS: {self._http_client.get_response_cache_stats()}")
 
     async def open_rockstar_browser(self):
         # This method allows the user to install the Rockstar Games Launcher, if it is not already installed.
@@ -574,7 +747,40 @@ class RockstarPlugin(Plugin):
         log.info(f"Opening Rockstar website {url}")
         webbrowser.open(url)
 
-    def check_game_status(self, title_id):
+    def take_process_snapshot(self):
+        # The process table only needs to be read if there is a running game to look for. Running games which have an
+        # exit watcher are known to still be running, so the process table is only read for them every so often, in
+        # case a watcher misses an exit.
+        running_pids = {info.get_pid() for info in self.running_games_info_list.values() if info.get_pid()}
+        if not running_pids:
+            return ProcessSnapshot({})
+        if (running_pids <= self._exit_watchers.keys() and
+                time() < self._last_process_reconciliation + PROCESS_RECONCILIATION_INTERVAL):
+            return ProcessSnapshot(dict.fromkeys(running_pids))
+        self._last_process_reconciliation = time()
+        return take_process_snapshot()
+
+    def watch_game_exit(self, title_id, pid):
+        if pid not in self._exit_watchers:
+            self._exit_watchers[pid] = asyncio.create_task(self._watch_game_exit(title_id, pid))
+
+    async def _watch_game_exit(self, title_id, pid):
+        try:
+            await wait_for_process_exit(pid)
+        except Exception as e:
+            log.warning(f"ROCKSTAR_EXIT_WATCH_ERROR: Waiting for {title_id} to exit resulted in the exception "
+                        f"{repr(e)} being thrown. Falling back to checking the process list...")
+            return
+        finally:
+            self._exit_watchers.pop(pid, None)
+        info = self.running_games_info_list.get(title_id)
+        if info is None or info.get_pid() != pid:
+            return
+        log.debug(f"ROCKSTAR_GAME_EXITED: {title_id} (PID: {pid}) has exited.")
+        self.stop_tracking_game(title_id)
+        self.update_game_status(title_id, ProcessSnapshot({}))
+
+    def check_game_status(self, title_id, snapshot=None):
         state = LocalGameState.None_
 
         game_installed = self._local_client.get_path_to_game(title_id)
@@ -582,12 +788,10 @@ class RockstarPlugin(Plugin):
             state |= LocalGameState.Installed
 
             if (title_id in self.running_games_info_list and
-                    check_if_process_exists(self.running_games_info_list[title_id].get_pid())):
+                    check_if_process_exists(self.running_games_info_list[title_id].get_pid(), snapshot)):
                 state |= LocalGameState.Running
             elif title_id in self.running_games_info_list:
-                # We will leave the info in the list, because it still contains the game start time for game time
-                # tracking. However, we will set the PID to None to indicate that the game has been closed.
-                self.running_games_info_list[title_id].clear_pid()
+                self.stop_tracking_game(title_id)
 
         return LocalGame(str(self.games_cache[title_id]["rosTitleId"]), state)
 
@@ -599,12 +803,13 @@ class RockstarPlugin(Plugin):
             local_games = {}
             local_list = []
             state = LocalGameState.None_
+            snapshot = self.take_process_snapshot()
             for game in self.total_games_cache:
                 title_id = get_game_title_id_from_ros_title_id(str(game.game_id))
                 game_installed = self._local_client.get_path_to_game(title_id)
                 if title_id != "launcher" and game_installed:
                     state |= LocalGameState.Installed
-                    local_game = self.check_game_status(title_id)
+                    local_game = self.check_game_status(title_id, snapshot)
                     local_games[title_id] = local_game
                     local_list.append(local_game)
                 else:
@@ -613,35 +818,44 @@ class RockstarPlugin(Plugin):
             log.debug(f"ROCKSTAR_INSTALLED_GAMES: {local_games}")
             return local_list
 
-    async def check_for_new_games(self):
-        self.checking_for_new_games = True
+    async def check_for_new_games_online(self):
         # The Social Club prevents the user from making too many requests in a given time span to prevent a denial of
-        # service attack. As such, we need to limit online checking to every 5 minutes. For Windows devices, log file
-        # checks will still occur every minute, but for other users, checking games only happens every 5 minutes.
-        owned_title_ids = None
-        online_check_success = False
-        if not self.last_online_game_check or time() >= self.last_online_game_check + 300:
-            owned_title_ids, online_check_success = await self.get_owned_games_online()
-        elif IS_WINDOWS:
-            log.debug("ROCKSTAR_SC_ONLINE_GAMES_SKIP: No attempt has been made to scrape the user's games from the "
-                      "Social Club, as it has not been 5 minutes since the last check.")
+        # service attack. As such, online checking is scheduled separately from the launcher log checks, and it only
+        # happens every few minutes.
+        owned_games_count = len(self.owned_games_cache)
+        owned_title_ids, online_check_success = await self.get_owned_games_online()
+        if IS_WINDOWS:
+            self._log_watcher.mark_checked(self.get_launcher_log_path(0))
         await self.get_owned_games(owned_title_ids, online_check_success)
-        await asyncio.sleep(60 if IS_WINDOWS else 300)
-        self.checking_for_new_games = False
+        return len(self.owned_games_cache) > owned_games_count
+
+    async def check_launcher_logs(self):
+        # The launcher logs are watched for changes every few seconds, and they are only read again once they have
+        # actually changed.
+        if not self._log_watcher.poll(self.get_launcher_log_path(0)):
+            return False
+        log.debug("ROCKSTAR_LOG_CHANGED: The launcher logs have changed. Checking them for new games...")
+        owned_games_count = len(self.owned_games_cache)
+        await self.get_owned_games()
+        return len(self.owned_games_cache) > owned_games_count
 
     async def check_game_statuses(self):
-        self.updating_game_statuses = True
-
-        for title_id, current_local_game in self.local_games_cache.items():
-            new_local_game = self.check_game_status(title_id)
-            if new_local_game != current_local_game:
-                log.debug(f"ROCKSTAR_LOCAL_CHANGE: The status for {title_id} has changed from: {current_local_game} to "
-                          f"{new_local_game}.")
-                self.update_local_game_status(new_local_game)
-                self.local_games_cache[title_id] = new_local_game
-
-        await asyncio.sleep(5)
-        self.updating_game_statuses = False
+        snapshot = self.take_process_snapshot()
+        changed = False
+        for title_id in list(self.local_games_cache):
+            changed |= self.update_game_status(title_id, snapshot)
+        return changed
+
+    def update_game_status(self, title_id, snapshot):
+        current_local_game = self.local_games_cache.get(title_id)
+        new_local_game = self.check_game_status(title_id, snapshot)
+        if new_local_game != current_local_game:
+            log.debug(f"ROCKSTAR_LOCAL_CHANGE: The status for {title_id} has changed from: {current_local_game} to "
+                      f"{new_local_game}.")
+            self.update_local_game_status(new_local_game)
+            self.local_games_cache[title_id] = new_local_game
+            return True
+        return False
 
     def list_running_game_pids(self):
         info_list = []
@@ -674,7 +888,13 @@ class RockstarPlugin(Plugin):
                 return
 
             title_id = get_game_title_id_from_ros_title_id(game_id)
-            game_pid = await self._local_client.launch_game_from_title_id(title_id)
+            # The local game statuses are checked more often while a game is being launched.
+            self._launching_games += 1
+            self._scheduler.wake()
+            try:
+                game_pid = await self._local_client.launch_game_from_title_id(title_id)
+            finally:
+                self._launching_games -= 1
             if game_pid:
                 self.running_games_info_list[title_id] = RunningGameInfo()
                 self.running_games_info_list[title_id].set_info(game_pid)
@@ -682,6 +902,7 @@ class RockstarPlugin(Plugin):
                 local_game = LocalGame(game_id, LocalGameState.Running | LocalGameState.Installed)
                 self.update_local_game_status(local_game)
                 self.local_games_cache[title_id] = local_game
+                self.watch_game_exit(title_id, game_pid)
             else:
                 log.error(f'cannot start game: {title_id}')
 
@@ -711,15 +932,13 @@ class RockstarPlugin(Plugin):
         return Game(str(self.games_cache[title_id]["rosTitleId"]), self.games_cache[title_id]["friendlyName"], None,
                     self.games_cache[title_id]["licenseInfo"])
 
+    def is_busy(self):
+        return self._launching_games > 0 or any(info.get_pid() for info in self.running_games_info_list.values())
+
     def tick(self):
         if not self.is_authenticated():
             return
-        if not self.checking_for_new_games:
-            log.debug("Checking for new games...")
-            asyncio.create_task(self.check_for_new_games())
-        if not self.updating_game_statuses and IS_WINDOWS:
-            log.debug("Checking local game statuses...")
-            asyncio.create_task(self.check_game_statuses())
+        self._scheduler.tick()
 
 
 def main():
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from time import time
+
+
+class PresenceCache:
+    # Holds the most recent presence of each friend for a fixed amount of time (see PRESENCE_CACHE_TTL in consts.py).
+    # Entries which have expired are kept until the cache is full, so that they can still be returned if the Social
+    # Club cannot be reached. Once the cache is full, the least recently used entry is evicted.
+    def __init__(self, ttl, max_size):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] + self._ttl <= time():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[0]
+
+    def get_stale(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        self.stale_hits += 1
+        return entry[0]
+
+    def set(self, user_id, presence):
+        self._entries[user_id] = (presence, time())
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def get_stats(self):
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits
+        }
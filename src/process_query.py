@@ -0,0 +1,224 @@
+from galaxy.proc_tools import get_process_info, pids
+
+import asyncio
+import ctypes
+import errno
+import os
+import re
+import sys
+
+from typing import Dict, Optional
+
+
+class ProcessSnapshot:
+    # A view of the processes which were running at a single point in time. Checking the status of every installed game
+    # used to enumerate all of the processes on the system once per game; instead, one snapshot is now taken for each
+    # pass and shared between all of the games. Each PID maps to the (lower-case) image name of its executable, or to
+    # None if the image name is not known.
+    def __init__(self, processes: Dict[int, Optional[str]]):
+        self._processes = processes
+
+    def __contains__(self, pid) -> bool:
+        return pid is not None and int(pid) in self._processes
+
+    def __len__(self) -> int:
+        return len(self._processes)
+
+    def find_pid_by_image_name(self, image_name: str) -> Optional[int]:
+        image_name = image_name.lower()
+        for pid, process_image_name in self._processes.items():
+            if process_image_name == image_name:
+                return pid
+        return None
+
+
+def get_image_name(path: str) -> str:
+    # Windows paths need to be handled even when they are read from /proc (for example, for games run through Wine).
+    return re.split(r"[\\/]", path)[-1].lower()
+
+
+class ProcessQueryBackend:
+    # Lists the running processes of the system as a dictionary of PIDs to image names. Each platform has its own
+    # backend, so that the process table can be read inside of the plugin instead of through a subprocess.
+    # If a backend cannot be notified when a process exits, then the process table is read again after this many
+    # seconds.
+    EXIT_POLL_INTERVAL = 5
+
+    def list_processes(self) -> Dict[int, Optional[str]]:
+        raise NotImplementedError()
+
+    async def wait_for_exit(self, pid: int):
+        while int(pid) in self.list_processes():
+            await asyncio.sleep(self.EXIT_POLL_INTERVAL)
+
+
+class ProcToolsProcessQueryBackend(ProcessQueryBackend):
+    # A slow, but portable, backend which asks galaxy.proc_tools for the path of every process.
+    def list_processes(self) -> Dict[int, Optional[str]]:
+        processes = {}
+        for pid in pids():
+            info = get_process_info(pid)
+            processes[pid] = get_image_name(info.binary_path) if info is not None and info.binary_path else None
+        return processes
+
+
+class ProcfsProcessQueryBackend(ProcessQueryBackend):
+    # Reads the process table from /proc on Linux. The command line of a process is used for its image name, since
+    # /proc/[pid]/comm is cut off after 15 characters and /proc/[pid]/exe cannot be read for other users' processes.
+    def __init__(self, proc_path="/proc"):
+        self._proc_path = proc_path
+
+    def list_processes(self) -> Dict[int, Optional[str]]:
+        processes = {}
+        with os.scandir(self._proc_path) as it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "cmdline"), "rb") as f:
+                        command = f.read().split(b"\0", 1)[0].decode("utf-8", errors="replace")
+                    if not command:
+                        # Kernel threads do not have a command line.
+                        with open(os.path.join(entry.path, "comm"), "rb") as f:
+                            command = f.read().strip().decode("utf-8", errors="replace")
+                except OSError:
+                    # The process exited while the table was being read.
+                    continue
+                processes[int(entry.name)] = get_image_name(command)
+        return processes
+
+    async def wait_for_exit(self, pid: int):
+        # A pidfd becomes readable once its process has exited (Linux 5.3 and later).
+        if not hasattr(os, "pidfd_open"):
+            return await super().wait_for_exit(pid)
+        try:
+            fd = os.pidfd_open(int(pid))
+        except ProcessLookupError:
+            return
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EPERM):
+                raise
+            return await super().wait_for_exit(pid)
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        loop.add_reader(fd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+
+
+if sys.platform == "win32":
+    import ctypes.wintypes
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    SYNCHRONIZE = 0x00100000
+    INFINITE = 0xFFFFFFFF
+    WT_EXECUTEONLYONCE = 0x00000008
+    ERROR_INVALID_PARAMETER = 87
+
+    WAITORTIMERCALLBACK = ctypes.WINFUNCTYPE(None, ctypes.c_void_p, ctypes.wintypes.BOOLEAN)
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", ctypes.wintypes.DWORD),
+            ("cntUsage", ctypes.wintypes.DWORD),
+            ("th32ProcessID", ctypes.wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", ctypes.wintypes.DWORD),
+            ("cntThreads", ctypes.wintypes.DWORD),
+            ("th32ParentProcessID", ctypes.wintypes.DWORD),
+            ("pcPriClassBase", ctypes.wintypes.LONG),
+            ("dwFlags", ctypes.wintypes.DWORD),
+            ("szExeFile", ctypes.wintypes.WCHAR * ctypes.wintypes.MAX_PATH)
+        ]
+
+    class WindowsProcessQueryBackend(ProcessQueryBackend):
+        # Reads the process table through a single Toolhelp snapshot, which includes the image name of each process.
+        # This replaces running tasklist through the command prompt.
+        def __init__(self):
+            self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            self._kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+            self._kernel32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+            for function in (self._kernel32.Process32FirstW, self._kernel32.Process32NextW):
+                function.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+                function.restype = ctypes.wintypes.BOOL
+            self._kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+            self._kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+            self._kernel32.OpenProcess.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD]
+            self._kernel32.OpenProcess.restype = ctypes.wintypes.HANDLE
+            self._kernel32.RegisterWaitForSingleObject.argtypes = [
+                ctypes.POINTER(ctypes.wintypes.HANDLE), ctypes.wintypes.HANDLE, WAITORTIMERCALLBACK, ctypes.c_void_p,
+                ctypes.wintypes.ULONG, ctypes.wintypes.ULONG]
+            self._kernel32.RegisterWaitForSingleObject.restype = ctypes.wintypes.BOOL
+            self._kernel32.UnregisterWaitEx.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.HANDLE]
+            self._kernel32.UnregisterWaitEx.restype = ctypes.wintypes.BOOL
+
+        def list_processes(self) -> Dict[int, Optional[str]]:
+            snapshot = self._kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+            if snapshot == INVALID_HANDLE_VALUE:
+                raise ctypes.WinError(ctypes.get_last_error())
+            try:
+                processes = {}
+                entry = PROCESSENTRY32W()
+                entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+                found = self._kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+                while found:
+                    processes[entry.th32ProcessID] = entry.szExeFile.lower()
+                    found = self._kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+                return processes
+            finally:
+                self._kernel32.CloseHandle(snapshot)
+
+        async def wait_for_exit(self, pid: int):
+            # A process handle is signaled once the process exits. Instead of blocking a thread on it, the wait is
+            # registered with the system thread pool, which calls back into the event loop when the process exits.
+            process = self._kernel32.OpenProcess(SYNCHRONIZE, False, int(pid))
+            if not process:
+                error = ctypes.get_last_error()
+                if error == ERROR_INVALID_PARAMETER:
+                    # The process has already exited.
+                    return
+                raise ctypes.WinError(error)
+            loop = asyncio.get_running_loop()
+            exited = loop.create_future()
+
+            def set_exited():
+                if not exited.done():
+                    exited.set_result(None)
+
+            # The callback must be kept alive for as long as the wait is registered.
+            callback = WAITORTIMERCALLBACK(lambda context, timed_out: loop.call_soon_threadsafe(set_exited))
+            wait = ctypes.wintypes.HANDLE()
+            try:
+                if not self._kernel32.RegisterWaitForSingleObject(ctypes.byref(wait), process, callback, None,
+                                                                   INFINITE, WT_EXECUTEONLYONCE):
+                    raise ctypes.WinError(ctypes.get_last_error())
+                try:
+                    await exited
+                finally:
+                    # Passing INVALID_HANDLE_VALUE makes this wait until the callback (if it is running) has finished.
+                    self._kernel32.UnregisterWaitEx(wait, INVALID_HANDLE_VALUE)
+            finally:
+                self._kernel32.CloseHandle(process)
+
+
+def create_process_query_backend() -> ProcessQueryBackend:
+    if sys.platform == "win32":
+        return WindowsProcessQueryBackend()
+    if sys.platform.startswith("linux"):
+        return ProcfsProcessQueryBackend()
+    return ProcToolsProcessQueryBackend()
+
+
+process_query_backend = create_process_query_backend()
+
+
+def take_process_snapshot(backend: Optional[ProcessQueryBackend] = None) -> ProcessSnapshot:
+    return ProcessSnapshot((backend or process_query_backend).list_processes())
+
+
+async def wait_for_process_exit(pid: int, backend: Optional[ProcessQueryBackend] = None):
+    await (backend or process_query_backend).wait_for_exit(pid)
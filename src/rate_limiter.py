@@ -0,0 +1,115 @@
+import asyncio
+import datetime
+import email.utils
+import logging as log
+
+from time import monotonic
+
+from yarl import URL
+
+
+def parse_retry_after(value):
+    # The Retry-After header may either contain a number of seconds or an HTTP date.
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    # A token bucket for a single host. Each request takes one token, and tokens are added back at the current refill
+    # rate. When the host responds with 429 Too Many Requests, no requests are sent until the Retry-After time has
+    # passed, and the refill rate is halved. Every successful request afterwards raises the refill rate slightly, until
+    # it is back at its original value.
+    def __init__(self, host, rate, capacity, min_rate, default_retry_after):
+        self._host = host
+        self._max_rate = rate
+        self._min_rate = min_rate
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._default_retry_after = default_retry_after
+        self._last_refill = monotonic()
+        self._blocked_until = 0
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+
+    @property
+    def queue_depth(self):
+        return self._waiting
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def _refill(self, now):
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    async def acquire(self):
+        self._waiting += 1
+        try:
+            # asyncio.Lock wakes up its waiters in order, so requests are sent in the order in which they were made.
+            async with self._lock:
+                while True:
+                    now = monotonic()
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+        finally:
+            self._waiting -= 1
+
+    def on_success(self):
+        if self._rate < self._max_rate:
+            self._rate = min(self._max_rate, self._rate + self._max_rate / 20)
+
+    def on_rate_limited(self, retry_after=None):
+        delay = retry_after if retry_after is not None else self._default_retry_after
+        self._blocked_until = max(self._blocked_until, monotonic() + delay)
+        self._rate = max(self._min_rate, self._rate / 2)
+        # The bucket starts refilling only once the host allows requests again.
+        self._tokens = 0
+        self._last_refill = self._blocked_until
+        log.warning(f"ROCKSTAR_RATE_LIMITED: {self._host} has limited the plugin's requests. Waiting {delay} seconds "
+                    f"before sending another request. (Refill Rate: {self._rate:.2f}/s, Queue Depth: "
+                    f"{self.queue_depth})")
+
+    def get_stats(self):
+        return {
+            "rate": self._rate,
+            "tokens": self._tokens,
+            "queue_depth": self.queue_depth
+        }
+
+
+class RateLimiterRegistry:
+    # Holds one RateLimiter for each host that the plugin sends requests to. Hosts that are not listed in the limits
+    # dictionary use the default limits.
+    def __init__(self, limits, default_limits):
+        self._limits = limits
+        self._default_limits = default_limits
+        self._limiters = {}
+
+    def get_limiter(self, url):
+        host = URL(url).host
+        if host not in self._limiters:
+            rate, capacity, min_rate, default_retry_after = self._limits.get(host, self._default_limits)
+            self._limiters[host] = RateLimiter(host, rate, capacity, min_rate, default_retry_after)
+        return self._limiters[host]
+
+    def get_stats(self):
+        return {host: limiter.get_stats() for host, limiter in self._limiters.items()}
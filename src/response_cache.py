@@ -0,0 +1,65 @@
+from collections import OrderedDict
+
+
+class ResponseCache:
+    # Stores the bodies of Social Club API responses which came with an ETag or Last-Modified header. When the same URL
+    # is requested again by the same user, these validators are sent back to the server, which can then respond with
+    # 304 Not Modified instead of sending the whole body again. The cache is limited to a total number of bytes, and the
+    # least recently used responses are evicted first.
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def get_conditional_headers(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def store(self, key, etag, last_modified, body):
+        self.remove(key)
+        if not (etag or last_modified) or len(body) > self._max_bytes:
+            return
+        self._entries[key] = (etag, last_modified, body)
+        self._size += len(body)
+        while self._size > self._max_bytes:
+            _, (_, _, old_body) = self._entries.popitem(last=False)
+            self._size -= len(old_body)
+
+    def remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[2])
+
+    def get_stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
@@ -0,0 +1,119 @@
+from galaxy.api.errors import AuthenticationRequired, BackendError, InvalidCredentials, NetworkError
+
+import aiohttp
+import asyncio
+import json
+import logging as log
+import random
+
+from time import monotonic
+
+from yarl import URL
+
+
+class RetryPolicy:
+    # Decides whether a failed request to the Social Club should be tried again, and how long to wait before doing so.
+    # Failures which suggest that the user's credentials have expired are retried after refreshing the credentials,
+    # while failures which suggest that the server is unavailable are retried after an exponentially increasing delay.
+    REFRESH = "refresh"
+    BACKOFF = "backoff"
+
+    def __init__(self, max_attempts, base_delay, max_delay):
+        self.max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    @staticmethod
+    def classify(exception):
+        if isinstance(exception, InvalidCredentials):
+            return None
+        if isinstance(exception, (AuthenticationRequired, aiohttp.ContentTypeError, json.JSONDecodeError,
+                                  AssertionError)):
+            # The Social Club responds with a login page instead of JSON if the bearer token has expired.
+            return RetryPolicy.REFRESH
+        if isinstance(exception, aiohttp.ClientResponseError):
+            if exception.status in (401, 403):
+                return RetryPolicy.REFRESH
+            # A 429 has already been retried by the rate limiter (see BackendClient._send_request), so retrying it here
+            # as well would multiply the number of requests sent to a host which is asking for fewer of them.
+            if exception.status >= 500:
+                return RetryPolicy.BACKOFF
+            return None
+        if isinstance(exception, (asyncio.TimeoutError, TimeoutError, aiohttp.ClientConnectionError, NetworkError,
+                                  BackendError)):
+            return RetryPolicy.BACKOFF
+        return None
+
+    def get_delay(self, attempt):
+        # "Full jitter" is used so that requests which failed together do not all retry at the same moment.
+        return random.uniform(0, min(self._max_delay, self._base_delay * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    # Tracks consecutive failures for a single host. Once too many requests in a row have failed, the circuit opens and
+    # further requests fail immediately instead of waiting on a host that is down. After the reset timeout, a single
+    # request is let through to probe whether the host has recovered.
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host, failure_threshold, reset_timeout):
+        self._host = host
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return CircuitBreaker.CLOSED
+        if monotonic() - self._opened_at >= self._reset_timeout:
+            return CircuitBreaker.HALF_OPEN
+        return CircuitBreaker.OPEN
+
+    def before_request(self):
+        # Returns True if the request is the probe.
+        state = self.state
+        if state == CircuitBreaker.CLOSED:
+            return False
+        if state == CircuitBreaker.HALF_OPEN and not self._probing:
+            log.debug(f"ROCKSTAR_CIRCUIT_PROBE: Checking if {self._host} has recovered...")
+            self._probing = True
+            return True
+        raise NetworkError()
+
+    def release_probe(self):
+        # Called when the probe is abandoned (for example, because it was cancelled) before it could succeed or fail.
+        # The abandoned probe says nothing about the host, so the next request may probe instead.
+        self._probing = False
+
+    def record_success(self):
+        if self._opened_at is not None:
+            log.info(f"ROCKSTAR_CIRCUIT_CLOSED: {self._host} has recovered.")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            if self._opened_at is None or self._probing:
+                log.warning(f"ROCKSTAR_CIRCUIT_OPEN: Requests to {self._host} have failed {self._failures} times in a "
+                            f"row. Further requests will fail immediately for {self._reset_timeout} seconds.")
+            self._opened_at = monotonic()
+            self._probing = False
+
+
+class CircuitBreakerRegistry:
+    def __init__(self, failure_threshold, reset_timeout):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._breakers = {}
+
+    def get_breaker(self, url):
+        host = URL(url).host
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(host, self._failure_threshold, self._reset_timeout)
+        return self._breakers[host]
@@ -0,0 +1,121 @@
+import asyncio
+import logging as log
+import random
+
+from time import monotonic
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class ScheduledJob:
+    # A periodic background job. The job's coroutine should return True if it found something to do (for example, if a
+    # game's status changed) and False otherwise. While a job keeps finding nothing to do, its interval is raised
+    # step by step up to max_interval, and after a failure, it is retried with an exponentially increasing delay (again
+    # up to max_interval). While the plugin is busy (for example, while a game is running or being launched), the job
+    # runs every active_interval seconds instead, if it has one. A local job only does cheap work on this machine (such
+    # as checking the running processes), so it is not held back by the jobs which are waiting on the network.
+    def __init__(self, name: str, run: Callable[[], Awaitable[bool]], interval: float, *, max_interval=None,
+                 active_interval=None, jitter=0.0, priority=0, local=False):
+        self.name = name
+        self._run = run
+        self.interval = interval
+        self.max_interval = max_interval if max_interval is not None else interval
+        self.active_interval = active_interval
+        self.jitter = jitter
+        self.priority = priority
+        self.local = local
+        self.next_run = 0.0
+        self.task: Optional[asyncio.Task] = None
+        self._idle_runs = 0
+        self._failures = 0
+        self.runs = 0
+        self.failures = 0
+        self.last_runtime = 0.0
+        self.total_runtime = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def get_delay(self, busy: bool) -> float:
+        if self._failures:
+            delay = min(self.max_interval, self.interval * (2 ** self._failures))
+        elif busy and self.active_interval is not None:
+            delay = self.active_interval
+        else:
+            delay = min(self.max_interval, self.interval * (1 + self._idle_runs))
+        return delay + random.uniform(0, self.jitter)
+
+    async def run(self) -> bool:
+        start = monotonic()
+        self.runs += 1
+        try:
+            found_work = await self._run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failures += 1
+            self._failures += 1
+            log.warning(f"ROCKSTAR_JOB_FAILED: The background job {self.name} resulted in the exception {repr(e)} "
+                        f"being thrown.")
+            return False
+        finally:
+            self.last_runtime = monotonic() - start
+            self.total_runtime += self.last_runtime
+        self._failures = 0
+        self._idle_runs = 0 if found_work else self._idle_runs + 1
+        return found_work
+
+    def get_stats(self):
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_runtime": round(self.last_runtime, 3),
+            "average_runtime": round(self.total_runtime / self.runs, 3) if self.runs else 0
+        }
+
+
+class JobScheduler:
+    # Owns the plugin's periodic background jobs. tick() should be called regularly (the plugin calls it from its own
+    # tick()); each call starts the jobs which are due, from the highest priority to the lowest, as long as fewer than
+    # max_concurrent_jobs are running. Local jobs are always started when they are due and do not count towards that
+    # limit, so slow network jobs can never delay them. A job is never started again while it is still running, so its
+    # runs can never overlap.
+    def __init__(self, is_busy: Callable[[], bool], max_concurrent_jobs: int):
+        self._is_busy = is_busy
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._jobs: List[ScheduledJob] = []
+
+    def add_job(self, job: ScheduledJob):
+        self._jobs.append(job)
+        self._jobs.sort(key=lambda scheduled_job: scheduled_job.priority, reverse=True)
+
+    def tick(self):
+        now = monotonic()
+        running_count = sum(1 for job in self._jobs if job.running and not job.local)
+        for job in self._jobs:
+            if job.running or now < job.next_run:
+                continue
+            if not job.local:
+                if running_count >= self._max_concurrent_jobs:
+                    continue
+                running_count += 1
+            job.task = asyncio.create_task(self._run_job(job))
+
+    def wake(self):
+        # Makes the jobs which run more often while the plugin is busy due on the next tick. This should be called when
+        # the plugin has just become busy.
+        for job in self._jobs:
+            if job.active_interval is not None:
+                job.next_run = min(job.next_run, monotonic() + job.active_interval)
+
+    async def _run_job(self, job: ScheduledJob):
+        await job.run()
+        job.next_run = monotonic() + job.get_delay(self._is_busy())
+
+    def cancel(self):
+        for job in self._jobs:
+            if job.running:
+                job.task.cancel()
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {job.name: job.get_stats() for job in self._jobs}
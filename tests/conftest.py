@@ -0,0 +1,11 @@
+import os
+import sys
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_PATH)
+
+# consts.py reads config.cfg as soon as it is imported. galaxyutils looks for that file in the folder that it is
+# installed in, which is only the plugin's folder in a built plugin, so the tests read the default config instead.
+from galaxyutils import config_parser  # noqa: E402
+
+config_parser.CONFIG_PATH = os.path.join(SRC_PATH, "default_config.cfg")
@@ -0,0 +1,26 @@
+import pickle
+from unittest.mock import MagicMock
+
+from achievements_cache import AchievementsCache
+from plugin import RockstarPlugin
+
+
+def test_saved_cache_is_restored():
+    cache = AchievementsCache(max_age=3600)
+    cache.merge("1", "gta5", {"1": 1577836800, "17": 1577923200})
+    cache.merge("2", "rdr2", {})
+    loaded_cache = AchievementsCache(max_age=3600)
+    loaded_cache.set_state(cache.get_state())
+    assert loaded_cache._entries == cache._entries
+    assert loaded_cache.get_fresh("1", "gta5") == cache.get("1", "gta5")
+    assert loaded_cache.get("2", "rdr2") == []
+
+
+def test_unreadable_cache_is_ignored_at_startup():
+    plugin = RockstarPlugin(MagicMock(), MagicMock(), None)
+    # Older versions of the plugin saved the cache as a hex-encoded pickle.
+    plugin.persistent_cache["achievements_cache"] = pickle.dumps((1, {("1", "gta5"): (0, ())})).hex()
+    plugin.handshake_complete()
+    assert len(plugin.achievements_cache) == 0
+    plugin.achievements_cache.set_state("corrupt")
+    assert len(plugin.achievements_cache) == 0
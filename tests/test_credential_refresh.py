@@ -0,0 +1,67 @@
+import asyncio
+
+import aiohttp
+
+from http_client import BackendClient
+
+CONCURRENT_REQUESTS = 200
+
+
+def create_client(refresh_delay=0.05):
+    client = BackendClient(store_credentials=lambda credentials: None)
+    client._current_sc_token = "old-token"
+    client.refresh_count = 0
+
+    async def refresh_light_once():
+        # Stands in for the POST to /connect/refreshaccess.
+        client.refresh_count += 1
+        await asyncio.sleep(refresh_delay)
+        client._current_sc_token = f"new-token-{client.refresh_count}"
+        return client._current_sc_token
+
+    client._refresh_credentials_social_club_light_once = refresh_light_once
+    return client
+
+
+async def send_failing_request(client):
+    # Fails with a 401 until the bearer token has been refreshed, like a Social Club API request with an expired token.
+    async def send_request():
+        if client.get_current_sc_token() == "old-token":
+            raise aiohttp.ClientResponseError(None, (), status=401)
+        return client.get_current_sc_token()
+
+    return await client._request_with_retry("https://scapi.rockstargames.com/profile/getprofile", send_request)
+
+
+def test_concurrent_failing_requests_share_one_refresh():
+    async def run():
+        client = create_client()
+        tokens = await asyncio.gather(*[send_failing_request(client) for _ in range(CONCURRENT_REQUESTS)])
+        return client.refresh_count, tokens
+
+    refresh_count, tokens = asyncio.run(run())
+    assert refresh_count == 1
+    assert tokens == ["new-token-1"] * CONCURRENT_REQUESTS
+
+
+def test_request_that_failed_with_replaced_token_does_not_refresh_again():
+    async def run():
+        client = create_client()
+        await client._refresh_credentials_social_club_light("old-token")
+        # This request was sent with the old token before the refresh above finished.
+        token = await client._refresh_credentials_social_club_light("old-token")
+        return client.refresh_count, token
+
+    assert asyncio.run(run()) == (1, "new-token-1")
+
+
+def test_cancelled_waiter_does_not_cancel_the_refresh():
+    async def run():
+        client = create_client()
+        waiters = [asyncio.create_task(client._refresh_credentials_social_club_light("old-token")) for _ in range(2)]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+        token = await waiters[1]
+        return client.refresh_count, token, waiters[0].cancelled()
+
+    assert asyncio.run(run()) == (1, "new-token-1", True)
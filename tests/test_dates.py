@@ -0,0 +1,37 @@
+import datetime
+
+import pytest
+
+from consts import get_unix_epoch_time_from_date
+
+UTC_TIME = 1580474096
+
+
+@pytest.mark.parametrize("date", [
+    "2020-01-31T12:34:56.789Z",
+    "2020-01-31T12:34:56Z",
+    " 2020-01-31 12:34:56Z ",
+    "2020-01-31T13:34:56+01:00",
+    "2020-01-31T13:34:56.5+0100",
+    "2020-01-31T13:34:56+01",
+    "2020-01-31T11:04:56-01:30",
+])
+def test_dates_with_a_time_zone(date):
+    assert get_unix_epoch_time_from_date(date) == UTC_TIME
+
+
+def test_dates_without_seconds():
+    assert get_unix_epoch_time_from_date("2020-01-31T12:34Z") == UTC_TIME - 56
+    assert get_unix_epoch_time_from_date("2020-01-31T13:34+01") == UTC_TIME - 56
+
+
+def test_dates_without_a_time_zone_are_local():
+    local_time = int(datetime.datetime(2020, 1, 31, 12, 34, 56).timestamp())
+    assert get_unix_epoch_time_from_date("2020-01-31T12:34:56.789") == local_time
+    assert get_unix_epoch_time_from_date("2020-01-31T12:34") == local_time - 56
+
+
+@pytest.mark.parametrize("date", ["garbage", "2020-01-31T12:34:56+1", "2020-01-31T12:34:56 PST"])
+def test_unrecognized_dates_raise_value_error(date):
+    with pytest.raises(ValueError):
+        get_unix_epoch_time_from_date(date)
@@ -0,0 +1,49 @@
+import os
+
+from directory_size import DirectorySizeIndex, _decode_records, _encode_records
+
+
+def create_tree(root):
+    total_size = 0
+    for i in range(20):
+        directory = os.path.join(root, "x64", f"pack{i // 5}", f"dlc{i}")
+        os.makedirs(directory)
+        for j in range(3):
+            with open(os.path.join(directory, f"asset{j}.rpf"), "wb") as f:
+                f.truncate(1000 * i + j)
+            total_size += 1000 * i + j
+    return total_size
+
+
+def test_saved_index_is_reused_after_loading(tmp_path):
+    total_size = create_tree(str(tmp_path))
+    index = DirectorySizeIndex(max_age=3600)
+    assert index.get_size(str(tmp_path), 4) == total_size
+    loaded_index = DirectorySizeIndex(max_age=3600)
+    loaded_index.set_state(index.get_state())
+    assert loaded_index._trees == index._trees
+    # A file added to one directory is found without the rest of the tree changing.
+    with open(os.path.join(str(tmp_path), "x64", "pack0", "dlc0", "new.rpf"), "wb") as f:
+        f.truncate(500)
+    assert loaded_index.get_size(str(tmp_path), 4) == total_size + 500
+
+
+def test_unreadable_subdirectories_are_kept_in_the_tree(tmp_path):
+    create_tree(str(tmp_path))
+    index = DirectorySizeIndex(max_age=3600)
+    index.get_size(str(tmp_path), 4)
+    _, records = index._trees[os.path.normcase(os.path.abspath(str(tmp_path)))]
+    # A directory which could not be read has no record, and neither do the directories inside of it.
+    unreadable_path = os.path.join("x64", "pack1")
+    for relative_path in list(records):
+        if relative_path == unreadable_path or relative_path.startswith(unreadable_path + os.sep):
+            del records[relative_path]
+    decoded_records = _decode_records(_encode_records(records))
+    assert decoded_records == records
+    assert "pack1" in decoded_records["x64"].subdirectories
+
+
+def test_outdated_state_is_ignored():
+    index = DirectorySizeIndex(max_age=3600)
+    index.set_state("80049512000000000000004b01")
+    assert index._trees == {}
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+
+from galaxy.api.types import UserInfo
+
+from plugin import RockstarPlugin
+
+
+def make_friend(user_id, user_name):
+    return UserInfo(user_id=user_id, user_name=user_name, avatar_url=None, profile_url=None)
+
+
+def make_plugin():
+    plugin = RockstarPlugin(MagicMock(), MagicMock(), None)
+    plugin.add_friend = MagicMock()
+    plugin.remove_friend = MagicMock()
+    plugin.update_friend_info = MagicMock()
+    return plugin
+
+
+def test_first_friend_of_a_user_without_friends_is_sent():
+    plugin = make_plugin()
+    plugin._update_friends_cache([], True)
+    friend = make_friend("1", "First")
+    plugin._update_friends_cache([friend], True)
+    plugin.add_friend.assert_called_once_with(friend)
+
+
+def test_changes_after_the_first_import_are_sent():
+    plugin = make_plugin()
+    plugin._update_friends_cache([make_friend("1", "Old"), make_friend("2", "Gone")], True)
+    plugin.add_friend.assert_not_called()
+    renamed = make_friend("1", "New")
+    plugin._update_friends_cache([renamed], True)
+    plugin.update_friend_info.assert_called_once_with(renamed)
+    plugin.remove_friend.assert_called_once_with("2")
+    plugin.add_friend.assert_not_called()
@@ -0,0 +1,43 @@
+import pickle
+from unittest.mock import MagicMock
+
+import plugin as plugin_module
+from game_time_journal import GameTimeJournal, dumps_snapshot
+from plugin import RockstarPlugin
+
+JOURNAL_GAME_TIME = {"gtav": {"time_played": 10.0, "last_played": 600.0}}
+
+
+def create_plugin(monkeypatch, tmp_path):
+    # The game time journal is only used on Windows, so once the plugin has been created, it is made to believe that it
+    # is running there, with a journal in a temporary folder.
+    plugin = RockstarPlugin(MagicMock(), MagicMock(), None)
+    monkeypatch.setattr(plugin_module, "IS_WINDOWS", True)
+    plugin._game_time_journal = GameTimeJournal(str(tmp_path / "snapshot.txt"), str(tmp_path / "journal.txt"), 100)
+    return plugin
+
+
+def test_unreadable_cached_snapshot_falls_back_to_the_journal(monkeypatch, tmp_path):
+    with open(tmp_path / "journal.txt", "w") as f:
+        f.write("1\tgtav\t0.000\t600.000\n")
+    plugin = create_plugin(monkeypatch, tmp_path)
+    # A snapshot from a newer version of the plugin cannot be read by this one.
+    plugin.persistent_cache["game_time_cache"] = pickle.dumps((99, 5, {"rdr2": {}})).hex()
+    plugin.handshake_complete()
+    assert plugin.game_time_cache == JOURNAL_GAME_TIME
+
+
+def test_unreadable_journal_falls_back_to_the_snapshot(monkeypatch, tmp_path):
+    # The journal cannot be opened as a file.
+    (tmp_path / "journal.txt").mkdir()
+    plugin = create_plugin(monkeypatch, tmp_path)
+    plugin.persistent_cache["game_time_cache"] = dumps_snapshot(1, JOURNAL_GAME_TIME)
+    plugin.handshake_complete()
+    assert plugin.game_time_cache == JOURNAL_GAME_TIME
+
+
+def test_readable_cached_snapshot_is_used():
+    plugin = RockstarPlugin(MagicMock(), MagicMock(), None)
+    plugin.persistent_cache["game_time_cache"] = dumps_snapshot(1, JOURNAL_GAME_TIME)
+    plugin.handshake_complete()
+    assert plugin.game_time_cache == JOURNAL_GAME_TIME
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from plugin import gather_limited
+
+
+def test_results_and_exceptions_are_returned_per_key():
+    running = []
+    most_running = []
+
+    async def get_result(key):
+        running.append(key)
+        most_running.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(key)
+        if key == 3:
+            raise ValueError(key)
+        return key * 10
+
+    results = asyncio.run(gather_limited([1, 2, 3, 4], get_result, 2))
+    assert [results[1], results[2], results[4]] == [10, 20, 40]
+    assert isinstance(results[3], ValueError)
+    assert max(most_running) == 2
+
+
+def test_cancelled_request_is_passed_on():
+    async def get_result(key):
+        if key == 2:
+            raise asyncio.CancelledError()
+        return key
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(gather_limited([1, 2], get_result, 2))
@@ -0,0 +1,41 @@
+from install_registry import DictUninstallRegistry, InstallLocationCache
+
+
+class CountingRegistry(DictUninstallRegistry):
+    def __init__(self, subkeys):
+        super().__init__(subkeys)
+        self.reads = 0
+
+    def get_install_locations(self, subkey_names):
+        self.reads += 1
+        return super().get_install_locations(subkey_names)
+
+
+def create_cache(ttl=3600):
+    registry = CountingRegistry({
+        "{GTA5-GUID}": {"InstallLocation": "C:\\Games\\GTAV"},
+        "{RDR2-GUID}": {"DisplayName": "Red Dead Redemption 2"},
+        "Other Program": {"InstallLocation": "C:\\Other"}
+    })
+    cache = InstallLocationCache(registry, {"gta5": "{gta5-guid}", "rdr2": "{RDR2-GUID}", "lanoire": "{LAN-GUID}"},
+                                 ttl)
+    return registry, cache
+
+
+def test_install_locations_are_read_once_until_the_registry_changes():
+    registry, cache = create_cache()
+    # Subkey names are compared case-insensitively, and a subkey without an InstallLocation is not installed.
+    assert [cache.get(title_id) for title_id in ("gta5", "rdr2", "lanoire")] == ["C:\\Games\\GTAV", None, None]
+    assert registry.reads == 1
+    registry.subkeys["{LAN-GUID}"] = {"InstallLocation": "D:\\L.A. Noire"}
+    registry.changed = True
+    assert cache.get("lanoire") == "D:\\L.A. Noire"
+    assert cache.get("gta5") == "C:\\Games\\GTAV"
+    assert registry.reads == 2
+
+
+def test_install_locations_are_read_again_after_the_ttl():
+    registry, cache = create_cache(ttl=0)
+    cache.get("gta5")
+    cache.get("gta5")
+    assert registry.reads == 2
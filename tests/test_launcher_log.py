@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from launcher_log import LauncherLogTailer, parse_log_buffer
+from plugin import RockstarPlugin
+
+
+def log_line(message):
+    return b"[2020-01-01 00:00:00.000] [DISPLAY] [    1] [Launcher]".ljust(65) + message + b"\n"
+
+
+def test_branch_reports_decide_ownership():
+    lines = [
+        log_line(b"Checking for updates to the branch manifest..."),
+        log_line(b"launcher: on branch prod"),
+        log_line(b"gta5: on branch prod"),
+        log_line(b"rdr2: no branches!"),
+        log_line(b"Title list changed; 2 titles have pending branch updates."),
+        b"short line on branch prod\n",
+        log_line(b"lanoire: on branch prod_steam"),
+        log_line(b"gta5: no branches!"),
+    ]
+    buffer = b"".join(lines)
+    reports = {}
+    assert parse_log_buffer(buffer, 0, len(buffer), reports)
+    # The launcher's report on itself is not a game, and a later report for a title replaces an earlier one.
+    assert {title_id: is_owned for title_id, (is_owned, _) in reports.items()} == {
+        "gta5": False,
+        "rdr2": False,
+        "lanoire": True
+    }
+    assert reports["gta5"][1] == buffer.index(lines[-1])
+
+
+def test_tailer_only_changes_when_a_report_changes(tmp_path):
+    path = str(tmp_path / "launcher.log")
+    with open(path, "wb") as f:
+        f.write(log_line(b"gta5: on branch prod"))
+    tailer = LauncherLogTailer()
+    tailer.get_reports(path)
+    assert tailer.changed
+    tailer.get_state()
+    with open(path, "ab") as f:
+        f.write(log_line(b"Signed in as user ***.") + log_line(b"gta5: on branch prod"))
+    _, reports = tailer.get_reports(path)
+    assert not tailer.changed
+    assert reports["gta5"][0] is True
+    with open(path, "ab") as f:
+        f.write(log_line(b"gta5: no branches!"))
+    _, reports = tailer.get_reports(path)
+    assert tailer.changed
+    assert reports["gta5"][0] is False
+
+
+def test_unreadable_log_state_is_ignored():
+    plugin = RockstarPlugin(MagicMock(), MagicMock(), None)
+    plugin.persistent_cache["launcher_log_state"] = "not a pickle"
+    plugin.handshake_complete()
+    assert plugin._log_tailer._states == {}
@@ -0,0 +1,51 @@
+import asyncio
+from time import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from http_client import BackendClient, Token
+from rate_limiter import RateLimiterRegistry
+from retry_policy import RetryPolicy
+
+SOCIAL_CLUB_ORIGIN = "https://socialclub.rockstargames.com"
+
+
+async def request_stats(status):
+    async def handle(request):
+        return web.Response(status=status, text="<html></html>")
+
+    app = web.Application()
+    app.router.add_get("/games/gtav/career/overviewAjax", handle)
+    async with TestServer(app) as server:
+        client = BackendClient(store_credentials=lambda credentials: None)
+        client.create_session(None)
+        client._rate_limiters = RateLimiterRegistry({}, (1000, 1000, 1000, 0))
+        client._retry_policy = RetryPolicy(1, 0, 0)
+        # The stats are requested from the Social Club's own URL, so the requests are sent to the local server instead.
+        send_request = client._send_request
+
+        async def send_request_locally(method, url, **kwargs):
+            return await send_request(method, str(server.make_url(URL(url).path_qs)), **kwargs)
+
+        client._send_request = send_request_locally
+        token = Token()
+        token.set_token("cached-token", time() + 3600)
+        client._rv_token_provider._tokens[SOCIAL_CLUB_ORIGIN] = token
+        try:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.get_gta_online_stats("1", "friend")
+            return SOCIAL_CLUB_ORIGIN in client._rv_token_provider._tokens
+        finally:
+            await client.close()
+
+
+def test_rejected_request_invalidates_the_token():
+    assert asyncio.run(request_stats(400)) is False
+
+
+def test_unavailable_server_keeps_the_token():
+    assert asyncio.run(request_stats(503)) is True
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from http_client import BackendClient
+from rate_limiter import RateLimiterRegistry
+
+POLLS = 10
+FRIENDS_PAGE = {
+    "status": True,
+    "rockstarAccountList": {
+        "totalFriends": 30,
+        "rockstarAccounts": [{"rockstarId": i, "displayName": f"friend{i}"} for i in range(30)]
+    }
+}
+
+
+class SocialClubStandIn:
+    # Serves a single unchanging JSON body with validators, like the Social Club API does for endpoints such as
+    # friends/getFriendsFiltered, and keeps track of what it sent.
+    def __init__(self, etag='"v1"', last_modified=None):
+        self.body = json.dumps(FRIENDS_PAGE).encode("utf-8")
+        self.etag = etag
+        self.last_modified = last_modified
+        self.statuses = []
+        self.bytes_sent = 0
+
+    async def handle(self, request):
+        validators = {}
+        if self.etag:
+            validators["ETag"] = self.etag
+        if self.last_modified:
+            validators["Last-Modified"] = self.last_modified
+        if ((self.etag and request.headers.get("If-None-Match") == self.etag) or
+                (self.last_modified and request.headers.get("If-Modified-Since") == self.last_modified)):
+            self.statuses.append(304)
+            return web.Response(status=304, headers=validators)
+        self.statuses.append(200)
+        self.bytes_sent += len(self.body)
+        return web.Response(body=self.body, content_type="application/json", headers=validators)
+
+
+async def poll(stand_in, polls):
+    app = web.Application()
+    app.router.add_get("/friends/getFriendsFiltered", stand_in.handle)
+    async with TestServer(app) as server:
+        client = BackendClient(store_credentials=lambda credentials: None)
+        client.create_session(None)
+        # The stand-in server does not need to be protected from request bursts.
+        client._rate_limiters = RateLimiterRegistry({}, (1000, 1000, 1000, 0))
+        try:
+            url = str(server.make_url("/friends/getFriendsFiltered"))
+            return [await client.get_json_from_request_strict(url) for _ in range(polls)]
+        finally:
+            await client.close()
+
+
+def test_unchanged_responses_are_revalidated_with_etag():
+    stand_in = SocialClubStandIn()
+    results = asyncio.run(poll(stand_in, POLLS))
+    assert results == [FRIENDS_PAGE] * POLLS
+    assert stand_in.statuses == [200] + [304] * (POLLS - 1)
+    assert stand_in.bytes_sent == len(stand_in.body)
+    assert stand_in.bytes_sent < len(stand_in.body) * POLLS
+
+
+def test_unchanged_responses_are_revalidated_with_last_modified():
+    stand_in = SocialClubStandIn(etag=None, last_modified="Wed, 01 Jan 2020 00:00:00 GMT")
+    results = asyncio.run(poll(stand_in, POLLS))
+    assert results == [FRIENDS_PAGE] * POLLS
+    assert stand_in.statuses == [200] + [304] * (POLLS - 1)
+
+
+def test_responses_without_validators_are_not_cached():
+    stand_in = SocialClubStandIn(etag=None)
+    results = asyncio.run(poll(stand_in, 3))
+    assert results == [FRIENDS_PAGE] * 3
+    assert stand_in.statuses == [200] * 3
@@ -0,0 +1,64 @@
+import aiohttp
+import asyncio
+
+import pytest
+
+from galaxy.api.errors import NetworkError
+
+from http_client import BackendClient
+from retry_policy import CircuitBreaker, CircuitBreakerRegistry
+
+URL = "https://scapi.rockstargames.com/profile/getprofile"
+
+
+def create_client(reset_timeout):
+    client = BackendClient(store_credentials=lambda credentials: None)
+    client._circuit_breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=reset_timeout)
+    client._circuit_breakers.get_breaker(URL).record_failure()
+    return client
+
+
+def test_open_circuit_fails_immediately():
+    async def send_request():
+        pytest.fail("The request should not have been sent.")
+
+    client = create_client(reset_timeout=60)
+    with pytest.raises(NetworkError):
+        asyncio.run(client._request_with_retry(URL, send_request))
+
+
+def test_cancelled_probe_lets_the_next_request_probe():
+    async def run():
+        client = create_client(reset_timeout=0)
+        probe_started = asyncio.Event()
+
+        async def hang():
+            probe_started.set()
+            await asyncio.sleep(60)
+
+        async def succeed():
+            return "ok"
+
+        probe = asyncio.create_task(client._request_with_retry(URL, hang))
+        await probe_started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        result = await client._request_with_retry(URL, succeed)
+        return result, client._circuit_breakers.get_breaker(URL).state
+
+    assert asyncio.run(run()) == ("ok", CircuitBreaker.CLOSED)
+
+
+def test_rate_limited_request_is_not_retried_again():
+    attempts = []
+
+    async def rate_limited():
+        attempts.append(1)
+        raise aiohttp.ClientResponseError(None, (), status=429)
+
+    client = BackendClient(store_credentials=lambda credentials: None)
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(client._request_with_retry(URL, rate_limited))
+    assert len(attempts) == 1
+    assert client._circuit_breakers.get_breaker(URL).state == CircuitBreaker.CLOSED
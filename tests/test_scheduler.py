@@ -0,0 +1,35 @@
+import asyncio
+
+from scheduler import JobScheduler, ScheduledJob
+
+
+def test_local_jobs_run_while_network_jobs_fill_every_slot():
+    async def run():
+        network_release = asyncio.Event()
+        local_runs = []
+
+        async def network_job():
+            await network_release.wait()
+            return False
+
+        async def local_job():
+            local_runs.append(1)
+            return False
+
+        scheduler = JobScheduler(lambda: False, 2)
+        for i in range(3):
+            scheduler.add_job(ScheduledJob(f"network{i}", network_job, 60, priority=1))
+        scheduler.add_job(ScheduledJob("local", local_job, 0, local=True))
+        for _ in range(3):
+            scheduler.tick()
+            await asyncio.sleep(0)
+        stats = scheduler.get_stats()
+        network_release.set()
+        await asyncio.sleep(0)
+        scheduler.cancel()
+        return local_runs, stats
+
+    local_runs, stats = asyncio.run(run())
+    assert len(local_runs) == 3
+    # Only two of the network jobs were started, and the third still waits for a free slot.
+    assert sorted(stats[f"network{i}"]["runs"] for i in range(3)) == [0, 1, 1]